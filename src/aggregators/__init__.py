@@ -6,6 +6,7 @@ sources and combine with billing calculations.
 
 from src.aggregators.timesheet_aggregator import (
     AggregatedTimesheetData,
+    EntryColumns,
     FileReadError,
     TimesheetAggregator,
 )
@@ -17,6 +18,7 @@ from src.aggregators.weekly_hours_calculator import (
 
 __all__ = [
     "AggregatedTimesheetData",
+    "EntryColumns",
     "FileReadError",
     "TimesheetAggregator",
     "AggregatedTripData",
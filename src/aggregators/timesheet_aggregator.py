@@ -5,12 +5,19 @@ freelancers, merge with project terms, calculate trips and billing, and support
 flexible filtering.
 """
 
+import calendar
 import datetime as dt
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 from src.calculators.billing_calculator import BillingResult, calculate_billing_batch
+from src.calculators.time_utils import calculate_duration_minutes
 from src.calculators.trip_calculator import calculate_trips
 from src.models.timesheet import TimesheetEntry
 from src.models.trip import Trip
@@ -21,6 +28,9 @@ from src.services.google_drive_service import GoogleDriveService
 
 logger = logging.getLogger(__name__)
 
+# Year and month embedded in a file name, e.g. "John_Doe_Timesheet_2024_07"
+_FILE_PERIOD_PATTERN = re.compile(r"(?<!\d)(\d{4})[_-](0[1-9]|1[0-2])(?!\d)")
+
 
 @dataclass
 class FileReadError:
@@ -41,6 +51,87 @@ class FileReadError:
     retry_count: int = 0
 
 
+@dataclass(frozen=True, eq=False)
+class EntryColumns:
+    """Column-wise NumPy view of the timesheet entry fields used for filtering.
+
+    Holding dates, project codes and freelancer names as parallel arrays lets
+    filters combine boolean masks in one vectorized pass instead of reading
+    attributes off every entry object. Project codes and freelancer names are
+    categorical, so equality filters compare small integer codes rather than
+    strings.
+
+    Attributes:
+        dates: Entry dates as ``datetime64[D]``
+        project_codes: Project codes (categorical)
+        freelancer_names: Freelancer names (categorical)
+    """
+
+    dates: np.ndarray
+    project_codes: pd.Categorical
+    freelancer_names: pd.Categorical
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[TimesheetEntry]) -> "EntryColumns":
+        """Build the column arrays from timesheet entries.
+
+        Args:
+            entries: Timesheet entries, in order
+
+        Returns:
+            EntryColumns with one element per entry
+        """
+        return cls(
+            dates=np.array([e.date for e in entries], dtype="datetime64[D]"),
+            project_codes=pd.Categorical([e.project_code for e in entries]),
+            freelancer_names=pd.Categorical([e.freelancer_name for e in entries]),
+        )
+
+    def mask(
+        self,
+        start_date: Optional[dt.date] = None,
+        end_date: Optional[dt.date] = None,
+        project_code: Optional[str] = None,
+        freelancer_name: Optional[str] = None,
+    ) -> np.ndarray:
+        """Return a boolean mask of the entries matching every given filter.
+
+        Args:
+            start_date: Keep entries on or after this date
+            end_date: Keep entries on or before this date
+            project_code: Keep entries for this project
+            freelancer_name: Keep entries for this freelancer
+
+        Returns:
+            Boolean array with one element per entry
+        """
+        mask = np.ones(len(self.dates), dtype=bool)
+        if start_date is not None:
+            mask &= self.dates >= np.datetime64(start_date, "D")
+        if end_date is not None:
+            mask &= self.dates <= np.datetime64(end_date, "D")
+        if project_code is not None:
+            mask &= np.asarray(self.project_codes == project_code)
+        if freelancer_name is not None:
+            mask &= np.asarray(self.freelancer_names == freelancer_name)
+        return mask
+
+    def take(self, indices: np.ndarray) -> "EntryColumns":
+        """Return the columns of the entries at ``indices``.
+
+        Args:
+            indices: Positions of the entries to keep
+
+        Returns:
+            EntryColumns for the selected entries
+        """
+        return EntryColumns(
+            dates=self.dates[indices],
+            project_codes=self.project_codes.take(indices),
+            freelancer_names=self.freelancer_names.take(indices),
+        )
+
+
 @dataclass
 class AggregatedTimesheetData:
     """Container for aggregated timesheet data.
@@ -78,6 +169,115 @@ class AggregatedTimesheetData:
     errors: List[FileReadError] = field(default_factory=list)
     files_processed: int = 0
     files_failed: int = 0
+    _columns: Optional[EntryColumns] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _date_index: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def entry_columns(self) -> EntryColumns:
+        """Column arrays for ``entries``, built on first access and reused.
+
+        Entries are treated as read-only once aggregated; the arrays are not
+        rebuilt if the list is modified in place.
+        """
+        if self._columns is None:
+            self._columns = EntryColumns.from_entries(self.entries)
+        return self._columns
+
+    def date_range_indices(self, start_date: dt.date, end_date: dt.date) -> np.ndarray:
+        """Return the positions of the entries dated within a range, in order.
+
+        Entry dates are sorted once and cached alongside their positions, so
+        each lookup is two binary searches plus a sort of the matching
+        positions rather than a comparison against every entry.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            Ascending positions of the matching entries
+        """
+        if self._date_index is None:
+            dates = self.entry_columns.dates
+            order = np.argsort(dates, kind="stable")
+            self._date_index = (dates[order], order)
+        sorted_dates, order = self._date_index
+        lo = np.searchsorted(sorted_dates, np.datetime64(start_date, "D"), "left")
+        hi = np.searchsorted(sorted_dates, np.datetime64(end_date, "D"), "right")
+        return np.sort(order[lo:hi])
+
+    def select(
+        self, indices: np.ndarray, trips: List[Trip]
+    ) -> "AggregatedTimesheetData":
+        """Return a new dataset with the entries at ``indices`` and ``trips``.
+
+        Billing results are taken at the same positions as their entries.
+
+        Args:
+            indices: Positions of the entries to keep, in order
+            trips: Trips belonging to the selection
+
+        Returns:
+            New AggregatedTimesheetData sharing the selected objects
+        """
+        positions = indices.tolist()
+        selected = AggregatedTimesheetData(
+            entries=[self.entries[i] for i in positions],
+            billing_results=[self.billing_results[i] for i in positions],
+            trips=trips,
+        )
+        selected._columns = self.entry_columns.take(indices)
+        return selected
+
+    def summary(self) -> pd.DataFrame:
+        """Total work, break and travel minutes per freelancer and project.
+
+        The minute columns are gathered into integer arrays once and summed in
+        a single grouped reduction over the cached categorical columns.
+
+        Returns:
+            DataFrame with one row per (freelancer_name, project_code) pair
+            present in the data and integer columns ``work_minutes``,
+            ``break_minutes`` and ``travel_minutes``
+
+        Example:
+            >>> data.summary()
+              freelancer_name project_code  work_minutes  break_minutes  ...
+            0        John Doe     PROJ-001           960             60  ...
+        """
+        count = len(self.entries)
+        columns = self.entry_columns
+        frame = pd.DataFrame(
+            {
+                "freelancer_name": columns.freelancer_names,
+                "project_code": columns.project_codes,
+                "work_minutes": np.fromiter(
+                    (
+                        calculate_duration_minutes(
+                            e.start_time, e.end_time, e.is_overnight
+                        )
+                        for e in self.entries
+                    ),
+                    dtype=np.int64,
+                    count=count,
+                ),
+                "break_minutes": np.fromiter(
+                    (e.break_minutes for e in self.entries), dtype=np.int64, count=count
+                ),
+                "travel_minutes": np.fromiter(
+                    (e.travel_time_minutes for e in self.entries),
+                    dtype=np.int64,
+                    count=count,
+                ),
+            }
+        )
+        return frame.groupby(
+            ["freelancer_name", "project_code"], observed=True, as_index=False
+        ).sum()
 
 
 class TimesheetAggregator:
@@ -95,6 +295,10 @@ class TimesheetAggregator:
     5. Calculates billing for each entry
     6. Supports filtering by date range, project, or freelancer
 
+    Timesheet files are read concurrently (up to MAX_READ_WORKERS at a time)
+    because each read waits on the Sheets API; results are still combined in
+    folder order.
+
     Attributes:
         timesheet_reader: Reader for individual timesheet files
         project_terms_reader: Reader for project billing terms
@@ -122,6 +326,9 @@ class TimesheetAggregator:
         150
     """
 
+    # Maximum number of timesheet files read at the same time
+    MAX_READ_WORKERS = 16
+
     def __init__(
         self,
         timesheet_reader: TimesheetReader,
@@ -150,7 +357,9 @@ class TimesheetAggregator:
         """Aggregate all timesheets from a Google Drive folder with optional filtering.
 
         This method:
-        1. Lists all timesheet files in the specified folder
+        1. Lists all timesheet files in the specified folder, skipping files
+           whose name places them outside the date range or, when
+           freelancer_name is given, names a different freelancer
         2. Reads and parses each timesheet
         3. Applies filters (defaults: current year + previous year for performance)
         4. Loads project billing terms
@@ -196,6 +405,9 @@ class TimesheetAggregator:
         """
         logger.info(f"Starting timesheet aggregation from folder: {folder_id}")
 
+        # Only a caller-supplied range may skip files by name (see below)
+        requested_start, requested_end = start_date, end_date
+
         # Apply default date filter: current year + previous year
         # This prevents pivot table performance issues with too much data
         today = dt.date.today()
@@ -228,6 +440,16 @@ class TimesheetAggregator:
             logger.info("No timesheet files found in folder")
             return AggregatedTimesheetData(entries=[], billing_results=[], trips=[])
 
+        # Skip files named for months outside an explicitly requested range;
+        # the default window is applied to entries only, never to file names
+        if requested_start is not None or requested_end is not None:
+            files = self._files_in_period(files, requested_start, requested_end)
+            if not files:
+                logger.info("No timesheet files cover the requested date range")
+                return AggregatedTimesheetData(entries=[], billing_results=[], trips=[])
+        if freelancer_name is not None:
+            files = self._files_for_freelancer(files, freelancer_name)
+
         # Step 2: Read all timesheets with error tracking
         all_entries: List[TimesheetEntry] = []
         errors: List[FileReadError] = []
@@ -235,13 +457,31 @@ class TimesheetAggregator:
         files_failed = 0
         error_classifier = ErrorClassifier()
 
-        for file_info in files:
+        # Reads are I/O-bound, so overlap them; results are consumed in folder
+        # order to keep entries (and therefore trips) deterministic
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_READ_WORKERS, len(files))
+        ) as executor:
+            pending = []
+            for file_info in files:
+                logger.debug(
+                    f"Reading timesheet: {file_info['name']} (ID: {file_info['id']})"
+                )
+                pending.append(
+                    (
+                        file_info,
+                        executor.submit(
+                            self.timesheet_reader.read_timesheet, file_info["id"]
+                        ),
+                    )
+                )
+
+        for file_info, future in pending:
             file_id = file_info["id"]
             file_name = file_info["name"]
 
             try:
-                logger.debug(f"Reading timesheet: {file_name} (ID: {file_id})")
-                entries = self.timesheet_reader.read_timesheet(file_id)
+                entries = future.result()
                 all_entries.extend(entries)
                 logger.info(f"Read {len(entries)} entries from {file_name}")
             except Exception as e:
@@ -295,37 +535,34 @@ class TimesheetAggregator:
             )
 
         # Step 3: Apply filters to entries (before calculating billing)
-        filtered_entries = all_entries
+        columns = EntryColumns.from_entries(all_entries)
 
         # Apply date range filters (start_date and end_date always set by defaults)
-        filtered_entries = [
-            e for e in filtered_entries if start_date <= e.date <= end_date
-        ]
+        mask = columns.mask(start_date=start_date, end_date=end_date)
         logger.info(
             f"Filtered by date range {start_date} to {end_date}: "
-            f"{len(filtered_entries)} entries remaining"
+            f"{np.count_nonzero(mask)} entries remaining"
         )
 
         # Apply project filter
         if project_code is not None:
-            filtered_entries = [
-                e for e in filtered_entries if e.project_code == project_code
-            ]
+            mask &= columns.mask(project_code=project_code)
             logger.info(
                 f"Filtered by project_code '{project_code}': "
-                f"{len(filtered_entries)} entries remaining"
+                f"{np.count_nonzero(mask)} entries remaining"
             )
 
         # Apply freelancer filter
         if freelancer_name is not None:
-            filtered_entries = [
-                e for e in filtered_entries if e.freelancer_name == freelancer_name
-            ]
+            mask &= columns.mask(freelancer_name=freelancer_name)
             logger.info(
                 f"Filtered by freelancer_name '{freelancer_name}': "
-                f"{len(filtered_entries)} entries remaining"
+                f"{np.count_nonzero(mask)} entries remaining"
             )
 
+        indices = np.flatnonzero(mask)
+        filtered_entries = [all_entries[i] for i in indices.tolist()]
+
         # Return empty data if filtering resulted in no entries
         if not filtered_entries:
             logger.info("No entries match the specified filters")
@@ -372,6 +609,7 @@ class TimesheetAggregator:
             files_processed=files_processed,
             files_failed=files_failed,
         )
+        result._columns = columns.take(indices)
 
         logger.info(
             f"Aggregation complete: {len(result.entries)} entries, "
@@ -382,6 +620,105 @@ class TimesheetAggregator:
 
         return result
 
+    @staticmethod
+    def _infer_file_period(name: str) -> Optional[Tuple[dt.date, dt.date]]:
+        """Infer the month a timesheet file covers from its name.
+
+        Args:
+            name: File name, e.g. ``John_Doe_Timesheet_2024_07``
+
+        Returns:
+            First and last day of the named month, or None if the name
+            carries no year and month
+        """
+        match = _FILE_PERIOD_PATTERN.search(name)
+        if match is None:
+            return None
+
+        year, month = int(match.group(1)), int(match.group(2))
+        last_day = calendar.monthrange(year, month)[1]
+        return dt.date(year, month, 1), dt.date(year, month, last_day)
+
+    @classmethod
+    def _files_in_period(
+        cls,
+        files: List[Dict[str, Any]],
+        start_date: Optional[dt.date],
+        end_date: Optional[dt.date],
+    ) -> List[Dict[str, Any]]:
+        """Drop files whose name places them entirely outside the date range.
+
+        Files without a year and month in their name are always kept.
+
+        Args:
+            files: File dictionaries from the Drive folder listing
+            start_date: Start of the requested range (inclusive), or None
+            end_date: End of the requested range (inclusive), or None
+
+        Returns:
+            Files that may contain entries within the range
+        """
+        selected = []
+        for file_info in files:
+            period = cls._infer_file_period(file_info["name"])
+            if period is not None and not (
+                (start_date is None or period[1] >= start_date)
+                and (end_date is None or period[0] <= end_date)
+            ):
+                logger.debug(
+                    f"Skipping {file_info['name']}: named for "
+                    f"{period[0]:%Y-%m}, outside {start_date} to {end_date}"
+                )
+                continue
+            selected.append(file_info)
+
+        if len(selected) < len(files):
+            logger.info(
+                f"Skipping {len(files) - len(selected)}/{len(files)} files "
+                f"named for months outside {start_date} to {end_date}"
+            )
+        return selected
+
+    @staticmethod
+    def _files_for_freelancer(
+        files: List[Dict[str, Any]], freelancer_name: str
+    ) -> List[Dict[str, Any]]:
+        """Narrow a folder listing to the files named after one freelancer.
+
+        Timesheet files are named like ``John_Doe_Timesheet``. The name must
+        appear as whole words, separated by spaces, underscores or hyphens,
+        so "Ann" does not match ``Anna_Smith_Timesheet``. The entry-level
+        freelancer filter still runs afterwards, so this only has to avoid
+        false negatives: if no file name matches, every file is kept.
+
+        Args:
+            files: File dictionaries from the Drive folder listing
+            freelancer_name: Freelancer name being filtered on
+
+        Returns:
+            Files whose name contains the freelancer name, or all files
+        """
+        name_pattern = re.compile(
+            r"(?<![^\W_])"
+            + r"[\s_-]+".join(re.escape(part) for part in freelancer_name.split())
+            + r"(?![^\W_])",
+            re.IGNORECASE,
+        )
+        matching = [f for f in files if name_pattern.search(f["name"])]
+
+        if not matching:
+            logger.warning(
+                f"No file name matches freelancer '{freelancer_name}'; "
+                f"falling back to reading all {len(files)} files"
+            )
+            return files
+
+        logger.info(
+            f"Reading {len(matching)}/{len(files)} files named after "
+            f"'{freelancer_name}'"
+        )
+        return matching
+
     def filter_by_date_range(
         self,
         data: AggregatedTimesheetData,
@@ -413,20 +750,7 @@ class TimesheetAggregator:
         """
         logger.info(f"Filtering data by date range: {start_date} to {end_date}")
 
-        # Filter entries by date range
-        filtered_entries = [
-            entry for entry in data.entries if start_date <= entry.date <= end_date
-        ]
-
-        # Get indices of filtered entries to match billing results
-        entry_indices = [
-            i
-            for i, entry in enumerate(data.entries)
-            if start_date <= entry.date <= end_date
-        ]
-
-        # Filter billing results to match entries
-        filtered_billing = [data.billing_results[i] for i in entry_indices]
+        indices = data.date_range_indices(start_date, end_date)
 
         # Filter trips that fall within date range
         filtered_trips = [
@@ -435,16 +759,9 @@ class TimesheetAggregator:
             if trip.start_date <= end_date and trip.end_date >= start_date
         ]
 
-        logger.info(
-            f"Filtered to {len(filtered_entries)} entries, "
-            f"{len(filtered_trips)} trips"
-        )
+        logger.info(f"Filtered to {len(indices)} entries, {len(filtered_trips)} trips")
 
-        return AggregatedTimesheetData(
-            entries=filtered_entries,
-            billing_results=filtered_billing,
-            trips=filtered_trips,
-        )
+        return data.select(indices, filtered_trips)
 
     def filter_by_project(
         self, data: AggregatedTimesheetData, project_code: str
@@ -468,36 +785,16 @@ class TimesheetAggregator:
         """
         logger.info(f"Filtering data by project: {project_code}")
 
-        # Filter entries by project
-        filtered_entries = [
-            entry for entry in data.entries if entry.project_code == project_code
-        ]
-
-        # Get indices of filtered entries to match billing results
-        entry_indices = [
-            i
-            for i, entry in enumerate(data.entries)
-            if entry.project_code == project_code
-        ]
-
-        # Filter billing results to match entries
-        filtered_billing = [data.billing_results[i] for i in entry_indices]
+        indices = np.flatnonzero(data.entry_columns.mask(project_code=project_code))
 
         # Filter trips by project
         filtered_trips = [
             trip for trip in data.trips if trip.project_code == project_code
         ]
 
-        logger.info(
-            f"Filtered to {len(filtered_entries)} entries, "
-            f"{len(filtered_trips)} trips"
-        )
+        logger.info(f"Filtered to {len(indices)} entries, {len(filtered_trips)} trips")
 
-        return AggregatedTimesheetData(
-            entries=filtered_entries,
-            billing_results=filtered_billing,
-            trips=filtered_trips,
-        )
+        return data.select(indices, filtered_trips)
 
     def filter_by_freelancer(
         self, data: AggregatedTimesheetData, freelancer_name: str
@@ -521,33 +818,15 @@ class TimesheetAggregator:
         """
         logger.info(f"Filtering data by freelancer: {freelancer_name}")
 
-        # Filter entries by freelancer
-        filtered_entries = [
-            entry for entry in data.entries if entry.freelancer_name == freelancer_name
-        ]
-
-        # Get indices of filtered entries to match billing results
-        entry_indices = [
-            i
-            for i, entry in enumerate(data.entries)
-            if entry.freelancer_name == freelancer_name
-        ]
-
-        # Filter billing results to match entries
-        filtered_billing = [data.billing_results[i] for i in entry_indices]
+        indices = np.flatnonzero(
+            data.entry_columns.mask(freelancer_name=freelancer_name)
+        )
 
         # Filter trips by freelancer
         filtered_trips = [
             trip for trip in data.trips if trip.freelancer_name == freelancer_name
         ]
 
-        logger.info(
-            f"Filtered to {len(filtered_entries)} entries, "
-            f"{len(filtered_trips)} trips"
-        )
+        logger.info(f"Filtered to {len(indices)} entries, {len(filtered_trips)} trips")
 
-        return AggregatedTimesheetData(
-            entries=filtered_entries,
-            billing_results=filtered_billing,
-            trips=filtered_trips,
-        )
+        return data.select(indices, filtered_trips)
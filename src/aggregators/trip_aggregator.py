@@ -5,10 +5,12 @@ based on duration tiers, filter by various criteria, and generate summary statis
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.models.trip import Trip, TripReimbursement
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,70 @@ class AggregatedTripData:
 
     trips: List[Trip]
     reimbursements: List[TripReimbursement]
+    _month_index: Optional[Dict[Tuple[int, int], List[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _freelancer_index: Optional[Dict[str, List[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _project_index: Optional[Dict[str, List[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def month_index(self) -> Dict[Tuple[int, int], List[int]]:
+        """Positions of the trips starting or ending in each (year, month).
+
+        Built on first access and reused; positions are in trip order and a
+        trip starting and ending in the same month is listed once. Trips are
+        treated as read-only once aggregated.
+        """
+        if self._month_index is None:
+            index: Dict[Tuple[int, int], List[int]] = {}
+            for i, trip in enumerate(self.trips):
+                start = (trip.start_date.year, trip.start_date.month)
+                end = (trip.end_date.year, trip.end_date.month)
+                index.setdefault(start, []).append(i)
+                if end != start:
+                    index.setdefault(end, []).append(i)
+            self._month_index = index
+        return self._month_index
+
+    @property
+    def freelancer_index(self) -> Dict[str, List[int]]:
+        """Positions of each freelancer's trips, built on first access."""
+        if self._freelancer_index is None:
+            index: Dict[str, List[int]] = {}
+            for i, trip in enumerate(self.trips):
+                index.setdefault(trip.freelancer_name, []).append(i)
+            self._freelancer_index = index
+        return self._freelancer_index
+
+    @property
+    def project_index(self) -> Dict[str, List[int]]:
+        """Positions of each project's trips, built on first access."""
+        if self._project_index is None:
+            index: Dict[str, List[int]] = {}
+            for i, trip in enumerate(self.trips):
+                index.setdefault(trip.project_code, []).append(i)
+            self._project_index = index
+        return self._project_index
+
+    def select(self, positions: List[int]) -> "AggregatedTripData":
+        """Return a new dataset with the trips at ``positions``.
+
+        Reimbursements are taken at the same positions as their trips.
+
+        Args:
+            positions: Positions of the trips to keep, in order
+
+        Returns:
+            New AggregatedTripData sharing the selected objects
+        """
+        return AggregatedTripData(
+            trips=[self.trips[i] for i in positions],
+            reimbursements=[self.reimbursements[i] for i in positions],
+        )
 
 
 class TripAggregator:
@@ -106,28 +172,38 @@ class TripAggregator:
         filtered_trips: List[Trip] = []
         reimbursements: List[TripReimbursement] = []
 
-        for trip in trips:
-            # Find matching term tier for this trip's duration
-            matching_term = self._find_matching_term(trip.duration_days, trip_terms)
-
-            if matching_term:
-                # Calculate reimbursement
-                amount = matching_term["amount_per_day"] * trip.duration_days
-
-                if amount > 0:
-                    # Create reimbursement object
-                    reimbursement = TripReimbursement(
-                        trip=trip,
-                        reimbursement_amount=amount,
-                        reimbursement_type=matching_term["reimbursement_type"],
-                    )
-
-                    filtered_trips.append(trip)
-                    reimbursements.append(reimbursement)
-                    logger.debug(
-                        f"Trip {trip.freelancer_name} {trip.location} "
-                        f"({trip.duration_days} days): {amount}"
-                    )
+        # Resolve each trip's tier with one gather from a per-duration table,
+        # then build reimbursements only for trips on a tier with a positive
+        # rate (days >= 1, so the amount is non-zero exactly when the rate is)
+        durations = np.fromiter(
+            (trip.duration_days for trip in trips), dtype=np.int64, count=len(trips)
+        )
+        tier_by_days = self._build_tier_table(trip_terms, int(durations.max()))
+        term_positions = tier_by_days[durations]
+        # Trailing False is what a position of -1 (no matching tier) reads
+        payable = np.array(
+            [term["amount_per_day"] > 0 for term in trip_terms] + [False], dtype=bool
+        )
+
+        for i in np.flatnonzero(payable[term_positions]).tolist():
+            trip = trips[i]
+            duration_days = int(durations[i])
+            matching_term = trip_terms[int(term_positions[i])]
+
+            # Calculate reimbursement
+            amount = matching_term["amount_per_day"] * duration_days
+            reimbursement = TripReimbursement(
+                trip=trip,
+                reimbursement_amount=amount,
+                reimbursement_type=matching_term["reimbursement_type"],
+            )
+
+            filtered_trips.append(trip)
+            reimbursements.append(reimbursement)
+            logger.debug(
+                f"Trip {trip.freelancer_name} {trip.location} "
+                f"({duration_days} days): {amount}"
+            )
 
         logger.info(
             f"Aggregated {len(filtered_trips)} trips with non-zero reimbursements"
@@ -158,25 +234,12 @@ class TripAggregator:
         """
         logger.info(f"Filtering trips by month: {year}-{month:02d}")
 
-        filtered_trips: List[Trip] = []
-        filtered_reimbursements: List[TripReimbursement] = []
+        # Trips that start or end in the target month
+        filtered = data.select(data.month_index.get((year, month), []))
 
-        for i, trip in enumerate(data.trips):
-            # Include if trip starts or ends in target month
-            if (
-                trip.start_date.year == year
-                and trip.start_date.month == month
-                or trip.end_date.year == year
-                and trip.end_date.month == month
-            ):
-                filtered_trips.append(trip)
-                filtered_reimbursements.append(data.reimbursements[i])
-
-        logger.info(f"Filtered to {len(filtered_trips)} trips")
+        logger.info(f"Filtered to {len(filtered.trips)} trips")
 
-        return AggregatedTripData(
-            trips=filtered_trips, reimbursements=filtered_reimbursements
-        )
+        return filtered
 
     def filter_by_freelancer(
         self, data: AggregatedTripData, freelancer_name: str
@@ -197,19 +260,11 @@ class TripAggregator:
         """
         logger.info(f"Filtering trips by freelancer: {freelancer_name}")
 
-        filtered_trips: List[Trip] = []
-        filtered_reimbursements: List[TripReimbursement] = []
-
-        for i, trip in enumerate(data.trips):
-            if trip.freelancer_name == freelancer_name:
-                filtered_trips.append(trip)
-                filtered_reimbursements.append(data.reimbursements[i])
+        filtered = data.select(data.freelancer_index.get(freelancer_name, []))
 
-        logger.info(f"Filtered to {len(filtered_trips)} trips")
+        logger.info(f"Filtered to {len(filtered.trips)} trips")
 
-        return AggregatedTripData(
-            trips=filtered_trips, reimbursements=filtered_reimbursements
-        )
+        return filtered
 
     def filter_by_project(
         self, data: AggregatedTripData, project_code: str
@@ -230,19 +285,11 @@ class TripAggregator:
         """
         logger.info(f"Filtering trips by project: {project_code}")
 
-        filtered_trips: List[Trip] = []
-        filtered_reimbursements: List[TripReimbursement] = []
-
-        for i, trip in enumerate(data.trips):
-            if trip.project_code == project_code:
-                filtered_trips.append(trip)
-                filtered_reimbursements.append(data.reimbursements[i])
+        filtered = data.select(data.project_index.get(project_code, []))
 
-        logger.info(f"Filtered to {len(filtered_trips)} trips")
+        logger.info(f"Filtered to {len(filtered.trips)} trips")
 
-        return AggregatedTripData(
-            trips=filtered_trips, reimbursements=filtered_reimbursements
-        )
+        return filtered
 
     def group_by_month(
         self, data: AggregatedTripData
@@ -339,6 +386,34 @@ class TripAggregator:
 
         return stats
 
+    @staticmethod
+    def _build_tier_table(
+        trip_terms: List[Dict[str, Any]], longest_days: int
+    ) -> np.ndarray:
+        """Map every trip duration from 0 to ``longest_days`` to its term tier.
+
+        Terms are applied in reverse so that, as with ``_find_matching_term``,
+        the first listed tier wins where tiers overlap. The table only spans
+        the durations actually present, however wide the tiers are.
+
+        Args:
+            trip_terms: List of trip term dictionaries
+            longest_days: Longest trip duration that will be looked up
+
+        Returns:
+            Integer array indexed by duration in days holding the position of
+            the matching term in ``trip_terms``, or -1 where no tier covers
+            that duration
+        """
+        table = np.full(longest_days + 1, -1, dtype=np.int64)
+        for position in range(len(trip_terms) - 1, -1, -1):
+            term = trip_terms[position]
+            low = max(term["min_days"], 0)
+            high = min(term["max_days"], longest_days)
+            if low <= high:
+                table[low : high + 1] = position
+        return table
+
     def _find_matching_term(
         self, duration_days: int, trip_terms: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
@@ -6,11 +6,11 @@ timesheet data, generate week-by-week matrices, and support flexible filtering.
 
 import datetime as dt
 import logging
-from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.aggregators.timesheet_aggregator import AggregatedTimesheetData
@@ -23,7 +23,8 @@ class WeeklyHoursData:
     """Container for weekly hours data.
 
     This dataclass holds weekly aggregated hours for a specific freelancer
-    and week.
+    and week. Records declare ``__slots__``, so a year of weekly data for
+    many freelancers carries no per-object ``__dict__``.
 
     Attributes:
         freelancer_name: Name of the freelancer
@@ -46,6 +47,15 @@ class WeeklyHoursData:
         24
     """
 
+    __slots__ = (
+        "freelancer_name",
+        "year",
+        "week_number",
+        "billable_hours",
+        "work_hours",
+        "entries_count",
+    )
+
     freelancer_name: str
     year: int
     week_number: int
@@ -54,6 +64,11 @@ class WeeklyHoursData:
     entries_count: int
 
 
+def _week_label(year: int, week_number: int) -> str:
+    """Format an ISO year and week as a "YYYY-W##" matrix column label."""
+    return f"{year}-W{week_number:02d}"
+
+
 class WeeklyHoursCalculator:
     """Calculates weekly hours and generates capacity reports.
 
@@ -103,33 +118,35 @@ class WeeklyHoursCalculator:
             logger.info("No entries to process, returning empty list")
             return []
 
-        # Group data by (freelancer, year, week)
-        weekly_groups: Dict[
-            Tuple[str, int, int], List[Tuple[int, Decimal, Decimal]]
-        ] = defaultdict(list)
-
-        for idx, entry in enumerate(data.entries):
-            # Get ISO calendar year and week number
-            iso_year, iso_week, _ = entry.date.isocalendar()
+        # Running totals per (freelancer, year, week): billable, work, count.
+        # Totals stay Decimal because billable hours include travel hours
+        # scaled by an arbitrary percentage and have no fixed precision.
+        weekly_totals: Dict[Tuple[str, int, int], List] = {}
 
-            # Get billing result for this entry
-            billing_result = data.billing_results[idx]
+        # ISO calendar year and week number for every entry in one pass over
+        # the cached date column
+        iso = pd.DatetimeIndex(data.entry_columns.dates).isocalendar()
+        iso_years = iso["year"].to_numpy(dtype="int64").tolist()
+        iso_weeks = iso["week"].to_numpy(dtype="int64").tolist()
 
-            # Group by (freelancer, year, week)
+        for entry, billing_result, iso_year, iso_week in zip(
+            data.entries, data.billing_results, iso_years, iso_weeks
+        ):
             key = (entry.freelancer_name, iso_year, iso_week)
-            weekly_groups[key].append(
-                (1, billing_result.billable_hours, billing_result.work_hours)
-            )
-
-        # Aggregate each group
-        result: List[WeeklyHoursData] = []
-
-        for (freelancer_name, year, week_number), entries in weekly_groups.items():
-            total_billable = sum((e[1] for e in entries), Decimal("0"))
-            total_work = sum((e[2] for e in entries), Decimal("0"))
-            count = sum(e[0] for e in entries)
-
-            weekly_data = WeeklyHoursData(
+            totals = weekly_totals.get(key)
+            if totals is None:
+                weekly_totals[key] = [
+                    billing_result.billable_hours,
+                    billing_result.work_hours,
+                    1,
+                ]
+            else:
+                totals[0] += billing_result.billable_hours
+                totals[1] += billing_result.work_hours
+                totals[2] += 1
+
+        result: List[WeeklyHoursData] = [
+            WeeklyHoursData(
                 freelancer_name=freelancer_name,
                 year=year,
                 week_number=week_number,
@@ -137,7 +154,12 @@ class WeeklyHoursCalculator:
                 work_hours=total_work,
                 entries_count=count,
             )
-            result.append(weekly_data)
+            for (freelancer_name, year, week_number), (
+                total_billable,
+                total_work,
+                count,
+            ) in weekly_totals.items()
+        ]
 
         logger.info(f"Calculated {len(result)} weekly hour records")
         return result
@@ -148,7 +170,9 @@ class WeeklyHoursCalculator:
         """Generate week-by-week matrix from weekly hours data.
 
         Creates a pandas DataFrame with freelancers as rows and weeks as
-        columns, showing billable hours for each cell.
+        columns, showing billable hours for each cell. Freelancers keep the
+        order in which they first appear, weeks are ordered by (year, week)
+        and weeks a freelancer did not work are left as NaN.
 
         Args:
             weekly_data: List of weekly hours data
@@ -167,20 +191,30 @@ class WeeklyHoursCalculator:
             logger.info("No weekly data, returning empty DataFrame")
             return pd.DataFrame()
 
-        # Create dictionary for DataFrame construction
-        # Structure: {freelancer: {week_label: hours}}
-        matrix_data: Dict[str, Dict[str, Decimal]] = defaultdict(dict)
-
-        for record in weekly_data:
-            # Create week label in format "YYYY-W##"
-            week_label = f"{record.year}-W{record.week_number:02d}"
-            matrix_data[record.freelancer_name][week_label] = record.billable_hours
-
-        # Convert to DataFrame
-        df = pd.DataFrame.from_dict(matrix_data, orient="index")
-
-        # Fill NaN with 0 or keep as NaN (depends on requirements)
-        # df = df.fillna(Decimal("0.0"))
+        weeks = sorted({(record.year, record.week_number) for record in weekly_data})
+        frame = pd.DataFrame(
+            {
+                "freelancer_name": [record.freelancer_name for record in weekly_data],
+                "week_label": [
+                    _week_label(record.year, record.week_number)
+                    for record in weekly_data
+                ],
+                "billable_hours": [record.billable_hours for record in weekly_data],
+            }
+        ).drop_duplicates(subset=["freelancer_name", "week_label"], keep="last")
+
+        # One row per freelancer in order of first appearance, one column per
+        # week in calendar order
+        df = (
+            frame.pivot(
+                index="freelancer_name", columns="week_label", values="billable_hours"
+            )
+            .reindex(
+                index=frame["freelancer_name"].unique(),
+                columns=[_week_label(year, week) for year, week in weeks],
+            )
+            .rename_axis(index=None, columns=None)
+        )
 
         logger.info(
             f"Generated matrix with {len(df)} freelancers and {len(df.columns)} weeks"
@@ -210,36 +244,16 @@ class WeeklyHoursCalculator:
         """
         logger.info(f"Filtering data by project: {project_code}")
 
-        # Filter entries by project
-        filtered_entries = [
-            entry for entry in data.entries if entry.project_code == project_code
-        ]
-
-        # Get indices of filtered entries to match billing results
-        entry_indices = [
-            i
-            for i, entry in enumerate(data.entries)
-            if entry.project_code == project_code
-        ]
-
-        # Filter billing results to match entries
-        filtered_billing = [data.billing_results[i] for i in entry_indices]
+        indices = np.flatnonzero(data.entry_columns.mask(project_code=project_code))
 
         # Filter trips by project
         filtered_trips = [
             trip for trip in data.trips if trip.project_code == project_code
         ]
 
-        logger.info(
-            f"Filtered to {len(filtered_entries)} entries, "
-            f"{len(filtered_trips)} trips"
-        )
+        logger.info(f"Filtered to {len(indices)} entries, {len(filtered_trips)} trips")
 
-        return AggregatedTimesheetData(
-            entries=filtered_entries,
-            billing_results=filtered_billing,
-            trips=filtered_trips,
-        )
+        return data.select(indices, filtered_trips)
 
     def filter_by_date_range(
         self,
@@ -272,20 +286,7 @@ class WeeklyHoursCalculator:
         """
         logger.info(f"Filtering data by date range: {start_date} to {end_date}")
 
-        # Filter entries by date range
-        filtered_entries = [
-            entry for entry in data.entries if start_date <= entry.date <= end_date
-        ]
-
-        # Get indices of filtered entries to match billing results
-        entry_indices = [
-            i
-            for i, entry in enumerate(data.entries)
-            if start_date <= entry.date <= end_date
-        ]
-
-        # Filter billing results to match entries
-        filtered_billing = [data.billing_results[i] for i in entry_indices]
+        indices = data.date_range_indices(start_date, end_date)
 
         # Filter trips that fall within date range
         filtered_trips = [
@@ -294,16 +295,9 @@ class WeeklyHoursCalculator:
             if trip.start_date <= end_date and trip.end_date >= start_date
         ]
 
-        logger.info(
-            f"Filtered to {len(filtered_entries)} entries, "
-            f"{len(filtered_trips)} trips"
-        )
+        logger.info(f"Filtered to {len(indices)} entries, {len(filtered_trips)} trips")
 
-        return AggregatedTimesheetData(
-            entries=filtered_entries,
-            billing_results=filtered_billing,
-            trips=filtered_trips,
-        )
+        return data.select(indices, filtered_trips)
 
     def get_week_range(
         self,
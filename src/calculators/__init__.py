@@ -17,6 +17,7 @@ from src.calculators.time_calculator import (
 from src.calculators.time_utils import (
     calculate_duration_minutes,
     convert_time_to_minutes,
+    minutes_to_decimal_hours,
     minutes_to_timedelta,
     timedelta_to_decimal_hours,
 )
@@ -38,6 +39,7 @@ __all__ = [
     # time_utils
     "calculate_duration_minutes",
     "convert_time_to_minutes",
+    "minutes_to_decimal_hours",
     "minutes_to_timedelta",
     "timedelta_to_decimal_hours",
     # trip_calculator
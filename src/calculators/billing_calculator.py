@@ -16,8 +16,8 @@ from decimal import Decimal
 from typing import Dict, List, Tuple
 
 from src.calculators.time_calculator import (
+    _travel_surcharge_for_amount,
     calculate_billable_hours,
-    calculate_travel_surcharge,
 )
 from src.models.project import ProjectTerms
 from src.models.timesheet import TimesheetEntry
@@ -149,11 +149,12 @@ def calculate_billing(entry: TimesheetEntry, terms: ProjectTerms) -> BillingResu
     # Calculate billable hours breakdown
     billable_hours_result = calculate_billable_hours(entry, terms)
 
-    # Calculate revenue breakdown
-    hours_billed = (billable_hours_result.total_hours * terms.hourly_rate).quantize(
-        Decimal("0.01")
-    )
-    travel_surcharge = calculate_travel_surcharge(entry, terms)
+    # Calculate revenue breakdown. The surcharge is derived from the same
+    # unrounded base amount calculate_travel_surcharge would compute, so
+    # the hours are only worked out once per entry.
+    base_amount = billable_hours_result.total_hours * terms.hourly_rate
+    hours_billed = base_amount.quantize(Decimal("0.01"))
+    travel_surcharge = _travel_surcharge_for_amount(entry, terms, base_amount)
     total_billed = (hours_billed + travel_surcharge).quantize(Decimal("0.01"))
 
     # Calculate cost breakdown
@@ -16,8 +16,8 @@ from decimal import Decimal
 
 from src.calculators.time_utils import (
     calculate_duration_minutes,
+    minutes_to_decimal_hours,
     minutes_to_timedelta,
-    timedelta_to_decimal_hours,
 )
 from src.models.project import ProjectTerms
 from src.models.timesheet import TimesheetEntry
@@ -110,16 +110,16 @@ def calculate_billable_hours(
         Decimal('8.00')
     """
     # Calculate work duration (end - start)
-    work_duration = calculate_work_duration(entry)
-    work_hours = timedelta_to_decimal_hours(work_duration)
+    work_minutes = calculate_duration_minutes(
+        entry.start_time, entry.end_time, entry.is_overnight
+    )
+    work_hours = minutes_to_decimal_hours(work_minutes)
 
     # Calculate break hours
-    break_duration = dt.timedelta(minutes=entry.break_minutes)
-    break_hours = timedelta_to_decimal_hours(break_duration)
+    break_hours = minutes_to_decimal_hours(entry.break_minutes)
 
     # Calculate billable travel hours (travel_time × percentage)
-    travel_duration = dt.timedelta(minutes=entry.travel_time_minutes)
-    travel_hours_total = timedelta_to_decimal_hours(travel_duration)
+    travel_hours_total = minutes_to_decimal_hours(entry.travel_time_minutes)
     travel_percentage = terms.travel_time_percentage / Decimal("100")
     travel_hours = travel_hours_total * travel_percentage
 
@@ -214,6 +214,28 @@ def calculate_travel_surcharge(entry: TimesheetEntry, terms: ProjectTerms) -> De
     billable_hours_result = calculate_billable_hours(entry, terms)
     base_amount = billable_hours_result.total_hours * terms.hourly_rate
 
+    return _travel_surcharge_for_amount(entry, terms, base_amount)
+
+
+def _travel_surcharge_for_amount(
+    entry: TimesheetEntry, terms: ProjectTerms, base_amount: Decimal
+) -> Decimal:
+    """Apply the travel surcharge rule to an unrounded base amount.
+
+    Shared by calculate_travel_surcharge and calculate_billing, which already
+    has the base amount and should not work out the hours a second time.
+
+    Args:
+        entry: Timesheet entry
+        terms: Project terms with surcharge percentage
+        base_amount: Unrounded billable hours × hourly rate
+
+    Returns:
+        Travel surcharge amount (0.00 for remote work)
+    """
+    if entry.location == "remote":
+        return Decimal("0.00")
+
     # Apply surcharge percentage
     surcharge_percentage = terms.travel_surcharge_percentage / Decimal("100")
     surcharge = base_amount * surcharge_percentage
@@ -4,6 +4,7 @@ This module provides low-level utilities for time calculations including:
 - Converting time to minutes
 - Calculating durations between times (with overnight support)
 - Converting between timedelta and decimal hours
+- Converting whole minutes to decimal hours with integer arithmetic
 
 These utilities are timezone-agnostic and work with dt.time and dt.timedelta.
 """
@@ -112,3 +113,34 @@ def timedelta_to_decimal_hours(td: dt.timedelta) -> Decimal:
     hours = Decimal(str(total_seconds)) / Decimal("3600")
     # Round to 2 decimal places
     return hours.quantize(Decimal("0.01"))
+
+
+def minutes_to_decimal_hours(minutes: int) -> Decimal:
+    """Convert whole minutes to decimal hours with 2 decimal precision.
+
+    Gives the same result as ``timedelta_to_decimal_hours`` for a
+    timedelta of ``minutes`` minutes, but rounds in integer hundredths of
+    an hour and builds a single Decimal at the end. This is the form used
+    on the per-entry billing path.
+
+    Args:
+        minutes: Number of minutes
+
+    Returns:
+        Decimal hours (rounded to 2 decimal places)
+
+    Example:
+        >>> minutes_to_decimal_hours(480)
+        Decimal('8.00')
+        >>> minutes_to_decimal_hours(10)
+        Decimal('0.17')
+
+    Note:
+        ``minutes / 60`` in hundredths is ``5 * minutes / 3``, whose
+        fractional part is 0, 1/3 or 2/3, so rounding to nearest never
+        hits a tie.
+    """
+    hundredths = (5 * abs(minutes) + 1) // 3
+    if minutes < 0:
+        hundredths = -hundredths
+    return Decimal(hundredths).scaleb(-2)
@@ -77,64 +77,42 @@ def calculate_trips(entries: List[TimesheetEntry]) -> List[Trip]:
         key=lambda e: (e.freelancer_name, e.project_code, e.location, e.date),
     )
 
-    # Group consecutive days into trips
+    # Group consecutive days into trips in a single pass. Only the first and
+    # last entry of the open trip are needed to emit it.
     trips: List[Trip] = []
-    current_group: List[TimesheetEntry] = []
-
-    for entry in sorted_entries:
-        if not current_group:
-            # Start first group
-            current_group.append(entry)
-        else:
-            # Check if this entry continues the current trip
-            last_entry = current_group[-1]
-
-            # Calculate date difference
-            date_diff = (entry.date - last_entry.date).days
-
-            # Check if entry belongs to same trip
-            # Same freelancer, project, location and consecutive (0-1 day)
-            is_same_trip = (
-                entry.freelancer_name == last_entry.freelancer_name
-                and entry.project_code == last_entry.project_code
-                and entry.location == last_entry.location
-                and date_diff <= 1
-            )
-
-            if is_same_trip:
-                # Continue trip (skip if same day to handle duplicates)
-                if date_diff > 0:
-                    current_group.append(entry)
-            else:
-                # Start new trip - first save the current trip
-                trips.append(_create_trip_from_group(current_group))
-                current_group = [entry]
-
-    # Don't forget the last group
-    if current_group:
-        trips.append(_create_trip_from_group(current_group))
+    first_entry = last_entry = sorted_entries[0]
+
+    for entry in sorted_entries[1:]:
+        # Same freelancer, project, location and consecutive (0-1 day)
+        is_same_trip = (
+            entry.freelancer_name == last_entry.freelancer_name
+            and entry.project_code == last_entry.project_code
+            and entry.location == last_entry.location
+            and (entry.date - last_entry.date).days <= 1
+        )
+
+        if not is_same_trip:
+            # Start new trip - first save the current trip
+            trips.append(_create_trip(first_entry, last_entry))
+            first_entry = entry
+        last_entry = entry
+
+    # Don't forget the last trip
+    trips.append(_create_trip(first_entry, last_entry))
 
     return trips
 
 
-def _create_trip_from_group(group: List[TimesheetEntry]) -> Trip:
-    """Create Trip from consecutive timesheet entries.
+def _create_trip(first_entry: TimesheetEntry, last_entry: TimesheetEntry) -> Trip:
+    """Create Trip spanning two entries of the same consecutive group.
 
     Args:
-        group: List of timesheet entries representing consecutive days
+        first_entry: Earliest entry of the group
+        last_entry: Latest entry of the group
 
     Returns:
-        Trip object with start_date, end_date calculated from the group
-
-    Raises:
-        ValueError: If group is empty
+        Trip object with start_date and end_date taken from the two entries
     """
-    if not group:
-        raise ValueError("Cannot create trip from empty group")
-
-    first_entry = group[0]
-    last_entry = group[-1]
-
     return Trip(
         freelancer_name=first_entry.freelancer_name,
         project_code=first_entry.project_code,
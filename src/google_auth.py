@@ -3,7 +3,8 @@ Google API authentication module for the billing system.
 """
 
 import os
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
 from google.oauth2 import service_account
@@ -44,21 +45,41 @@ def load_credentials() -> Dict[str, Any]:
     }
 
 
+DEFAULT_SCOPES = (
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+)
+
+
 def get_credentials(
-    scopes: Optional[list[str]] = None,
+    scopes: Optional[Sequence[str]] = None,
 ) -> service_account.Credentials:
-    """Get authenticated credentials for Google APIs."""
+    """
+    Get authenticated credentials for Google APIs.
+
+    Parsing the service account key is expensive, so the credentials are
+    built once per set of scopes and reused. Call clear_credentials_cache()
+    after changing the environment.
+    """
     if scopes is None:
-        scopes = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ]
+        scopes = DEFAULT_SCOPES
+
+    return _build_credentials(tuple(scopes))
+
+
+def clear_credentials_cache() -> None:
+    """Drop the credentials cached by get_credentials()."""
+    _build_credentials.cache_clear()
+
 
+@lru_cache(maxsize=None)
+def _build_credentials(scopes: Tuple[str, ...]) -> service_account.Credentials:
+    """Build service account credentials for a hashable tuple of scopes."""
     credentials_info = load_credentials()
     subject_email = os.getenv("GOOGLE_SUBJECT_EMAIL")
 
     credentials = service_account.Credentials.from_service_account_info(
-        credentials_info, scopes=scopes, subject=subject_email
+        credentials_info, scopes=list(scopes), subject=subject_email
     )
 
     return credentials
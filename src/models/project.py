@@ -4,6 +4,7 @@ This module defines the Project and ProjectTerms models which represent
 project information and freelancer-specific billing terms.
 """
 
+import sys
 from decimal import Decimal
 from typing import Union
 
@@ -104,14 +105,15 @@ class ProjectTerms(BaseDataModel):
             info: Field validation info
 
         Returns:
-            The validated value
+            The validated value, interned so that (freelancer, project)
+            lookup keys compare by identity
 
         Raises:
             ValueError: If the value is empty or whitespace only
         """
         if not v or not v.strip():
             raise ValueError(f"{info.field_name} cannot be empty or whitespace")
-        return v.strip()
+        return sys.intern(v.strip())
 
     @field_validator(
         "hourly_rate",
@@ -5,9 +5,10 @@ timesheet entry for a freelancer on a specific date and project.
 """
 
 import datetime as dt
+import sys
 from typing import Literal, Optional
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from src.models.base import BaseDataModel
 
@@ -43,8 +44,14 @@ class TimesheetEntry(BaseDataModel):
         ... )
         >>> entry.freelancer_name
         'John Doe'
+
+    Entries are immutable once validated, so they are hashable and can be
+    shared freely between aggregated datasets and their cached column views.
+    Use ``entry.model_copy(update={...})`` to derive a changed entry.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     freelancer_name: str = Field(..., min_length=1, description="Freelancer's name")
     date: dt.date = Field(..., description="Date of work")
     project_code: str = Field(..., min_length=1, description="Project identifier")
@@ -66,14 +73,15 @@ class TimesheetEntry(BaseDataModel):
             info: Field validation info
 
         Returns:
-            The validated value
+            The validated value, interned so that (freelancer, project)
+            lookup keys compare by identity
 
         Raises:
             ValueError: If the value is empty or whitespace only
         """
         if not v or not v.strip():
             raise ValueError(f"{info.field_name} cannot be empty or whitespace")
-        return v.strip()
+        return sys.intern(v.strip())
 
     @model_validator(mode="after")
     def validate_time_logic(self) -> "TimesheetEntry":
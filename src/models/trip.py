@@ -5,6 +5,7 @@ business trips and their associated reimbursements.
 """
 
 import datetime as dt
+import sys
 from decimal import Decimal
 from typing import Union
 
@@ -55,14 +56,15 @@ class Trip(BaseDataModel):
             info: Field validation info
 
         Returns:
-            The validated value
+            The validated value, interned so that filtering and indexing by
+            name, project or location compare by identity
 
         Raises:
             ValueError: If the value is empty or whitespace only
         """
         if not v or not v.strip():
             raise ValueError(f"{info.field_name} cannot be empty or whitespace")
-        return v.strip()
+        return sys.intern(v.strip())
 
     @model_validator(mode="after")
     def validate_dates(self) -> "Trip":
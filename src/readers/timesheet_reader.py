@@ -7,6 +7,7 @@ from Google Sheets, converting it into validated TimesheetEntry objects.
 import datetime as dt
 import logging
 import re
+import sys
 
 # Import TYPE_CHECKING to avoid circular imports
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
@@ -47,6 +48,7 @@ class TimesheetReader:
     Attributes:
         sheets_service: Google Sheets service for data access
         cache_service: Optional cache service for improved performance
+        fast_path: Build entries without pydantic validation
 
     Example:
         >>> from src.services.google_sheets_service import GoogleSheetsService
@@ -61,15 +63,22 @@ class TimesheetReader:
         self,
         sheets_service: GoogleSheetsService,
         cache_service: Optional["SheetsCacheService"] = None,
+        fast_path: bool = False,
     ):
         """Initialize the timesheet reader.
 
         Args:
             sheets_service: Google Sheets service instance for data access
             cache_service: Optional cache service for improved performance
+            fast_path: If True, build entries with ``model_construct`` and skip
+                pydantic validation. Row parsing still checks dates, times and
+                locations, but model rules (e.g. end after start, break shorter
+                than work time) are not enforced, so only use this for trusted
+                data such as benchmarks or previously validated sheets.
         """
         self.sheets_service = sheets_service
         self.cache_service = cache_service
+        self.fast_path = fast_path
 
     def read_timesheet(
         self,
@@ -98,7 +107,7 @@ class TimesheetReader:
         try:
             # Get spreadsheet metadata to extract freelancer name
             metadata = self.sheets_service.get_sheet_metadata(spreadsheet_id)
-            freelancer_name = self._extract_freelancer_name(metadata)
+            freelancer_name = sys.intern(self._extract_freelancer_name(metadata))
 
             logger.info(
                 f"Reading timesheet for {freelancer_name} "
@@ -189,7 +198,7 @@ class TimesheetReader:
         try:
             # Get and clean field values
             date_str = str(row.get("Date", "")).strip()
-            project_code = str(row.get("Project", "")).strip()
+            project_code = sys.intern(str(row.get("Project", "")).strip())
             location_str = str(row.get("Location", "")).strip()
             start_time_str = str(row.get("Start Time", "")).strip()
             end_time_str = str(row.get("End Time", "")).strip()
@@ -236,8 +245,11 @@ class TimesheetReader:
             # Handle notes
             notes = notes_str if notes_str and notes_str != "nan" else None
 
-            # Create and validate TimesheetEntry
-            entry = TimesheetEntry(
+            # Create TimesheetEntry (validated unless the fast path is enabled)
+            build_entry = (
+                TimesheetEntry.model_construct if self.fast_path else TimesheetEntry
+            )
+            entry = build_entry(
                 freelancer_name=freelancer_name,
                 date=parsed_date,
                 project_code=project_code,
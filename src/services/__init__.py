@@ -4,6 +4,7 @@ Google API services for the billing system.
 This package provides modern, resilient Google API services with:
 - Application Default Credentials (ADC) authentication
 - Exponential backoff with jitter for rate limiting
+- Token-bucket pacing to stay within API quotas
 - Circuit breaker pattern for failure handling
 - Comprehensive error handling and logging
 - Pandas DataFrame integration
@@ -12,16 +13,20 @@ This package provides modern, resilient Google API services with:
 from .error_classifier import ErrorClassifier, ErrorType
 from .google_drive_service import GoogleDriveService
 from .google_sheets_service import GoogleSheetsService
+from .rate_limiter import RateLimiter
 from .retry_handler import CircuitBreakerError, RetryExhaustedException, RetryHandler
 from .sheets_cache_service import SheetsCacheService
+from .thread_local_http import ThreadLocalHttp
 
 __all__ = [
     "RetryHandler",
     "RetryExhaustedException",
     "CircuitBreakerError",
+    "RateLimiter",
     "GoogleSheetsService",
     "GoogleDriveService",
     "SheetsCacheService",
+    "ThreadLocalHttp",
     "ErrorClassifier",
     "ErrorType",
 ]
@@ -21,6 +21,15 @@ class ErrorType(Enum):
     UNKNOWN = "unknown"  # Unknown error type
 
 
+# HTTP status -> classification: rate limiting (429) and server errors (5xx)
+# are retryable, all other client errors (4xx) are fatal
+_HTTP_STATUS_TYPES: Dict[int, ErrorType] = {
+    **{status: ErrorType.FATAL for status in range(400, 500)},
+    **{status: ErrorType.RETRYABLE for status in range(500, 600)},
+    429: ErrorType.RETRYABLE,
+}
+
+
 class ErrorClassifier:
     """
     Classifies errors to distinguish between retryable and fatal errors.
@@ -55,22 +64,10 @@ class ErrorClassifier:
 
         # HTTP errors from Google API
         if isinstance(exception, HttpError):
-            status_code = exception.resp.status
-
-            # Rate limiting - always retryable
-            if status_code == 429:
-                self._stats["retryable"] += 1
-                return ErrorType.RETRYABLE
-
-            # Server errors (5xx) - retryable
-            if 500 <= status_code < 600:
-                self._stats["retryable"] += 1
-                return ErrorType.RETRYABLE
-
-            # Client errors (4xx except 429) - fatal
-            if 400 <= status_code < 500:
-                self._stats["fatal"] += 1
-                return ErrorType.FATAL
+            error_type = _HTTP_STATUS_TYPES.get(exception.resp.status)
+            if error_type is not None:
+                self._stats[error_type.value] += 1
+                return error_type
 
         # Network-related errors - retryable
         if isinstance(
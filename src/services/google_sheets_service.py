@@ -6,12 +6,16 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import google.auth
+import google_auth_httplib2
+import httplib2
 import pandas as pd
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from src.services.rate_limiter import RateLimiter
 from src.services.retry_handler import RetryHandler
+from src.services.thread_local_http import ThreadLocalHttp
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +27,26 @@ class GoogleSheetsService:
     Features:
     - Service account credentials (from .env) or Application Default Credentials (ADC)
     - Automatic retry with exponential backoff
+    - Proactive token-bucket pacing within Sheets API per-user quotas
     - Batch operations for efficiency
+    - Thread-safe reads over per-thread keep-alive connections
     - Pandas DataFrame integration
     - Comprehensive error handling
     """
 
+    # Sheets API per-user quotas (requests per minute)
+    READ_REQUESTS_PER_MINUTE = 60
+    WRITE_REQUESTS_PER_MINUTE = 60
+
     def __init__(
         self,
         credentials: Optional[Dict[str, Any]] = None,
         retry_handler: Optional[RetryHandler] = None,
         scopes: Optional[List[str]] = None,
         subject_email: Optional[str] = None,
+        http: Optional[httplib2.Http] = None,
+        read_limiter: Optional[RateLimiter] = None,
+        write_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize Google Sheets service.
@@ -46,6 +59,15 @@ class GoogleSheetsService:
             scopes: Custom OAuth scopes for authentication
             subject_email: Email address to impersonate for domain-wide delegation.
                           Required if service account needs to access user's files.
+            http: Shared HTTP transport to reuse. Passing one httplib2.Http to
+                  several services keeps their keep-alive connections pooled
+                  instead of opening a new TLS connection per service. Reads
+                  run over per-thread copies with the same timeout, proxy
+                  and certificate settings.
+            read_limiter: Rate limiter for read requests. Defaults to the
+                          Sheets per-user read quota.
+            write_limiter: Rate limiter for write requests. Defaults to the
+                           Sheets per-user write quota.
         """
         self.credentials_info = credentials
         self.retry_handler = retry_handler or RetryHandler()
@@ -54,10 +76,22 @@ class GoogleSheetsService:
             "https://www.googleapis.com/auth/drive",
         ]
         self.subject_email = subject_email
+        self.http = http
+        self.read_limiter = read_limiter or RateLimiter(
+            rate=self.READ_REQUESTS_PER_MINUTE, period=60.0
+        )
+        self.write_limiter = write_limiter or RateLimiter(
+            rate=self.WRITE_REQUESTS_PER_MINUTE, period=60.0
+        )
 
         # Initialize Google Sheets API client
+        self._credentials = None
         self._service = self._create_service()
 
+        # Per-thread HTTP transports so reads can run concurrently;
+        # httplib2.Http is not thread-safe but keeps connections alive
+        self._thread_http = ThreadLocalHttp(self._credentials, self.http)
+
     def _create_service(self):
         """
         Create Google Sheets API service using service account or ADC.
@@ -96,7 +130,26 @@ class GoogleSheetsService:
                     f"Google Sheets service initialized with ADC for project: {project}"
                 )
 
-            service = build("sheets", "v4", credentials=credentials)
+            self._credentials = credentials
+
+            if self.http is not None:
+                # Reuse the caller's persistent connections for all requests
+                authed_http = google_auth_httplib2.AuthorizedHttp(
+                    credentials, http=self.http
+                )
+                return build(
+                    "sheets",
+                    "v4",
+                    http=authed_http,
+                    cache_discovery=False,
+                    static_discovery=True,
+                )
+
+            # Use the discovery document bundled with googleapiclient so that
+            # building a client never fetches it over HTTPS
+            service = build(
+                "sheets", "v4", credentials=credentials, static_discovery=True
+            )
             return service
 
         except Exception as e:
@@ -112,6 +165,8 @@ class GoogleSheetsService:
         """
         Read data from a Google Sheet and return as pandas DataFrame.
 
+        Safe to call from several threads at once, like all read methods.
+
         Args:
             spreadsheet_id: The ID of the spreadsheet
             range_name: The A1 notation range to read
@@ -125,6 +180,7 @@ class GoogleSheetsService:
         """
 
         def _read_operation():
+            self.read_limiter.acquire()
             return (
                 self._service.spreadsheets()
                 .values()
@@ -133,7 +189,7 @@ class GoogleSheetsService:
                     range=range_name,
                     valueRenderOption=value_render_option,
                 )
-                .execute()
+                .execute(http=self._thread_http.get())
             )
 
         try:
@@ -203,6 +259,7 @@ class GoogleSheetsService:
             values.append(row.astype(str).tolist())
 
         def _write_operation():
+            self.write_limiter.acquire()
             return (
                 self._service.spreadsheets()
                 .values()
@@ -252,7 +309,57 @@ class GoogleSheetsService:
             HttpError: If API request fails
         """
 
+        data = self.batch_read_sheet_data(spreadsheet_id, ranges, value_render_option)
+
+        dataframes = []
+        for range_name in ranges:
+            values = data.get(range_name, [])
+
+            if not values:
+                dataframes.append(pd.DataFrame())
+                continue
+
+            # Convert to DataFrame
+            if len(values) > 1:
+                headers = values[0]
+                rows = values[1:]
+
+                # Ensure consistent column count
+                max_cols = len(headers)
+                rows = [row + [""] * (max_cols - len(row)) for row in rows]
+
+                df = pd.DataFrame(rows, columns=headers)
+            else:
+                df = pd.DataFrame(values)
+
+            dataframes.append(df)
+
+        return dataframes
+
+    def batch_read_sheet_data(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str],
+        value_render_option: str = "UNFORMATTED_VALUE",
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Read raw values for multiple ranges in a single API call.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            ranges: List of A1 notation ranges to read
+            value_render_option: How values should be rendered
+
+        Returns:
+            Dictionary mapping each requested range to its rows of values
+            (empty list for ranges without data)
+
+        Raises:
+            HttpError: If API request fails
+        """
+
         def _batch_read_operation():
+            self.read_limiter.acquire()
             return (
                 self._service.spreadsheets()
                 .values()
@@ -261,38 +368,22 @@ class GoogleSheetsService:
                     ranges=ranges,
                     valueRenderOption=value_render_option,
                 )
-                .execute()
+                .execute(http=self._thread_http.get())
             )
 
         try:
             result = self.retry_handler.execute_with_retry(_batch_read_operation)
             value_ranges = result.get("valueRanges", [])
 
-            dataframes = []
-            for i, value_range in enumerate(value_ranges):
-                values = value_range.get("values", [])
-
-                if not values:
-                    dataframes.append(pd.DataFrame())
-                    continue
-
-                # Convert to DataFrame
-                if len(values) > 1:
-                    headers = values[0]
-                    data = values[1:]
-
-                    # Ensure consistent column count
-                    max_cols = len(headers)
-                    data = [row + [""] * (max_cols - len(row)) for row in data]
-
-                    df = pd.DataFrame(data, columns=headers)
-                else:
-                    df = pd.DataFrame(values)
-
-                dataframes.append(df)
+            # The API echoes ranges in request order but normalizes their
+            # notation, so key the results by the ranges we asked for.
+            data = {
+                range_name: value_range.get("values", [])
+                for range_name, value_range in zip(ranges, value_ranges)
+            }
 
             logger.info(f"Batch read {len(ranges)} ranges from {spreadsheet_id}")
-            return dataframes
+            return data
 
         except HttpError as e:
             logger.error(f"Failed to batch read from {spreadsheet_id}: {e}")
@@ -316,8 +407,11 @@ class GoogleSheetsService:
         """
 
         def _metadata_operation():
+            self.read_limiter.acquire()
             return (
-                self._service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+                self._service.spreadsheets()
+                .get(spreadsheetId=spreadsheet_id)
+                .execute(http=self._thread_http.get())
             )
 
         try:
@@ -349,6 +443,7 @@ class GoogleSheetsService:
         """
 
         def _clear_operation():
+            self.write_limiter.acquire()
             return (
                 self._service.spreadsheets()
                 .values()
@@ -393,6 +488,7 @@ class GoogleSheetsService:
         """
 
         def _create_operation():
+            self.write_limiter.acquire()
             requests = [
                 {
                     "addSheet": {
@@ -428,6 +524,65 @@ class GoogleSheetsService:
             logger.error(f"Unexpected error creating sheet: {e}")
             raise
 
+    def create_sheets(
+        self,
+        spreadsheet_id: str,
+        sheet_titles: List[str],
+        row_count: int = 1000,
+        column_count: int = 26,
+    ) -> Dict[str, Any]:
+        """
+        Create several sheets in an existing spreadsheet in a single API call.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            sheet_titles: Titles for the new sheets
+            row_count: Number of rows in each new sheet
+            column_count: Number of columns in each new sheet
+
+        Returns:
+            Response from the API call, with one reply per created sheet
+
+        Raises:
+            HttpError: If API request fails
+        """
+
+        def _create_operation():
+            self.write_limiter.acquire()
+            requests = [
+                {
+                    "addSheet": {
+                        "properties": {
+                            "title": sheet_title,
+                            "gridProperties": {
+                                "rowCount": row_count,
+                                "columnCount": column_count,
+                            },
+                        }
+                    }
+                }
+                for sheet_title in sheet_titles
+            ]
+
+            return (
+                self._service.spreadsheets()
+                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
+                .execute()
+            )
+
+        try:
+            result = self.retry_handler.execute_with_retry(_create_operation)
+
+            logger.info(f"Created {len(sheet_titles)} sheets in {spreadsheet_id}")
+            return result
+
+        except HttpError as e:
+            logger.error(f"Failed to create sheets in {spreadsheet_id}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error creating sheets: {e}")
+            raise
+
     def append_data(
         self,
         spreadsheet_id: str,
@@ -456,6 +611,7 @@ class GoogleSheetsService:
             values.append(row.astype(str).tolist())
 
         def _append_operation():
+            self.write_limiter.acquire()
             return (
                 self._service.spreadsheets()
                 .values()
@@ -481,3 +637,124 @@ class GoogleSheetsService:
         except Exception as e:
             logger.error(f"Unexpected error appending data: {e}")
             raise
+
+    def update_sheet_data_chunked(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        values: List[List[Any]],
+        chunk_size: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """
+        Write many rows as a sequence of appends of at most chunk_size rows.
+
+        Large payloads are split so that no single request carries a
+        multi-megabyte JSON body. Chunks are sent in order because each
+        append lands after the rows written by the previous one.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            range_name: The A1 notation range (table) to append to
+            values: Rows to write, one list of cell values per row
+            chunk_size: Maximum number of rows per request
+
+        Returns:
+            List of API responses, one per chunk
+
+        Raises:
+            ValueError: If chunk_size is not positive
+            HttpError: If API request fails
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        results = []
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start : start + chunk_size]
+
+            def _append_chunk_operation(chunk=chunk):
+                self.write_limiter.acquire()
+                return (
+                    self._service.spreadsheets()
+                    .values()
+                    .append(
+                        spreadsheetId=spreadsheet_id,
+                        range=range_name,
+                        valueInputOption="RAW",
+                        insertDataOption="INSERT_ROWS",
+                        body={"values": chunk},
+                    )
+                    .execute()
+                )
+
+            try:
+                results.append(
+                    self.retry_handler.execute_with_retry(_append_chunk_operation)
+                )
+
+            except HttpError as e:
+                logger.error(
+                    f"Failed to write chunk at row {start} to "
+                    f"{spreadsheet_id}:{range_name}: {e}"
+                )
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error writing chunked data: {e}")
+                raise
+
+        logger.info(
+            f"Wrote {len(values)} rows in {len(results)} chunks to "
+            f"{spreadsheet_id}:{range_name}"
+        )
+        return results
+
+    def append_sheet_row(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        values: List[List[Any]],
+    ) -> Dict[str, Any]:
+        """
+        Append raw rows to the end of a sheet range.
+
+        Unlike append_data, this takes plain row values and only sends the
+        new rows, so it avoids rewriting existing data when adding a row.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            range_name: The A1 notation range to append to
+            values: Rows to append, one list of cell values per row
+
+        Returns:
+            Response from the API call
+
+        Raises:
+            HttpError: If API request fails
+        """
+
+        def _append_row_operation():
+            self.write_limiter.acquire()
+            return (
+                self._service.spreadsheets()
+                .values()
+                .append(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name,
+                    valueInputOption="USER_ENTERED",
+                    body={"values": values},
+                )
+                .execute()
+            )
+
+        try:
+            result = self.retry_handler.execute_with_retry(_append_row_operation)
+
+            logger.info(f"Appended {len(values)} rows to {spreadsheet_id}:{range_name}")
+            return result
+
+        except HttpError as e:
+            logger.error(f"Failed to append to {spreadsheet_id}:{range_name}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error appending rows: {e}")
+            raise
@@ -0,0 +1,94 @@
+"""
+Token-bucket rate limiter for proactive Google API request pacing.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate / period`` per second up to
+    ``capacity``. ``acquire`` returns immediately while tokens are available
+    and only sleeps when the bucket is empty, so callers well under quota pay
+    no delay while bursts above quota are paced instead of hitting HTTP 429.
+
+    Example:
+        >>> limiter = RateLimiter(rate=60, period=60.0)
+        >>> limiter.acquire()  # Returns immediately while under quota
+    """
+
+    def __init__(self, rate: int, period: float = 60.0, capacity: Optional[int] = None):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Number of requests allowed per period
+            period: Length of the quota window (seconds)
+            capacity: Maximum burst size (defaults to rate)
+
+        Raises:
+            ValueError: If rate or period is not positive
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+
+        self.rate = rate
+        self.period = period
+        self.capacity = capacity or rate
+
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket, sleeping only if it is empty.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Time spent waiting (seconds)
+
+        Raises:
+            ValueError: If tokens exceeds the bucket capacity, since such a
+                request could never be satisfied
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"cannot acquire {tokens} tokens from a bucket of capacity "
+                f"{self.capacity}"
+            )
+
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                delay = (tokens - self._tokens) * self.period / self.rate
+
+            logger.debug(f"Rate limit reached, waiting {delay:.2f}s")
+            time.sleep(delay)
+            waited += delay
+
+    def _refill(self):
+        """Add tokens accrued since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        self._tokens = min(
+            self.capacity, self._tokens + elapsed * self.rate / self.period
+        )
@@ -3,6 +3,7 @@ Retry handler with exponential backoff, jitter, and circuit breaker pattern.
 """
 
 import logging
+import random
 import secrets
 import socket
 import threading
@@ -33,7 +34,7 @@ class RetryHandler:
     Handles retries with exponential backoff, jitter, and circuit breaker pattern.
 
     Features:
-    - Exponential backoff with configurable base and jitter
+    - Exponential backoff with full jitter
     - Circuit breaker to prevent cascade failures
     - Thread-safe operation
     - Configurable retry conditions
@@ -50,6 +51,7 @@ class RetryHandler:
         circuit_breaker_threshold: int = 10,
         circuit_breaker_timeout: float = 60.0,
         retry_condition: Optional[Callable[[Exception], bool]] = None,
+        rng: Optional[random.Random] = None,
     ):
         """
         Initialize retry handler.
@@ -59,10 +61,13 @@ class RetryHandler:
             base_delay: Base delay for exponential backoff (seconds)
             max_delay: Maximum delay between retries (seconds)
             exponential_base: Base for exponential backoff calculation
-            jitter_factor: Factor for random jitter (0.0 to 1.0)
+            jitter_factor: Factor for random jitter added to Retry-After delays
+                (0.0 to 1.0)
             circuit_breaker_threshold: Number of failures before opening circuit
             circuit_breaker_timeout: Time to wait before trying again (seconds)
             retry_condition: Custom function to determine if retry should occur
+            rng: Random number generator for jitter (defaults to a
+                cryptographically secure generator; seed one for tests)
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
@@ -72,10 +77,13 @@ class RetryHandler:
         self.circuit_breaker_threshold = circuit_breaker_threshold
         self.circuit_breaker_timeout = circuit_breaker_timeout
         self.retry_condition = retry_condition or self._default_retry_condition
+        self._rng = rng or secrets.SystemRandom()
 
-        # Circuit breaker state
+        # Circuit breaker state: closed, open, or half-open (open with the
+        # timeout elapsed and a single trial call let through)
         self._circuit_breaker_open = False
         self._circuit_breaker_opened_at = 0.0
+        self._half_open_trial_in_flight = False
         self._failure_count = 0
 
         # Statistics
@@ -123,12 +131,20 @@ class RetryHandler:
         if exception.resp.status != 429:
             return None
 
-        # Get Retry-After header from response headers
-        retry_after = (
-            exception.resp.headers.get("Retry-After")
-            if hasattr(exception.resp, "headers")
-            else None
-        )
+        # httplib2 responses are dicts of lower-cased headers; other response
+        # objects expose a headers mapping
+        resp = exception.resp
+        headers = resp if isinstance(resp, dict) else getattr(resp, "headers", None)
+        retry_after = None
+        if isinstance(headers, dict):
+            retry_after = next(
+                (
+                    value
+                    for name, value in headers.items()
+                    if name.lower() == "retry-after"
+                ),
+                None,
+            )
 
         if not retry_after:
             return None
@@ -157,9 +173,12 @@ class RetryHandler:
         self, attempt: int, exception: Optional[Exception] = None
     ) -> float:
         """
-        Calculate delay for exponential backoff with jitter.
+        Calculate delay for exponential backoff with full jitter.
 
-        For 429 errors, respects Retry-After header if present.
+        The delay is drawn uniformly from ``[0, min(max_delay, base_delay *
+        exponential_base ** attempt)]``, so concurrent clients spread their
+        retries instead of retrying in lockstep. For 429 errors with a
+        Retry-After header, waits at least as long as the server asks.
 
         Args:
             attempt: Current attempt number (0-based)
@@ -168,29 +187,21 @@ class RetryHandler:
         Returns:
             Delay in seconds
         """
+        # Exponential ceiling, capped at max_delay
+        ceiling = min(
+            self.max_delay, self.base_delay * (self.exponential_base**attempt)
+        )
+        delay = self._rng.uniform(0, ceiling)
+
         # Check for Retry-After header in 429 errors
         if exception:
             retry_after_delay = self._parse_retry_after(exception)
             if retry_after_delay is not None:
-                # Respect Retry-After but cap at max_delay
-                delay = min(retry_after_delay, self.max_delay)
-                # Add small jitter to Retry-After delays
-                random_gen = secrets.SystemRandom()
-                jitter = (
-                    random_gen.uniform(-self.jitter_factor, self.jitter_factor) * delay
-                )
-                return max(0, delay + jitter)
-
-        # Calculate exponential delay
-        delay = self.base_delay * (self.exponential_base**attempt)
-
-        # Apply maximum delay cap
-        delay = min(delay, self.max_delay)
-
-        # Add jitter using cryptographically secure random
-        random_gen = secrets.SystemRandom()
-        jitter = random_gen.uniform(-self.jitter_factor, self.jitter_factor) * delay
-        delay = max(0, delay + jitter)
+                # Never retry before the server allows it (capped at max_delay);
+                # jitter only pushes clients slightly past the hint
+                retry_after_delay = min(retry_after_delay, self.max_delay)
+                jitter = self._rng.uniform(0, self.jitter_factor) * retry_after_delay
+                delay = max(delay, retry_after_delay + jitter)
 
         return delay
 
@@ -198,6 +209,10 @@ class RetryHandler:
         """
         Check if circuit breaker is open.
 
+        Once the timeout has passed, the breaker becomes half-open and lets a
+        single trial call through; further calls are rejected until that
+        trial succeeds (closing the breaker) or fails (re-opening it).
+
         Returns:
             True if circuit breaker is open, False otherwise
         """
@@ -207,10 +222,12 @@ class RetryHandler:
 
             # Check if timeout has passed (transition to half-open)
             if (
-                time.time() - self._circuit_breaker_opened_at
+                time.monotonic() - self._circuit_breaker_opened_at
                 >= self.circuit_breaker_timeout
+                and not self._half_open_trial_in_flight
             ):
                 logger.info("Circuit breaker transitioning to half-open state")
+                self._half_open_trial_in_flight = True
                 return False
 
             return True
@@ -219,6 +236,7 @@ class RetryHandler:
         """Record successful execution - closes circuit breaker."""
         with self._lock:
             self._failure_count = 0
+            self._half_open_trial_in_flight = False
             if self._circuit_breaker_open:
                 logger.info("Circuit breaker closed after successful execution")
                 self._circuit_breaker_open = False
@@ -228,7 +246,12 @@ class RetryHandler:
         with self._lock:
             self._failure_count += 1
 
-            if (
+            if self._half_open_trial_in_flight:
+                # Trial call failed: re-open for another full timeout
+                logger.warning("Circuit breaker re-opened after failed trial call")
+                self._half_open_trial_in_flight = False
+                self._circuit_breaker_opened_at = time.monotonic()
+            elif (
                 not self._circuit_breaker_open
                 and self._failure_count >= self.circuit_breaker_threshold
             ):
@@ -236,7 +259,30 @@ class RetryHandler:
                     f"Circuit breaker opened after {self._failure_count} failures"
                 )
                 self._circuit_breaker_open = True
-                self._circuit_breaker_opened_at = time.time()
+                self._circuit_breaker_opened_at = time.monotonic()
+
+    def _end_half_open_trial(self):
+        """Allow a new trial call after one ended without a verdict."""
+        with self._lock:
+            self._half_open_trial_in_flight = False
+
+    def get_circuit_breaker_state(self) -> str:
+        """
+        Get the current circuit breaker state.
+
+        Returns:
+            "closed", "open", or "half_open"
+        """
+        with self._lock:
+            if not self._circuit_breaker_open:
+                return "closed"
+            if (
+                self._half_open_trial_in_flight
+                or time.monotonic() - self._circuit_breaker_opened_at
+                >= self.circuit_breaker_timeout
+            ):
+                return "half_open"
+            return "open"
 
     def execute_with_retry(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -288,6 +334,8 @@ class RetryHandler:
                     logger.debug(
                         f"Not retrying - condition not met: {type(e).__name__}"
                     )
+                    # Not an outage signal, so neither close nor re-open
+                    self._end_half_open_trial()
                     raise e
 
                 # Check if we have retries left
@@ -330,12 +378,15 @@ class RetryHandler:
         Returns:
             Dictionary with retry statistics
         """
+        state = self.get_circuit_breaker_state()
+
         with self._lock:
             return {
                 "total_calls": self._total_calls,
                 "total_retries": self._total_retries,
                 "total_failures": self._total_failures,
                 "circuit_breaker_open": self._circuit_breaker_open,
+                "circuit_breaker_state": state,
                 "failure_count": self._failure_count,
             }
 
@@ -343,6 +394,7 @@ class RetryHandler:
         """Manually reset the circuit breaker."""
         with self._lock:
             self._circuit_breaker_open = False
+            self._half_open_trial_in_flight = False
             self._failure_count = 0
             self._circuit_breaker_opened_at = 0.0
 
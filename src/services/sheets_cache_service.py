@@ -58,6 +58,9 @@ class SheetsCacheService:
 
     CACHE_VERSION = "1.0"
 
+    # Number of locks that single-range fetches are spread over
+    KEY_LOCK_STRIPES = 64
+
     def __init__(
         self,
         sheets_service: GoogleSheetsService,
@@ -85,8 +88,10 @@ class SheetsCacheService:
         # In-memory cache (LRU ordering)
         self._memory_cache: OrderedDict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
 
-        # Thread safety
+        # Thread safety: _lock guards cache state; a fixed stripe of key
+        # locks serializes API fetches per (spreadsheet_id, range_name)
         self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(self.KEY_LOCK_STRIPES)]
 
         # Statistics
         self._stats = {
@@ -133,27 +138,34 @@ class SheetsCacheService:
 
         cache_key = (spreadsheet_id, range_name)
 
-        with self._lock:
-            # Step 1: Check memory cache
-            if cache_key in self._memory_cache:
-                cached_entry = self._memory_cache[cache_key]
+        # The shared lock only guards cache state; API calls run under this
+        # key's lock, so reads of different ranges proceed in parallel while
+        # concurrent reads of the same range wait for a single fetch.
+        with self._key_lock(cache_key):
+            with self._lock:
+                cached_entry = self._memory_cache.get(cache_key)
 
+            # Step 1: Check memory cache
+            if cached_entry is not None:
                 # Check if file has been modified since cache time
                 if self._is_cache_entry_valid(spreadsheet_id, cached_entry):
                     logger.debug(f"Memory cache hit for {spreadsheet_id}:{range_name}")
-                    self._stats["memory_hits"] += 1
+                    with self._lock:
+                        self._stats["memory_hits"] += 1
 
-                    # Move to end (LRU: most recently used)
-                    self._memory_cache.move_to_end(cache_key)
+                        # Move to end (LRU: most recently used)
+                        if cache_key in self._memory_cache:
+                            self._memory_cache.move_to_end(cache_key)
 
                     return pd.DataFrame.from_records(cached_entry["data"])
-                else:
-                    logger.debug(
-                        f"Memory cache invalid (file modified) for "
-                        f"{spreadsheet_id}:{range_name}"
-                    )
-                    # Remove stale entry
-                    del self._memory_cache[cache_key]
+
+                logger.debug(
+                    f"Memory cache invalid (file modified) for "
+                    f"{spreadsheet_id}:{range_name}"
+                )
+                # Remove stale entry
+                with self._lock:
+                    self._memory_cache.pop(cache_key, None)
                     self._stats["cache_invalidations"] += 1
 
             # Step 2: Memory cache miss - fetch from API
@@ -161,7 +173,8 @@ class SheetsCacheService:
                 f"Cache miss for {spreadsheet_id}:{range_name}, " f"fetching from API"
             )
             df = self.sheets_service.read_sheet(spreadsheet_id, range_name)
-            self._stats["api_calls"] += 1
+            with self._lock:
+                self._stats["api_calls"] += 1
 
             # Step 3: Update cache with fresh data
             try:
@@ -173,12 +186,13 @@ class SheetsCacheService:
                     "cached_at": datetime.now().isoformat(),
                 }
 
-                # Add to memory cache (with LRU eviction if needed)
-                self._add_to_memory_cache(cache_key, cache_entry)
+                with self._lock:
+                    # Add to memory cache (with LRU eviction if needed)
+                    self._add_to_memory_cache(cache_key, cache_entry)
 
-                # Save to disk if auto-save enabled
-                if self.auto_save:
-                    self._save_to_disk()
+                    # Save to disk if auto-save enabled
+                    if self.auto_save:
+                        self._save_to_disk()
 
             except Exception as e:
                 logger.warning(f"Failed to cache data: {e}")
@@ -192,24 +206,92 @@ class SheetsCacheService:
         """
         Read multiple sheets with caching (batched operation).
 
+        Cache misses are fetched with one batchGet call per spreadsheet and
+        each returned range is cached under its own key, so later single-range
+        reads of the same ranges hit the cache.
+
         Args:
             requests: List of (spreadsheet_id, range_name) tuples
 
         Returns:
             List of DataFrames in the same order as requests
         """
-        results = []
+        if not self.enabled:
+            return [
+                self.sheets_service.read_sheet(spreadsheet_id, range_name)
+                for spreadsheet_id, range_name in requests
+            ]
+
+        results: Dict[Tuple[str, str], pd.DataFrame] = {}
+        misses: Dict[str, List[str]] = {}
+
+        # Like read_sheet_cached, the shared lock is only held to read and
+        # update cache state; validation and fetches run without it
+        with self._lock:
+            snapshot = {
+                cache_key: self._memory_cache.get(cache_key)
+                for cache_key in dict.fromkeys(requests)
+            }
+
+        # Step 1: Serve valid entries from memory, collect misses
+        for cache_key, cached_entry in snapshot.items():
+            spreadsheet_id, range_name = cache_key
+
+            if cached_entry is not None:
+                if self._is_cache_entry_valid(spreadsheet_id, cached_entry):
+                    with self._lock:
+                        self._stats["memory_hits"] += 1
+                        if cache_key in self._memory_cache:
+                            self._memory_cache.move_to_end(cache_key)
+                    results[cache_key] = pd.DataFrame.from_records(cached_entry["data"])
+                    continue
+
+                with self._lock:
+                    self._memory_cache.pop(cache_key, None)
+                    self._stats["cache_invalidations"] += 1
+
+            misses.setdefault(spreadsheet_id, []).append(range_name)
+
+        # Step 2: Fetch all missing ranges of a spreadsheet in one call
+        for spreadsheet_id, range_names in misses.items():
+            logger.debug(
+                f"Cache miss for {len(range_names)} ranges of "
+                f"{spreadsheet_id}, fetching from API"
+            )
+            dataframes = self.sheets_service.batch_read_sheets(
+                spreadsheet_id, range_names
+            )
+            with self._lock:
+                self._stats["api_calls"] += 1
+
+            for range_name, df in zip(range_names, dataframes):
+                results[(spreadsheet_id, range_name)] = df
+
+            # Step 3: Cache each range under its own key
+            try:
+                modified_time = self.drive_service.get_modification_time(spreadsheet_id)
+                cached_at = datetime.now().isoformat()
+
+                with self._lock:
+                    for range_name, df in zip(range_names, dataframes):
+                        self._add_to_memory_cache(
+                            (spreadsheet_id, range_name),
+                            {
+                                "data": df.to_dict("records"),
+                                "modified_time": modified_time.isoformat(),
+                                "cached_at": cached_at,
+                            },
+                        )
 
-        for spreadsheet_id, range_name in requests:
-            df = self.read_sheet_cached(spreadsheet_id, range_name)
-            results.append(df)
+            except Exception as e:
+                logger.warning(f"Failed to cache data: {e}")
 
         # Save to disk once after batch (if auto-save enabled)
-        if self.enabled and self.auto_save and requests:
+        if self.auto_save and misses:
             with self._lock:
                 self._save_to_disk()
 
-        return results
+        return [results[request] for request in requests]
 
     def invalidate_cache(
         self, spreadsheet_id: Optional[str] = None, range_name: Optional[str] = None
@@ -298,6 +380,21 @@ class SheetsCacheService:
                 "max_cache_size": self.max_size,
             }
 
+    def _key_lock(self, cache_key: Tuple[str, str]) -> threading.Lock:
+        """
+        Get the lock that serializes fetches of one cache key.
+
+        Keys are spread over a fixed stripe of locks, so the number of locks
+        does not grow with the number of ranges read.
+
+        Args:
+            cache_key: (spreadsheet_id, range_name) tuple
+
+        Returns:
+            Lock shared by every reader of this key
+        """
+        return self._key_locks[hash(cache_key) % self.KEY_LOCK_STRIPES]
+
     def _is_cache_entry_valid(
         self, spreadsheet_id: str, cache_entry: Dict[str, Any]
     ) -> bool:
@@ -0,0 +1,85 @@
+"""
+Per-thread authorized HTTP transports for Google API clients.
+
+httplib2.Http is not thread-safe, so requests issued from several threads
+cannot share one transport. ThreadLocalHttp gives every thread its own
+keep-alive transport, configured like the Http the service was given.
+"""
+
+import threading
+from typing import Any, Optional
+
+import google_auth_httplib2
+import httplib2
+from googleapiclient.http import build_http
+
+
+def clone_http(template: Optional[httplib2.Http]) -> httplib2.Http:
+    """
+    Create a new Http with the connection settings of ``template``.
+
+    Timeout, proxy, CA bundle, TLS, client certificate and redirect settings
+    are carried over; open connections are not, so the clone can be used
+    from another thread.
+
+    Args:
+        template: Http to copy settings from. If None, the Http that
+                  googleapiclient builds by default is returned, with its
+                  socket timeout and 308 redirect exclusion.
+
+    Returns:
+        New httplib2.Http instance
+    """
+    if template is None:
+        return build_http()
+
+    http = httplib2.Http(
+        cache=template.cache,
+        timeout=template.timeout,
+        proxy_info=template.proxy_info,
+        ca_certs=template.ca_certs,
+        disable_ssl_certificate_validation=(
+            template.disable_ssl_certificate_validation
+        ),
+        tls_maximum_version=template.tls_maximum_version,
+        tls_minimum_version=template.tls_minimum_version,
+    )
+    http.certificates = template.certificates
+    http.credentials = template.credentials
+    http.follow_redirects = template.follow_redirects
+    http.redirect_codes = template.redirect_codes
+    http.follow_all_redirects = template.follow_all_redirects
+    http.forward_authorization_headers = template.forward_authorization_headers
+    return http
+
+
+class ThreadLocalHttp:
+    """
+    Authorized HTTP transports, one per calling thread.
+
+    Example:
+        >>> transports = ThreadLocalHttp(credentials, httplib2.Http(timeout=60))
+        >>> request.execute(http=transports.get())
+    """
+
+    def __init__(self, credentials: Any, template: Optional[httplib2.Http] = None):
+        """
+        Initialize the per-thread transport pool.
+
+        Args:
+            credentials: Google credentials used to authorize requests
+            template: Http whose settings every per-thread transport copies
+        """
+        self._credentials = credentials
+        self._template = template
+        self._local = threading.local()
+
+    def get(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return the authorized HTTP transport owned by the calling thread."""
+        authed_http = getattr(self._local, "http", None)
+        if authed_http is None:
+            authed_http = google_auth_httplib2.AuthorizedHttp(
+                self._credentials, http=clone_http(self._template)
+            )
+            self._local.http = authed_http
+        return authed_http
@@ -6,16 +6,145 @@ Google APIs and test end-to-end workflows.
 """
 
 import os
+import re
 import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import MagicMock
 
+import httplib2
+import pandas as pd
 import pytest
+from dotenv import load_dotenv
+from googleapiclient.errors import HttpError
 
 from src.config import BillingSystemConfig, get_config
+from src.readers import TimesheetReader
 from src.services import GoogleDriveService, GoogleSheetsService, SheetsCacheService
+from tests.integration.utils import (
+    generate_large_timesheet_data,
+    generate_test_timesheet,
+    set_seed,
+)
+
+# Environment variables required to talk to the real Google APIs. They are
+# checked once at import (after loading .env) so that credential-dependent
+# tests are skipped at collection time instead of failing during setup.
+_REQUIRED_ENV_VARS = [
+    "GOOGLE_PROJECT_ID",
+    "GOOGLE_PRIVATE_KEY",
+    "GOOGLE_CLIENT_EMAIL",
+    "TIMESHEET_FOLDER_ID",
+    "PROJECT_TERMS_FILE_ID",
+    "MONTHLY_INVOICING_FOLDER_ID",
+]
+
+load_dotenv()
+_MISSING_ENV_VARS = [var for var in _REQUIRED_ENV_VARS if not os.getenv(var)]
+_MISSING_ENV_REASON = (
+    f"Integration tests require environment variables: {', '.join(_MISSING_ENV_VARS)}"
+)
+
+# Sample data shared by all integration tests. Rows are tuples so that an
+# accidental in-place mutation fails loudly instead of leaking between tests.
+_SAMPLE_TIMESHEET_DATA: Tuple[Tuple[Any, ...], ...] = (
+    (
+        "Date",
+        "Project",
+        "Location",
+        "Start Time",
+        "End Time",
+        "Topics worked on",
+        "Break",
+        "Travel time",
+    ),
+    (
+        "2024-10-01",
+        "P&C_NEWRETAIL",
+        "Off-site",
+        "09:00",
+        "17:00",
+        "Development work",
+        "00:30",
+        "00:00",
+    ),
+    (
+        "2024-10-02",
+        "P&C_NEWRETAIL",
+        "On-site",
+        "08:00",
+        "18:00",
+        "Client meeting",
+        "01:00",
+        "02:00",
+    ),
+    (
+        "2024-10-03",
+        "P&C_NEWRETAIL",
+        "On-site",
+        "08:30",
+        "17:30",
+        "Workshop",
+        "00:45",
+        "01:30",
+    ),
+    (
+        "2024-10-04",
+        "PROJECT_ALPHA",
+        "Off-site",
+        "10:00",
+        "18:00",
+        "Code review",
+        "01:00",
+        "00:00",
+    ),
+    (
+        "2024-10-07",
+        "PROJECT_ALPHA",
+        "Off-site",
+        "09:30",
+        "17:30",
+        "Bug fixes",
+        "00:30",
+        "00:00",
+    ),
+)
+
+_SAMPLE_PROJECT_TERMS: Tuple[Tuple[Any, ...], ...] = (
+    (
+        "Project",
+        "Consultant_ID",
+        "Name",
+        "Rate",
+        "Cost",
+        "Share of travel as work",
+        "surcharge for travel",
+    ),
+    ("P&C_NEWRETAIL", "C001", "Test Freelancer", 85.0, 60.0, 0.5, 0.15),
+    ("PROJECT_ALPHA", "C001", "Test Freelancer", 90.0, 65.0, 0.5, 0.10),
+)
+
+
+# Seed for generated test data; override with TEST_DATA_SEED to vary the data
+_TEST_DATA_SEED = int(os.getenv("TEST_DATA_SEED", "42"))
+
+
+@pytest.fixture(autouse=True)
+def seed_test_data() -> int:
+    """
+    Reseed the shared test data generator before every test.
+
+    Tests that generate data without an explicit seed then see the same
+    data whatever order or subset of tests is run.
+
+    Returns:
+        int: Seed the generator was reset to
+    """
+    set_seed(_TEST_DATA_SEED)
+    return _TEST_DATA_SEED
 
 
 @pytest.fixture(scope="session")
@@ -27,47 +156,147 @@ def integration_config() -> BillingSystemConfig:
     Tests marked with @pytest.mark.integration will be skipped if
     required environment variables are not set.
     """
-    config = get_config()
+    if _MISSING_ENV_VARS:
+        pytest.skip(_MISSING_ENV_REASON)
 
-    # Verify required environment variables are set
-    required_vars = [
-        "GOOGLE_PROJECT_ID",
-        "GOOGLE_PRIVATE_KEY",
-        "GOOGLE_CLIENT_EMAIL",
-        "TIMESHEET_FOLDER_ID",
-        "PROJECT_TERMS_FILE_ID",
-        "MONTHLY_INVOICING_FOLDER_ID",
-    ]
-
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-    if missing_vars:
-        pytest.skip(
-            f"Integration tests require environment variables: {', '.join(missing_vars)}"
-        )
+    config = get_config()
 
     return config
 
 
+# Spreadsheet known to the mocked Sheets service and its canned ranges
+_MOCK_SPREADSHEET_ID = "mock-spreadsheet-id"
+_MOCK_SHEET_DATA = {"Sheet1!A1:B2": (("A", "B"), ("1", "2"))}
+_A1_RANGE_PATTERN = re.compile(r"^[^!]+![A-Z]+\d*(:[A-Z]+\d*)?$")
+
+
+def _mock_http_error(status: int, message: str) -> HttpError:
+    """Build an HttpError like the ones googleapiclient raises."""
+    return HttpError(httplib2.Response({"status": status}), message.encode())
+
+
+@pytest.fixture
+def mock_spreadsheet_id() -> str:
+    """ID of the only spreadsheet the mocked Sheets service knows about."""
+    return _MOCK_SPREADSHEET_ID
+
+
+@pytest.fixture
+def mock_sheets_service() -> MagicMock:
+    """
+    In-process stand-in for GoogleSheetsService.
+
+    For tests that check library or cache behavior rather than Google Sheets
+    semantics. Reads of mock_spreadsheet_id return canned values (empty for
+    unknown ranges); other spreadsheet IDs raise a 404 and malformed ranges a
+    400 HttpError, mirroring the real API.
+
+    Returns:
+        MagicMock: Mock with read_sheet_data and read_sheet configured
+    """
+    service = MagicMock(spec=GoogleSheetsService)
+
+    def read_sheet_data(spreadsheet_id: str, range_name: str) -> List[List[Any]]:
+        if spreadsheet_id != _MOCK_SPREADSHEET_ID:
+            raise _mock_http_error(404, "Requested entity was not found.")
+        if not _A1_RANGE_PATTERN.match(range_name):
+            raise _mock_http_error(400, f"Unable to parse range: {range_name}")
+        return [list(row) for row in _MOCK_SHEET_DATA.get(range_name, ())]
+
+    def read_sheet(spreadsheet_id: str, range_name: str) -> pd.DataFrame:
+        values = read_sheet_data(spreadsheet_id, range_name)
+        if not values:
+            return pd.DataFrame()
+        return pd.DataFrame(values[1:], columns=values[0])
+
+    service.read_sheet_data = MagicMock(side_effect=read_sheet_data)
+    service.read_sheet = MagicMock(side_effect=read_sheet)
+    return service
+
+
+@pytest.fixture
+def mock_cache_service(mock_sheets_service: MagicMock, tmp_path) -> SheetsCacheService:
+    """
+    Real SheetsCacheService backed by the mocked Sheets service.
+
+    The Drive modification time never changes, so cached entries stay valid.
+
+    Returns:
+        SheetsCacheService: Cache service that never touches the network
+    """
+    drive_service = MagicMock(spec=GoogleDriveService)
+    drive_service.get_modification_time.return_value = datetime(2024, 1, 1)
+    config = SimpleNamespace(
+        enable_sheets_cache=True,
+        cache_file_path=str(tmp_path / "mock_cache.json"),
+        cache_max_size=100,
+        cache_auto_save=False,
+    )
+
+    return SheetsCacheService(mock_sheets_service, drive_service, config)
+
+
+@pytest.fixture(scope="session")
+def shared_http() -> httplib2.Http:
+    """
+    Provide one HTTP transport for the whole test session.
+
+    httplib2 keeps connections alive per host, so sharing it avoids paying a
+    fresh TCP and TLS handshake for every API call and service.
+    """
+    return httplib2.Http(timeout=60)
+
+
 @pytest.fixture(scope="session")
-def real_sheets_service(integration_config: BillingSystemConfig) -> GoogleSheetsService:
+def real_sheets_service(
+    integration_config: BillingSystemConfig, shared_http: httplib2.Http
+) -> GoogleSheetsService:
     """
     Create a real Google Sheets service for integration testing.
 
     Returns:
         GoogleSheetsService: Real Sheets service with API access
     """
-    return GoogleSheetsService(config=integration_config)
+    return GoogleSheetsService(config=integration_config, http=shared_http)
+
+
+@pytest.fixture(scope="module")
+def reader_factory(
+    real_sheets_service: GoogleSheetsService,
+) -> Callable[[str], TimesheetReader]:
+    """
+    Provide pre-initialized TimesheetReader instances keyed by freelancer name.
+
+    Readers are built once per module and reused, so repeated requests for
+    the same freelancer return the same object instead of re-running reader
+    setup in every test.
+
+    Returns:
+        Callable[[str], TimesheetReader]: Factory returning a cached reader
+    """
+    readers: Dict[str, TimesheetReader] = {}
+
+    def get_reader(freelancer_name: str) -> TimesheetReader:
+        if freelancer_name not in readers:
+            readers[freelancer_name] = TimesheetReader(
+                sheets_service=real_sheets_service, freelancer_name=freelancer_name
+            )
+        return readers[freelancer_name]
+
+    return get_reader
 
 
 @pytest.fixture(scope="session")
-def real_drive_service(integration_config: BillingSystemConfig) -> GoogleDriveService:
+def real_drive_service(
+    integration_config: BillingSystemConfig, shared_http: httplib2.Http
+) -> GoogleDriveService:
     """
     Create a real Google Drive service for integration testing.
 
     Returns:
         GoogleDriveService: Real Drive service with API access
     """
-    return GoogleDriveService(config=integration_config)
+    return GoogleDriveService(config=integration_config, http=shared_http)
 
 
 @pytest.fixture(scope="session")
@@ -95,6 +324,26 @@ def real_cache_service(integration_config: BillingSystemConfig) -> SheetsCacheSe
         Path(temp_dir).rmdir()
 
 
+def _create_test_spreadsheet(
+    sheets_service: GoogleSheetsService, config: BillingSystemConfig
+) -> str:
+    """Create a timestamped test spreadsheet in the invoicing folder."""
+    title = f"Integration Test - {datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    return sheets_service.create_spreadsheet(
+        title=title, folder_id=config.monthly_invoicing_folder_id
+    )
+
+
+def _trash_test_spreadsheet(spreadsheet_id: str, config: BillingSystemConfig) -> None:
+    """Move a test spreadsheet to trash, warning instead of failing."""
+    try:
+        drive_service = GoogleDriveService(config=config)
+        drive_service.trash_file(spreadsheet_id)
+    except Exception as e:
+        print(f"Warning: Failed to cleanup test spreadsheet {spreadsheet_id}: {e}")
+
+
 @pytest.fixture
 def test_spreadsheet_id(
     real_sheets_service: GoogleSheetsService, integration_config: BillingSystemConfig
@@ -108,21 +357,57 @@ def test_spreadsheet_id(
     Returns:
         str: Spreadsheet ID for testing
     """
-    # Create a test spreadsheet
-    title = f"Integration Test - {datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    spreadsheet_id = _create_test_spreadsheet(real_sheets_service, integration_config)
 
-    spreadsheet_id = real_sheets_service.create_spreadsheet(
-        title=title, folder_id=integration_config.monthly_invoicing_folder_id
-    )
+    yield spreadsheet_id
+
+    _trash_test_spreadsheet(spreadsheet_id, integration_config)
+
+
+@pytest.fixture(scope="module")
+def module_spreadsheet_id(
+    real_sheets_service: GoogleSheetsService, integration_config: BillingSystemConfig
+) -> str:
+    """
+    Create one test spreadsheet shared by all tests in a module.
+
+    Intended for parametrized tests that overwrite the sheet contents on each
+    run, so every parameter costs a write instead of a create and trash.
+    Tests using it must clear or overwrite any data they rely on.
+
+    Returns:
+        str: Spreadsheet ID for testing
+    """
+    spreadsheet_id = _create_test_spreadsheet(real_sheets_service, integration_config)
 
     yield spreadsheet_id
 
-    # Cleanup: Move to trash or delete
-    try:
-        drive_service = GoogleDriveService(config=integration_config)
-        drive_service.trash_file(spreadsheet_id)
-    except Exception as e:
-        print(f"Warning: Failed to cleanup test spreadsheet {spreadsheet_id}: {e}")
+    _trash_test_spreadsheet(spreadsheet_id, integration_config)
+
+
+@pytest.fixture(scope="class", params=[50, 100, 200], ids=lambda n: f"rows={n}")
+def prefilled_sheet(
+    request, real_sheets_service: GoogleSheetsService, module_spreadsheet_id: str
+) -> Tuple[str, str, List[List[Any]]]:
+    """
+    Write a generated timesheet once and share it across a test class.
+
+    Parametrized over the number of entries; every test in the class that
+    only reads the data reuses a single write per parameter. Tests that need
+    a cold cache must clear it themselves.
+
+    Returns:
+        Tuple[str, str, List[List[Any]]]: Spreadsheet ID, range covering the
+        written data, and the data that was written
+    """
+    data = generate_test_timesheet(num_entries=request.param)
+
+    real_sheets_service.clear_sheet_range(module_spreadsheet_id, "Sheet1")
+    real_sheets_service.update_sheet_data(
+        spreadsheet_id=module_spreadsheet_id, range_name="Sheet1!A1", values=data
+    )
+
+    return module_spreadsheet_id, f"Sheet1!A1:H{len(data)}", data
 
 
 @pytest.fixture
@@ -172,99 +457,49 @@ def performance_baseline() -> Dict[str, float]:
     }
 
 
-@pytest.fixture
-def sample_integration_timesheet_data() -> List[List[Any]]:
+@pytest.fixture(scope="session")
+def sample_integration_timesheet_data() -> Tuple[Tuple[Any, ...], ...]:
     """
     Sample timesheet data for integration testing with realistic scenarios.
 
+    The same immutable object is shared by every test; build a new list from it
+    (e.g. ``list(data) + [row]``) when a test needs a modified copy.
+
     Returns:
-        List[List[Any]]: Timesheet data with headers and multiple entries
-    """
-    return [
-        [
-            "Date",
-            "Project",
-            "Location",
-            "Start Time",
-            "End Time",
-            "Topics worked on",
-            "Break",
-            "Travel time",
-        ],
-        [
-            "2024-10-01",
-            "P&C_NEWRETAIL",
-            "Off-site",
-            "09:00",
-            "17:00",
-            "Development work",
-            "00:30",
-            "00:00",
-        ],
-        [
-            "2024-10-02",
-            "P&C_NEWRETAIL",
-            "On-site",
-            "08:00",
-            "18:00",
-            "Client meeting",
-            "01:00",
-            "02:00",
-        ],
-        [
-            "2024-10-03",
-            "P&C_NEWRETAIL",
-            "On-site",
-            "08:30",
-            "17:30",
-            "Workshop",
-            "00:45",
-            "01:30",
-        ],
-        [
-            "2024-10-04",
-            "PROJECT_ALPHA",
-            "Off-site",
-            "10:00",
-            "18:00",
-            "Code review",
-            "01:00",
-            "00:00",
-        ],
-        [
-            "2024-10-07",
-            "PROJECT_ALPHA",
-            "Off-site",
-            "09:30",
-            "17:30",
-            "Bug fixes",
-            "00:30",
-            "00:00",
-        ],
-    ]
+        Tuple[Tuple[Any, ...], ...]: Timesheet data with headers and multiple entries
+    """
+    return _SAMPLE_TIMESHEET_DATA
 
 
-@pytest.fixture
-def sample_integration_project_terms() -> List[List[Any]]:
+@pytest.fixture(scope="session")
+def sample_integration_project_terms() -> Tuple[Tuple[Any, ...], ...]:
     """
     Sample project terms data for integration testing.
 
     Returns:
-        List[List[Any]]: Project terms data with headers and entries
-    """
-    return [
-        [
-            "Project",
-            "Consultant_ID",
-            "Name",
-            "Rate",
-            "Cost",
-            "Share of travel as work",
-            "surcharge for travel",
-        ],
-        ["P&C_NEWRETAIL", "C001", "Test Freelancer", 85.0, 60.0, 0.5, 0.15],
-        ["PROJECT_ALPHA", "C001", "Test Freelancer", 90.0, 65.0, 0.5, 0.10],
-    ]
+        Tuple[Tuple[Any, ...], ...]: Project terms data with headers and entries
+    """
+    return _SAMPLE_PROJECT_TERMS
+
+
+@pytest.fixture(scope="session")
+def large_timesheet_data() -> Tuple[Tuple[str, Tuple[Tuple[Any, ...], ...]], ...]:
+    """
+    Production-sized dataset (30 freelancers x 300 entries), built once.
+
+    Rows are tuples so the shared dataset cannot be modified in place; copy
+    a freelancer's rows into lists when a test needs to change them.
+
+    Returns:
+        Tuple[Tuple[str, Tuple[Tuple[Any, ...], ...]], ...]: Read-only
+        (freelancer_name, timesheet_data) pairs
+    """
+    return tuple(
+        (name, tuple(map(tuple, data)))
+        for name, data in generate_large_timesheet_data(
+            num_freelancers=30, entries_per_freelancer=300
+        )
+    )
 
 
 @pytest.fixture
@@ -289,7 +524,10 @@ def pytest_collection_modifyitems(config, items):
 
     - Add 'slow' marker to all integration tests
     - Add 'api' marker to tests that use real Google APIs
+    - Skip tests that need credentials when required env vars are missing
     """
+    skip_missing_env = pytest.mark.skip(reason=_MISSING_ENV_REASON)
+
     for item in items:
         # All integration tests are slow
         if "integration" in str(item.fspath):
@@ -305,3 +543,6 @@ def pytest_collection_modifyitems(config, items):
                 ]
             ):
                 item.add_marker(pytest.mark.api)
+
+            if _MISSING_ENV_VARS and "integration_config" in item.fixturenames:
+                item.add_marker(skip_missing_env)
@@ -0,0 +1,160 @@
+"""
+Tests for the integration test data generators.
+
+The generators feed every integration and performance test, so their
+output must be reproducible and safe to modify per test.
+"""
+
+import csv
+
+import pandas as pd
+
+from tests.integration.utils.test_data_generator import (
+    generate_edge_case_timesheet,
+    generate_large_timesheet_data,
+    generate_large_timesheet_dataframe,
+    generate_test_timesheet,
+    generate_test_timesheet_iter,
+    generate_trip_terms_data,
+    set_seed,
+    write_large_timesheet_csv,
+)
+
+
+def _flatten_large_dataset(dataset):
+    """Flatten (freelancer, timesheet) pairs into rows led by the freelancer."""
+    return [
+        [freelancer_name, *row]
+        for freelancer_name, timesheet_data in dataset
+        for row in timesheet_data[1:]
+    ]
+
+
+class TestSeeding:
+    """Tests for reproducible data from the shared generator."""
+
+    @staticmethod
+    def _generate_unseeded():
+        """Draw from every generator path without an explicit seed."""
+        return (
+            generate_test_timesheet(num_entries=10, include_trips=True),
+            list(generate_test_timesheet_iter(num_entries=10, include_trips=True)),
+            generate_large_timesheet_data(
+                num_freelancers=3, entries_per_freelancer=10, max_workers=2
+            ),
+        )
+
+    def test_set_seed_makes_unseeded_calls_reproducible(self):
+        """The serial, iterator and process pool paths replay after reseeding."""
+        set_seed(123)
+        first = self._generate_unseeded()
+        set_seed(123)
+        second = self._generate_unseeded()
+
+        assert first == second
+
+    def test_different_seeds_give_different_data(self):
+        """Reseeding with another value changes the generated data."""
+        set_seed(123)
+        first = self._generate_unseeded()
+        set_seed(124)
+        second = self._generate_unseeded()
+
+        for first_data, second_data in zip(first, second):
+            assert first_data != second_data
+
+    def test_each_test_starts_from_the_configured_seed(self, seed_test_data):
+        """The autouse fixture has reset the generator to its seed."""
+        generated = generate_test_timesheet(num_entries=10)
+
+        set_seed(seed_test_data)
+
+        assert generate_test_timesheet(num_entries=10) == generated
+
+
+class TestFixedTables:
+    """Tests for generators that return constant tables."""
+
+    def test_edge_case_timesheet_is_a_fresh_copy(self):
+        """Modifying one result does not leak into the next call."""
+        first = generate_edge_case_timesheet()
+        first[1][0] = "modified"
+        first.append(["extra"])
+
+        second = generate_edge_case_timesheet()
+
+        assert second[1][0] == "2024-12-31"
+        assert ["extra"] not in second
+
+    def test_trip_terms_data_is_a_fresh_copy(self):
+        """Modifying one result does not leak into the next call."""
+        first = generate_trip_terms_data()
+        first[1][2] = "0"
+
+        second = generate_trip_terms_data()
+
+        assert second[0] == ["Location", "Trip Duration", "Trip Reimbursement"]
+        assert second[1] == ["Paris On-site", "1", "450"]
+
+
+class TestLargeTimesheetDataFrame:
+    """Tests for the columnar large dataset generator."""
+
+    def test_column_dtypes(self):
+        """Dates are datetime64 and low-cardinality columns categorical."""
+        frame = generate_large_timesheet_dataframe(
+            num_freelancers=3, entries_per_freelancer=20, seed=7
+        )
+
+        assert list(frame.columns) == [
+            "Freelancer",
+            "Date",
+            "Project",
+            "Location",
+            "Start Time",
+            "End Time",
+            "Topics worked on",
+            "Break",
+            "Travel time",
+        ]
+        assert frame["Date"].dtype == "datetime64[ns]"
+        for column in ("Freelancer", "Project", "Location"):
+            assert isinstance(frame[column].dtype, pd.CategoricalDtype)
+        assert len(frame) == 60
+
+    def test_matches_row_generator_for_same_seed(self):
+        """The DataFrame holds the same entries as the row-wise generator."""
+        frame = generate_large_timesheet_dataframe(
+            num_freelancers=3, entries_per_freelancer=20, seed=7
+        )
+        dataset = generate_large_timesheet_data(
+            num_freelancers=3, entries_per_freelancer=20, seed=7, max_workers=2
+        )
+
+        rows = frame.astype(object)
+        rows["Date"] = frame["Date"].dt.strftime("%Y-%m-%d")
+
+        assert rows.values.tolist() == _flatten_large_dataset(dataset)
+
+
+class TestWriteLargeTimesheetCsv:
+    """Tests for streaming the large dataset to CSV."""
+
+    def test_round_trip_matches_generator(self, tmp_path):
+        """The CSV holds the generator's entries under a Freelancer header."""
+        path = tmp_path / "large_timesheet.csv"
+
+        # A chunk size that does not divide the entries exercises the tail
+        rows_written = write_large_timesheet_csv(
+            path, num_freelancers=3, entries_per_freelancer=20, seed=7, chunk_size=7
+        )
+        dataset = generate_large_timesheet_data(
+            num_freelancers=3, entries_per_freelancer=20, seed=7, max_workers=2
+        )
+
+        with open(path, newline="") as csv_file:
+            header, *rows = list(csv.reader(csv_file))
+
+        assert rows_written == 60
+        assert header == ["Freelancer", *dataset[0][1][0]]
+        assert rows == _flatten_large_dataset(dataset)
@@ -15,9 +15,11 @@ import time
 from datetime import datetime
 
 import pytest
+from googleapiclient.errors import HttpError
 
 from src.config import BillingSystemConfig
 from src.services import GoogleSheetsService, SheetsCacheService
+from tests.integration.utils import generate_value_grid, rows_digest
 
 
 @pytest.mark.integration
@@ -106,36 +108,28 @@ class TestGoogleSheetsIntegration:
     ):
         """Test reading multiple ranges in batch."""
         # Write test data to multiple ranges
-        data_sheet1 = [["Sheet1 Data", "A"], ["Row2", "B"]]
+        data_range1 = [["Sheet1 Data", "A"], ["Row2", "B"]]
+        data_range2 = [["Second Range", "D"], ["Row2", "E"]]
 
         real_sheets_service.update_sheet_data(
             spreadsheet_id=test_spreadsheet_id,
             range_name="Sheet1!A1",
-            values=data_sheet1,
+            values=data_range1,
         )
-
-        # Note: batch operations tested implicitly through service usage
-        # Read both ranges
-        data1 = real_sheets_service.read_sheet_data(
-            spreadsheet_id=test_spreadsheet_id, range_name="Sheet1!A1:B2"
+        real_sheets_service.update_sheet_data(
+            spreadsheet_id=test_spreadsheet_id,
+            range_name="Sheet1!D1",
+            values=data_range2,
         )
 
-        assert data1 == data_sheet1
-
-    def test_empty_sheet_handling(
-        self,
-        real_sheets_service: GoogleSheetsService,
-        test_spreadsheet_id: str,
-    ):
-        """Test reading from an empty sheet."""
-        # Try to read from a range that doesn't exist yet
-        data = real_sheets_service.read_sheet_data(
-            spreadsheet_id=test_spreadsheet_id, range_name="Sheet1!Z100:Z200"
+        # Read both ranges with a single batchGet call
+        data = real_sheets_service.batch_read_sheet_data(
+            spreadsheet_id=test_spreadsheet_id,
+            ranges=["Sheet1!A1:B2", "Sheet1!D1:E2"],
         )
 
-        # Should return empty list, not error
-        assert isinstance(data, list)
-        assert len(data) == 0
+        assert data["Sheet1!A1:B2"] == data_range1
+        assert data["Sheet1!D1:E2"] == data_range2
 
     def test_large_dataset_handling(
         self,
@@ -144,15 +138,14 @@ class TestGoogleSheetsIntegration:
     ):
         """Test handling larger datasets (100+ rows)."""
         # Generate 200 rows of data
-        large_data = [["Col1", "Col2", "Col3"]]
-        for i in range(200):
-            large_data.append([f"Value{i}_1", f"Value{i}_2", f"Value{i}_3"])
+        large_data = generate_value_grid(["Col1", "Col2", "Col3"], 200, prefix="Value")
 
-        # Write large dataset
-        real_sheets_service.update_sheet_data(
+        # Write large dataset in bounded chunks
+        real_sheets_service.update_sheet_data_chunked(
             spreadsheet_id=test_spreadsheet_id,
             range_name="Sheet1!A1",
             values=large_data,
+            chunk_size=500,
         )
 
         # Read it back
@@ -165,6 +158,9 @@ class TestGoogleSheetsIntegration:
         assert read_data[0] == ["Col1", "Col2", "Col3"]
         assert read_data[100] == ["Value99_1", "Value99_2", "Value99_3"]
 
+        # Compare the full table via digests instead of cell by cell
+        assert rows_digest(read_data) == rows_digest(large_data)
+
 
 @pytest.mark.integration
 @pytest.mark.api
@@ -179,9 +175,12 @@ class TestSheetsCacheIntegration:
     ):
         """Test that cache provides significant performance improvement."""
         # Write test data
-        test_data = [["Header"] + [f"Col{i}" for i in range(10)]]
-        for i in range(50):
-            test_data.append([f"Row{i}"] + [f"Val{i}_{j}" for j in range(10)])
+        test_data = generate_value_grid(
+            ["Header"] + [f"Col{i}" for i in range(10)],
+            50,
+            first_column=0,
+            row_label_prefix="Row",
+        )
 
         real_sheets_service.update_sheet_data(
             spreadsheet_id=test_spreadsheet_id,
@@ -212,47 +211,11 @@ class TestSheetsCacheIntegration:
             second_read_time < first_read_time / 5
         ), f"Cache hit ({second_read_time:.3f}s) should be much faster than miss ({first_read_time:.3f}s)"
 
-    def test_cache_stats_tracking(
-        self,
-        real_sheets_service: GoogleSheetsService,
-        real_cache_service: SheetsCacheService,
-        test_spreadsheet_id: str,
-    ):
-        """Test that cache statistics are properly tracked."""
-        # Clear cache first
-        real_cache_service.clear()
-
-        # Write and read data
-        test_data = [["A", "B"], ["1", "2"]]
-
-        real_sheets_service.update_sheet_data(
-            spreadsheet_id=test_spreadsheet_id,
-            range_name="Sheet1!A1",
-            values=test_data,
-        )
-
-        # First read - cache miss
-        real_sheets_service.read_sheet_data(
-            spreadsheet_id=test_spreadsheet_id, range_name="Sheet1!A1:B2"
-        )
-
-        # Second read - cache hit
-        real_sheets_service.read_sheet_data(
-            spreadsheet_id=test_spreadsheet_id, range_name="Sheet1!A1:B2"
-        )
-
-        # Check cache stats
-        stats = real_cache_service.get_cache_stats()
-
-        assert stats["size"] > 0, "Cache should have entries"
-        # Note: hits/misses tracking depends on implementation
-
     def test_modification_time_based_invalidation(
         self,
         real_sheets_service: GoogleSheetsService,
         real_cache_service: SheetsCacheService,
         test_spreadsheet_id: str,
-        wait_for_api_rate_limit,
     ):
         """Test that cache is invalidated based on modification time."""
         # Write initial data and cache it
@@ -269,9 +232,6 @@ class TestSheetsCacheIntegration:
             spreadsheet_id=test_spreadsheet_id, range_name="Sheet1!A1:B2"
         )
 
-        # Wait to ensure modification time will be different
-        wait_for_api_rate_limit(2.0)
-
         # Modify the data
         modified_data = [["Version", "2"], ["Data", "Modified"]]
 
@@ -281,9 +241,6 @@ class TestSheetsCacheIntegration:
             values=modified_data,
         )
 
-        # Wait for modification time to update
-        wait_for_api_rate_limit(2.0)
-
         # Read again - should get fresh data (cache invalidated)
         data2 = real_sheets_service.read_sheet_data(
             spreadsheet_id=test_spreadsheet_id, range_name="Sheet1!A1:B2"
@@ -300,35 +257,63 @@ class TestSheetsCacheIntegration:
 class TestSheetsErrorHandling:
     """Test error handling and edge cases with real API."""
 
-    def test_invalid_spreadsheet_id(
+    def test_permission_error_handling(
         self,
         real_sheets_service: GoogleSheetsService,
     ):
+        """Test handling of permission errors."""
+        # Try to access a spreadsheet we don't have permission for
+        # This should raise an appropriate exception
+        # Note: This test requires a known spreadsheet ID without permissions
+        # Skip if not available
+        pytest.skip("Requires a test spreadsheet without permissions")
+
+
+class TestSheetsLibraryBehavior:
+    """
+    Library and cache behavior checked against a mocked Sheets service.
+
+    These tests do not depend on Google Sheets semantics, so they avoid the
+    network round trip and run without credentials.
+    """
+
+    def test_empty_sheet_handling(self, mock_sheets_service, mock_spreadsheet_id):
+        """Test reading from an empty sheet."""
+        # Try to read from a range that doesn't exist yet
+        data = mock_sheets_service.read_sheet_data(
+            spreadsheet_id=mock_spreadsheet_id, range_name="Sheet1!Z100:Z200"
+        )
+
+        # Should return empty list, not error
+        assert isinstance(data, list)
+        assert len(data) == 0
+
+    def test_invalid_spreadsheet_id(self, mock_sheets_service):
         """Test handling of invalid spreadsheet ID."""
-        with pytest.raises(Exception):
-            real_sheets_service.read_sheet_data(
+        with pytest.raises(HttpError):
+            mock_sheets_service.read_sheet_data(
                 spreadsheet_id="invalid_id_12345", range_name="Sheet1!A1:B2"
             )
 
-    def test_invalid_range(
-        self,
-        real_sheets_service: GoogleSheetsService,
-        test_spreadsheet_id: str,
-    ):
+    def test_invalid_range(self, mock_sheets_service, mock_spreadsheet_id):
         """Test handling of invalid range specification."""
-        # Invalid range format should be handled gracefully or raise clear error
-        with pytest.raises((ValueError, Exception)):
-            real_sheets_service.read_sheet_data(
-                spreadsheet_id=test_spreadsheet_id, range_name="InvalidRange!!!"
+        with pytest.raises(HttpError):
+            mock_sheets_service.read_sheet_data(
+                spreadsheet_id=mock_spreadsheet_id, range_name="InvalidRange!!!"
             )
 
-    def test_permission_error_handling(
-        self,
-        real_sheets_service: GoogleSheetsService,
+    def test_cache_stats_tracking(
+        self, mock_cache_service: SheetsCacheService, mock_spreadsheet_id
     ):
-        """Test handling of permission errors."""
-        # Try to access a spreadsheet we don't have permission for
-        # This should raise an appropriate exception
-        # Note: This test requires a known spreadsheet ID without permissions
-        # Skip if not available
-        pytest.skip("Requires a test spreadsheet without permissions")
+        """Test that cache statistics are properly tracked."""
+        # First read - cache miss
+        mock_cache_service.read_sheet_cached(mock_spreadsheet_id, "Sheet1!A1:B2")
+
+        # Second read - cache hit
+        mock_cache_service.read_sheet_cached(mock_spreadsheet_id, "Sheet1!A1:B2")
+
+        stats = mock_cache_service.get_cache_statistics()
+
+        assert stats["current_cache_size"] == 1, "Cache should have one entry"
+        assert stats["api_calls"] == 1
+        assert stats["memory_hits"] == 1
@@ -2,21 +2,53 @@
 Integration tests for project setup and infrastructure.
 """
 
+import configparser
 import importlib
+import importlib.util
+import os
+import stat
 import sys
 from pathlib import Path
+from typing import Dict
 
 import pytest
 
 from src.config import get_config
 
 
+def _read_pytest_ini(project_root: Path) -> configparser.SectionProxy:
+    """Return the pytest section of the project's pytest.ini."""
+    parser = configparser.ConfigParser()
+    parser.read(project_root / "pytest.ini")
+    section = "pytest" if parser.has_section("pytest") else "tool:pytest"
+    return parser[section]
+
+
+# Directories that never hold project structure and are not worth walking
+_SKIPPED_DIRS = {".git", ".venv", "venv", "__pycache__", "htmlcov", ".pytest_cache"}
+
+
+@pytest.fixture(scope="session")
+def project_tree() -> Dict[str, os.stat_result]:
+    """Stat results for every project path, keyed by POSIX path from the root."""
+    project_root = Path(__file__).parent.parent.parent
+    tree = {}
+
+    # One walk serves all structure checks instead of a stat call per path
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = [name for name in dirnames if name not in _SKIPPED_DIRS]
+        for name in dirnames + filenames:
+            path = Path(dirpath, name)
+            tree[path.relative_to(project_root).as_posix()] = path.stat()
+
+    return tree
+
+
 class TestProjectStructure:
     """Test that project structure is correctly set up."""
 
-    def test_all_directories_exist(self):
+    def test_all_directories_exist(self, project_tree):
         """Test that all required directories exist."""
-        project_root = Path(__file__).parent.parent.parent
 
         required_dirs = [
             "src",
@@ -36,14 +68,13 @@ class TestProjectStructure:
         ]
 
         for dir_path in required_dirs:
-            assert (
-                project_root / dir_path
-            ).exists(), f"Directory {dir_path} does not exist"
-            assert (project_root / dir_path).is_dir(), f"{dir_path} is not a directory"
+            assert dir_path in project_tree, f"Directory {dir_path} does not exist"
+            assert stat.S_ISDIR(
+                project_tree[dir_path].st_mode
+            ), f"{dir_path} is not a directory"
 
-    def test_python_packages_have_init_files(self):
+    def test_python_packages_have_init_files(self, project_tree):
         """Test that all Python packages have __init__.py files."""
-        project_root = Path(__file__).parent.parent.parent
 
         package_dirs = [
             "src",
@@ -61,12 +92,11 @@ class TestProjectStructure:
         ]
 
         for package_dir in package_dirs:
-            init_file = project_root / package_dir / "__init__.py"
-            assert init_file.exists(), f"Missing __init__.py in {package_dir}"
+            init_file = f"{package_dir}/__init__.py"
+            assert init_file in project_tree, f"Missing __init__.py in {package_dir}"
 
-    def test_required_config_files_exist(self):
+    def test_required_config_files_exist(self, project_tree):
         """Test that required configuration files exist."""
-        project_root = Path(__file__).parent.parent.parent
 
         required_files = [
             "requirements.txt",
@@ -84,9 +114,11 @@ class TestProjectStructure:
 
         for file_path in required_files:
             assert (
-                project_root / file_path
-            ).exists(), f"Required file {file_path} does not exist"
-            assert (project_root / file_path).is_file(), f"{file_path} is not a file"
+                file_path in project_tree
+            ), f"Required file {file_path} does not exist"
+            assert stat.S_ISREG(
+                project_tree[file_path].st_mode
+            ), f"{file_path} is not a file"
 
 
 class TestImportStructure:
@@ -195,26 +227,29 @@ class TestDevelopmentWorkflow:
 
     def test_pytest_configuration(self):
         """Test that pytest is configured correctly."""
+        # Check the configuration statically instead of re-entering pytest
+        project_root = Path(__file__).parent.parent.parent
+        pytest_config = _read_pytest_ini(project_root)
+
         # Check that pytest can find tests
-        pytest_config = pytest.main(["--collect-only", "-q"])
-        assert pytest_config == 0, "Pytest test collection failed"
+        pattern = pytest_config["python_files"]
+        for test_path in pytest_config["testpaths"].split():
+            test_dir = project_root / test_path
+            assert test_dir.is_dir(), f"testpaths entry {test_path} does not exist"
+            assert any(test_dir.rglob(pattern)), f"No {pattern} files in {test_path}"
 
     def test_coverage_configuration(self):
         """Test that coverage is configured correctly."""
-        # This test runs pytest with coverage to ensure it's working
-        test_path = (
-            "tests/unit/test_config.py::TestBillingSystemConfig::"
-            "test_config_with_valid_env_vars"
-        )
-        exit_code = pytest.main(
-            [
-                "--cov=src",
-                "--cov-report=term",
-                test_path,
-                "-v",
-            ]
-        )
-        assert exit_code == 0, "Coverage testing failed"
+        # Check the plugin and options instead of running a coverage session
+        project_root = Path(__file__).parent.parent.parent
+        pytest_config = _read_pytest_ini(project_root)
+
+        for module in ["coverage", "pytest_cov"]:
+            assert (
+                importlib.util.find_spec(module) is not None
+            ), f"{module} is not installed"
+
+        assert "--cov=src" in pytest_config["addopts"].split()
 
     def test_import_paths_work_from_project_root(self):
         """Test that imports work correctly from project root."""
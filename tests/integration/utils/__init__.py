@@ -5,13 +5,29 @@ This package provides utilities for:
 - Test data generation
 - Cleanup of test artifacts
 - Performance measurement helpers
+- Fast whole-table comparisons
 """
 
+from .assertions import rows_digest
 from .cleanup import cleanup_test_spreadsheets
-from .test_data_generator import generate_large_timesheet_data, generate_test_timesheet
+from .test_data_generator import (
+    generate_large_timesheet_data,
+    generate_large_timesheet_dataframe,
+    generate_test_timesheet,
+    generate_test_timesheet_iter,
+    generate_value_grid,
+    set_seed,
+    write_large_timesheet_csv,
+)
 
 __all__ = [
     "generate_test_timesheet",
+    "generate_test_timesheet_iter",
     "generate_large_timesheet_data",
+    "generate_large_timesheet_dataframe",
+    "generate_value_grid",
+    "write_large_timesheet_csv",
+    "set_seed",
     "cleanup_test_spreadsheets",
+    "rows_digest",
 ]
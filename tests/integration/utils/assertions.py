@@ -0,0 +1,38 @@
+"""
+Assertion helpers for integration tests.
+
+Comparing thousands of rows cell by cell in Python is slow; these helpers
+reduce a table to a short digest so large round trips can be checked in full
+with a single comparison.
+"""
+
+from hashlib import blake2b
+from typing import Any, Iterable, List
+
+# ASCII unit and record separators cannot appear in generated test values
+_CELL_SEPARATOR = "\x1f"
+_ROW_SEPARATOR = "\x1e"
+
+
+def rows_digest(rows: Iterable[List[Any]]) -> bytes:
+    """
+    Compute a digest of a table's contents.
+
+    Two tables have the same digest exactly when they have the same rows with
+    the same cell values (compared as strings), in the same order.
+
+    Args:
+        rows: Table rows, one list of cell values per row
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the table
+
+    Example:
+        >>> rows_digest([["a", "b"]]) == rows_digest([["a", "b"]])
+        True
+    """
+    digest = blake2b(digest_size=16)
+    for row in rows:
+        line = _CELL_SEPARATOR.join(map(str, row)) + _ROW_SEPARATOR
+        digest.update(line.encode())
+    return digest.digest()
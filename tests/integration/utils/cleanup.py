@@ -9,20 +9,49 @@ integration testing, including:
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
 
 from src.config import BillingSystemConfig
 from src.services import GoogleDriveService
 
 logger = logging.getLogger(__name__)
 
+# Concurrent trash requests when falling back from the batch endpoint
+_MAX_TRASH_WORKERS = 10
+
+# Drive services shared across cleanup calls, matched by config identity.
+# Configs are unhashable pydantic models, so they are compared with "is"
+# rather than used as dict keys; holding the config keeps the match valid.
+_drive_services: List[Tuple[BillingSystemConfig, GoogleDriveService]] = []
+
+
+def _drive_service_for(config: BillingSystemConfig) -> GoogleDriveService:
+    """
+    Return the shared Drive service for a configuration, creating it once.
+
+    Args:
+        config: Billing system configuration
+
+    Returns:
+        GoogleDriveService: Service built from the configuration
+    """
+    for cached_config, drive_service in _drive_services:
+        if cached_config is config:
+            return drive_service
+
+    drive_service = GoogleDriveService(config=config)
+    _drive_services.append((config, drive_service))
+    return drive_service
+
 
 def cleanup_test_spreadsheets(
     config: BillingSystemConfig,
     folder_id: Optional[str] = None,
     prefix: str = "Integration Test",
     older_than_hours: int = 24,
+    drive_service: Optional[GoogleDriveService] = None,
 ) -> int:
     """
     Clean up old test spreadsheets from Google Drive.
@@ -37,6 +66,7 @@ def cleanup_test_spreadsheets(
         folder_id: Optional folder ID to search in (default: monthly invoicing folder)
         prefix: Title prefix to identify test files (default: "Integration Test")
         older_than_hours: Only delete files older than this many hours (default: 24)
+        drive_service: Drive service to use (default: shared service for config)
 
     Returns:
         int: Number of files cleaned up
@@ -46,94 +76,121 @@ def cleanup_test_spreadsheets(
         >>> count = cleanup_test_spreadsheets(config, older_than_hours=1)
         >>> print(f"Cleaned up {count} test files")
     """
-    drive_service = GoogleDriveService(config=config)
+    drive_service = drive_service or _drive_service_for(config)
 
     # Use monthly invoicing folder if not specified
     if folder_id is None:
         folder_id = config.monthly_invoicing_folder_id
 
-    # Search for test files
-    query = f"name contains '{prefix}' and '{folder_id}' in parents and trashed=false"
+    # Let Drive filter by name and age so only files to trash are returned
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=older_than_hours)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+    query = f"name contains '{prefix}' and modifiedTime < '{cutoff}'"
+
+    # The service may be shared and cache folder listings; a cached listing
+    # could still contain files an earlier cleanup already trashed
+    drive_service.clear_cache()
 
     try:
-        files = drive_service.list_files_in_folder(
-            folder_id=folder_id, query_filter=query
+        files_to_delete = drive_service.list_files_in_folder(
+            folder_id=folder_id,
+            query_filter=query,
+            fields="nextPageToken, files(id, name)",
         )
     except Exception as e:
         logger.error(f"Failed to list files for cleanup: {e}")
         return 0
 
-    # Filter by age
-    cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
-    files_to_delete = []
-
-    for file in files:
-        # Parse modified time
-        try:
-            modified_time = datetime.fromisoformat(
-                file.get("modifiedTime", "").replace("Z", "+00:00")
-            )
-            if modified_time.replace(tzinfo=None) < cutoff_time:
-                files_to_delete.append(file)
-        except (ValueError, AttributeError) as e:
-            logger.warning(
-                f"Failed to parse modified time for file {file.get('id')}: {e}"
-            )
-            continue
-
-    # Delete old test files
-    deleted_count = 0
-    for file in files_to_delete:
-        try:
-            drive_service.trash_file(file["id"])
-            logger.info(f"Trashed test file: {file.get('name')} ({file['id']})")
-            deleted_count += 1
-        except Exception as e:
-            logger.error(f"Failed to trash file {file['id']}: {e}")
-
-    return deleted_count
+    # Trash old test files in batched requests
+    try:
+        return drive_service.batch_trash_files([file["id"] for file in files_to_delete])
+    except Exception as e:
+        logger.error(f"Failed to trash test files: {e}")
+        return 0
 
 
-def cleanup_file_list(config: BillingSystemConfig, file_ids: List[str]) -> int:
+def cleanup_file_list(
+    config: BillingSystemConfig,
+    file_ids: List[str],
+    drive_service: Optional[GoogleDriveService] = None,
+) -> int:
     """
     Clean up a list of files by ID.
 
+    Files are trashed with batched requests. If the batch endpoint cannot be
+    used, they are trashed one by one on a bounded thread pool instead.
+
     Args:
         config: Billing system configuration
         file_ids: List of Google Drive file IDs to trash
+        drive_service: Drive service to use (default: shared service for config)
 
     Returns:
         int: Number of files successfully cleaned up
     """
-    drive_service = GoogleDriveService(config=config)
+    drive_service = drive_service or _drive_service_for(config)
+
+    try:
+        return drive_service.batch_trash_files(file_ids)
+    except Exception as e:
+        logger.warning(f"Batch trash failed, trashing files individually: {e}")
+
+    return _trash_files_concurrently(drive_service, file_ids)
+
+
+def _trash_files_concurrently(
+    drive_service: GoogleDriveService, file_ids: List[str]
+) -> int:
+    """
+    Trash files one request per file, several requests in flight at a time.
+
+    Args:
+        drive_service: Drive service to trash the files with
+        file_ids: List of Google Drive file IDs to trash
+
+    Returns:
+        int: Number of files successfully trashed
+    """
     deleted_count = 0
 
-    for file_id in file_ids:
-        try:
-            drive_service.trash_file(file_id)
-            logger.info(f"Trashed file: {file_id}")
-            deleted_count += 1
-        except Exception as e:
-            logger.error(f"Failed to trash file {file_id}: {e}")
+    with ThreadPoolExecutor(max_workers=_MAX_TRASH_WORKERS) as executor:
+        futures = {
+            executor.submit(drive_service.trash_file, file_id): file_id
+            for file_id in file_ids
+        }
+        for future in as_completed(futures):
+            file_id = futures[future]
+            try:
+                future.result()
+                logger.info(f"Trashed file: {file_id}")
+                deleted_count += 1
+            except Exception as e:
+                logger.error(f"Failed to trash file {file_id}: {e}")
 
     return deleted_count
 
 
-def verify_file_deleted(config: BillingSystemConfig, file_id: str) -> bool:
+def verify_file_deleted(
+    config: BillingSystemConfig,
+    file_id: str,
+    drive_service: Optional[GoogleDriveService] = None,
+) -> bool:
     """
     Verify that a file has been successfully deleted/trashed.
 
     Args:
         config: Billing system configuration
         file_id: Google Drive file ID to check
+        drive_service: Drive service to use (default: shared service for config)
 
     Returns:
         bool: True if file is trashed or doesn't exist, False otherwise
     """
-    drive_service = GoogleDriveService(config=config)
+    drive_service = drive_service or _drive_service_for(config)
 
     try:
-        file_metadata = drive_service.get_file_metadata(file_id)
+        file_metadata = drive_service.get_file_metadata(file_id, fields="trashed")
         return file_metadata.get("trashed", False)
     except Exception:
         # File doesn't exist or is inaccessible - consider it deleted
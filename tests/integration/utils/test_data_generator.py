@@ -7,9 +7,314 @@ This module provides utilities to generate realistic test data for:
 - Edge cases (overnight shifts, year boundaries, etc.)
 """
 
-import random
-from datetime import date, timedelta
-from typing import Any, List, Tuple
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Shared, immutable choice tables; built once instead of on every call
+_TIMESHEET_HEADERS = (
+    "Date",
+    "Project",
+    "Location",
+    "Start Time",
+    "End Time",
+    "Topics worked on",
+    "Break",
+    "Travel time",
+)
+_PROJECT_TERMS_HEADERS = (
+    "Project",
+    "Consultant_ID",
+    "Name",
+    "Rate",
+    "Cost",
+    "Share of travel as work",
+    "surcharge for travel",
+)
+_PROJECT_CODES = ("P&C_NEWRETAIL", "PROJECT_ALPHA", "PROJECT_BETA", "CONSULTING_GAMMA")
+# Pre-formatted 1-based labels; larger indices are formatted on demand
+_LABEL_TABLE_SIZE = 1000
+_FREELANCER_NAMES = tuple(
+    f"Freelancer_{i:03d}" for i in range(1, _LABEL_TABLE_SIZE + 1)
+)
+_CONSULTANT_IDS = tuple(f"C{i:03d}" for i in range(1, _LABEL_TABLE_SIZE + 1))
+_TERMS_FREELANCER_NAMES = _FREELANCER_NAMES[:10]
+_TOPICS = (
+    "Development work",
+    "Client meeting",
+    "Code review",
+    "Testing",
+    "Documentation",
+    "Workshop",
+    "Planning",
+)
+_START_TIMES = ("08:00", "09:00", "10:00")
+_END_TIMES = ("17:00", "18:00", "19:00")
+_BREAK_TIMES = ("00:30", "00:45", "01:00")
+_TRAVEL_TIMES = ("00:00", "01:00", "01:30", "02:00")
+_TRAVEL_SHARES = (0.5, 0.75, 1.0)
+_TRAVEL_SURCHARGES = (0.10, 0.15, 0.20)
+_TRIP_TERMS_ROWS = (
+    ("Location", "Trip Duration", "Trip Reimbursement"),
+    ("Paris On-site", "1", "450"),
+    ("Paris On-site", "2", "650"),
+    ("Paris On-site", "3", "850"),
+    ("Paris On-site", "4", "1000"),
+    ("Berlin On-site", "1", "400"),
+    ("Berlin On-site", "2", "600"),
+    ("London On-site", "1", "500"),
+    ("London On-site", "2", "700"),
+)
+
+
+# Shared stream for calls without an explicit seed; see set_seed()
+_RNG = np.random.default_rng(
+    int(os.environ["TEST_DATA_SEED"]) if "TEST_DATA_SEED" in os.environ else None
+)
+
+
+def set_seed(seed: Optional[int]) -> None:
+    """
+    Reseed the shared generator used by calls that pass no seed.
+
+    Makes a whole test run reproducible from one entry point; the
+    TEST_DATA_SEED environment variable sets the initial seed.
+
+    Args:
+        seed: New seed, or None for fresh OS entropy
+    """
+    global _RNG
+    _RNG = np.random.default_rng(seed)
+
+
+def _resolve_rng(
+    seed: Optional[Union[int, np.random.Generator]],
+) -> np.random.Generator:
+    """
+    Return the generator to draw from for ``seed``.
+
+    Args:
+        seed: Explicit seed or generator, or None for the shared generator
+
+    Returns:
+        np.random.Generator: Generator for ``seed``
+    """
+    return _RNG if seed is None else np.random.default_rng(seed)
+
+
+def _freelancer_seeds(seed: Optional[int], count: int) -> List[int]:
+    """
+    Derive independent per-freelancer seeds from one seed sequence.
+
+    Args:
+        seed: Base seed, or None to draw one from the shared generator
+        count: Number of freelancer seeds to derive
+
+    Returns:
+        List[int]: One seed per freelancer
+    """
+    if seed is None:
+        seed = int(_RNG.integers(2**63))
+    return np.random.SeedSequence(seed).generate_state(count).tolist()
+
+
+def _numbered_labels(table: Tuple[str, ...], prefix: str, count: int) -> List[str]:
+    """
+    Return the first ``count`` ``{prefix}{n:03d}`` labels (1-based).
+
+    Labels come from the pre-formatted ``table`` and are only formatted for
+    positions beyond its end.
+
+    Args:
+        table: Pre-formatted labels for the same prefix
+        prefix: Label prefix, e.g. ``"C"`` or ``"Freelancer_"``
+        count: Number of labels to return
+
+    Returns:
+        List[str]: Labels for positions 1 to ``count``
+    """
+    labels = list(table[:count])
+    labels.extend(f"{prefix}{i + 1:03d}" for i in range(len(labels), count))
+    return labels
+
+
+def _expand_trip_runs(trip_starts: np.ndarray, trip_lengths: np.ndarray) -> np.ndarray:
+    """
+    Mark the days covered by trips.
+
+    A trip starting on day ``i`` covers that day and the following
+    ``trip_lengths[i]`` days; starts that fall inside a running trip are
+    ignored. The scan jumps from trip to trip with ``searchsorted`` instead
+    of stepping through every day.
+
+    Args:
+        trip_starts: Boolean mask of days on which a trip may start
+        trip_lengths: Extra on-site days for a trip starting on each day
+
+    Returns:
+        np.ndarray: Boolean mask of days spent on a trip
+    """
+    covered = np.zeros(len(trip_starts), dtype=bool)
+    starts = np.flatnonzero(trip_starts)
+
+    k = 0
+    while k < len(starts):
+        start = starts[k]
+        end = start + trip_lengths[start] + 1
+        covered[start:end] = True
+        k = np.searchsorted(starts, end)  # First start after this trip
+
+    return covered
+
+
+def _sample_timesheet_columns(
+    rng: np.random.Generator,
+    start_date: date,
+    num_entries: int,
+    include_overnight: bool,
+    include_weekends: bool,
+    include_trips: bool,
+) -> Dict[str, np.ndarray]:
+    """
+    Sample every timesheet column except Project as a NumPy array.
+
+    Each column is drawn with a single call on ``rng``; row-wise and
+    columnar generators both build on this.
+
+    Args:
+        rng: NumPy generator to draw from
+        start_date: Date of the first entry
+        num_entries: Number of timesheet entries to generate
+        include_overnight: Include overnight shift scenarios
+        include_weekends: Include weekend work
+        include_trips: Include consecutive on-site days (trips)
+
+    Returns:
+        Dict[str, np.ndarray]: Column arrays keyed by timesheet header; dates
+        are ``datetime64[D]``
+    """
+    n = num_entries
+
+    # Determine locations; 30% of days start a 2-4 day trip when enabled
+    on_site = rng.random(n) >= 0.7
+    if include_trips:
+        trip_starts = rng.random(n) < 0.3
+        trip_lengths = rng.integers(2, 5, size=n)
+        on_site |= _expand_trip_runs(trip_starts, trip_lengths)
+    locations = np.where(on_site, "On-site", "Off-site")
+
+    # Generate realistic work times (10% overnight shifts when enabled)
+    start_times = rng.choice(_START_TIMES, size=n)
+    end_times = rng.choice(_END_TIMES, size=n)
+    if include_overnight:
+        overnight = rng.random(n) < 0.1
+        start_times = np.where(overnight, "22:00", start_times)
+        end_times = np.where(overnight, "06:00", end_times)  # Next day
+
+    # Generate break and travel time (travel only for on-site days)
+    break_times = rng.choice(_BREAK_TIMES, size=n)
+    travel_times = np.where(on_site, rng.choice(_TRAVEL_TIMES, size=n), "00:00")
+
+    # Generate topics
+    topics = rng.choice(_TOPICS, size=n)
+
+    # Calendar dates for all entries at once (business days unless weekends)
+    if include_weekends:
+        dates = np.datetime64(start_date, "D") + np.arange(n)
+    else:
+        dates = np.busday_offset(start_date, np.arange(n), roll="forward")
+
+    return {
+        "Date": dates,
+        "Location": locations,
+        "Start Time": start_times,
+        "End Time": end_times,
+        "Topics worked on": topics,
+        "Break": break_times,
+        "Travel time": travel_times,
+    }
+
+
+def generate_test_timesheet_iter(
+    freelancer_name: str = "Test Freelancer",
+    project_code: str = "P&C_NEWRETAIL",
+    start_date: date = None,
+    num_entries: int = 20,
+    include_overnight: bool = False,
+    include_weekends: bool = False,
+    include_trips: bool = False,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> Iterator[List[Any]]:
+    """
+    Stream a realistic test timesheet row by row.
+
+    Yields the header row followed by one row per entry, so callers that
+    write incrementally (e.g. to CSV) never hold the whole timesheet in
+    memory. All random choices are sampled up front as NumPy arrays (one
+    draw per column), so large timesheets avoid per-row RNG calls.
+
+    Args:
+        freelancer_name: Name of the freelancer
+        project_code: Project code for entries
+        start_date: Start date for timesheet (defaults to current month)
+        num_entries: Number of timesheet entries to generate
+        include_overnight: Include overnight shift scenarios
+        include_weekends: Include weekend work
+        include_trips: Include consecutive on-site days (trips)
+        seed: Optional random seed or NumPy generator for reproducible data
+
+    Yields:
+        List[Any]: Header row, then one timesheet entry per row
+    """
+    if start_date is None:
+        start_date = date.today().replace(day=1)
+
+    columns = _sample_timesheet_columns(
+        _resolve_rng(seed),
+        start_date,
+        num_entries,
+        include_overnight,
+        include_weekends,
+        include_trips,
+    )
+
+    yield list(_TIMESHEET_HEADERS)
+
+    for (
+        entry_date,
+        location,
+        start_time,
+        end_time,
+        topic,
+        break_time,
+        travel_time,
+    ) in zip(
+        np.datetime_as_string(columns["Date"], unit="D").tolist(),
+        columns["Location"].tolist(),
+        columns["Start Time"].tolist(),
+        columns["End Time"].tolist(),
+        columns["Topics worked on"].tolist(),
+        columns["Break"].tolist(),
+        columns["Travel time"].tolist(),
+    ):
+        yield [
+            entry_date,
+            project_code,
+            location,
+            start_time,
+            end_time,
+            topic,
+            break_time,
+            travel_time,
+        ]
 
 
 def generate_test_timesheet(
@@ -20,10 +325,14 @@ def generate_test_timesheet(
     include_overnight: bool = False,
     include_weekends: bool = False,
     include_trips: bool = False,
+    seed: Optional[Union[int, np.random.Generator]] = None,
 ) -> List[List[Any]]:
     """
     Generate a realistic test timesheet with various scenarios.
 
+    Materializes generate_test_timesheet_iter(); use the iterator directly
+    when the rows are consumed one at a time.
+
     Args:
         freelancer_name: Name of the freelancer
         project_code: Project code for entries
@@ -32,135 +341,274 @@ def generate_test_timesheet(
         include_overnight: Include overnight shift scenarios
         include_weekends: Include weekend work
         include_trips: Include consecutive on-site days (trips)
+        seed: Optional random seed or NumPy generator for reproducible data
 
     Returns:
         List[List[Any]]: Timesheet data with headers and entries
     """
-    if start_date is None:
-        start_date = date.today().replace(day=1)
+    return list(
+        generate_test_timesheet_iter(
+            freelancer_name=freelancer_name,
+            project_code=project_code,
+            start_date=start_date,
+            num_entries=num_entries,
+            include_overnight=include_overnight,
+            include_weekends=include_weekends,
+            include_trips=include_trips,
+            seed=seed,
+        )
+    )
 
-    headers = [
-        "Date",
-        "Project",
-        "Location",
-        "Start Time",
-        "End Time",
-        "Topics worked on",
-        "Break",
-        "Travel time",
-    ]
 
-    data = [headers]
-    current_date = start_date
-
-    # Generate entries
-    trip_days = 0  # Track consecutive on-site days for trips
-    for i in range(num_entries):
-        # Skip weekends unless include_weekends is True
-        while current_date.weekday() >= 5 and not include_weekends:
-            current_date += timedelta(days=1)
-
-        # Determine location
-        if include_trips and trip_days > 0:
-            location = "On-site"
-            trip_days -= 1
-        elif include_trips and random.random() < 0.3:  # 30% chance to start a trip
-            location = "On-site"
-            trip_days = random.randint(2, 4)  # 2-4 day trips
-        else:
-            location = "Off-site" if random.random() < 0.7 else "On-site"
-
-        # Generate realistic work times
-        if include_overnight and random.random() < 0.1:  # 10% overnight shifts
-            start_time = "22:00"
-            end_time = "06:00"  # Next day
-        else:
-            start_hour = random.choice([8, 9, 10])
-            end_hour = random.choice([17, 18, 19])
-            start_time = f"{start_hour:02d}:00"
-            end_time = f"{end_hour:02d}:00"
-
-        # Generate break and travel time
-        break_minutes = random.choice([30, 45, 60])
-        break_time = f"00:{break_minutes:02d}" if break_minutes < 60 else "01:00"
-
-        travel_minutes = random.choice([0, 60, 90, 120]) if location == "On-site" else 0
-        travel_time = (
-            f"{travel_minutes // 60:02d}:{travel_minutes % 60:02d}"
-            if travel_minutes > 0
-            else "00:00"
-        )
+def _draw_freelancer(index: int, rng: np.random.Generator) -> Tuple[str, str]:
+    """
+    Name a generated freelancer and draw their project.
 
-        # Generate topics
-        topics = random.choice(
-            [
-                "Development work",
-                "Client meeting",
-                "Code review",
-                "Testing",
-                "Documentation",
-                "Workshop",
-                "Planning",
-            ]
-        )
+    Args:
+        index: Zero-based freelancer index
+        rng: The freelancer's own random stream
 
-        data.append(
-            [
-                current_date.strftime("%Y-%m-%d"),
-                project_code,
-                location,
-                start_time,
-                end_time,
-                topics,
-                break_time,
-                travel_time,
-            ]
-        )
+    Returns:
+        Tuple[str, str]: (freelancer_name, project_code)
+    """
+    freelancer_name = (
+        _FREELANCER_NAMES[index]
+        if index < _LABEL_TABLE_SIZE
+        else f"Freelancer_{index + 1:03d}"
+    )
+    return freelancer_name, str(rng.choice(_PROJECT_CODES))
 
-        current_date += timedelta(days=1)
 
-    return data
+def _generate_freelancer_timesheet(
+    index: int, seed: int, num_entries: int
+) -> Tuple[str, List[List[Any]]]:
+    """
+    Generate one freelancer's timesheet from its own random stream.
+
+    Module-level so that it can be pickled for worker processes.
+
+    Args:
+        index: Zero-based freelancer index
+        seed: Seed for this freelancer's random stream
+        num_entries: Number of timesheet entries to generate
+
+    Returns:
+        Tuple[str, List[List[Any]]]: (freelancer_name, timesheet_data)
+    """
+    rng = np.random.default_rng(seed)
+    freelancer_name, project = _draw_freelancer(index, rng)
+
+    timesheet_data = generate_test_timesheet(
+        freelancer_name=freelancer_name,
+        project_code=project,
+        num_entries=num_entries,
+        include_overnight=True,
+        include_trips=True,
+        seed=rng,
+    )
+
+    return freelancer_name, timesheet_data
 
 
 def generate_large_timesheet_data(
-    num_freelancers: int = 30, entries_per_freelancer: int = 300
+    num_freelancers: int = 30,
+    entries_per_freelancer: int = 300,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> List[Tuple[str, List[List[Any]]]]:
     """
     Generate large dataset for performance testing.
 
     This generates data similar to production volumes (30 freelancers,
-    ~300 entries each = ~9000 total rows).
+    ~300 entries each = ~9000 total rows). Freelancers are independent, so
+    they are generated in parallel worker processes, each with its own
+    deterministic random stream.
 
     Args:
         num_freelancers: Number of freelancers to generate data for
         entries_per_freelancer: Number of entries per freelancer
+        seed: Optional random seed for reproducible data
+        max_workers: Maximum number of worker processes (default: CPU count)
 
     Returns:
         List[Tuple[str, List[List[Any]]]]: List of (freelancer_name, timesheet_data)
     """
-    datasets = []
-    project_codes = [
-        "P&C_NEWRETAIL",
-        "PROJECT_ALPHA",
-        "PROJECT_BETA",
-        "CONSULTING_GAMMA",
-    ]
+    seeds = _freelancer_seeds(seed, num_freelancers)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                _generate_freelancer_timesheet,
+                range(num_freelancers),
+                seeds,
+                [entries_per_freelancer] * num_freelancers,
+                chunksize=4,
+            )
+        )
 
-    for i in range(num_freelancers):
-        freelancer_name = f"Freelancer_{i + 1:03d}"
-        project = random.choice(project_codes)
 
-        timesheet_data = generate_test_timesheet(
-            freelancer_name=freelancer_name,
-            project_code=project,
-            num_entries=entries_per_freelancer,
-            include_overnight=True,
-            include_trips=True,
-        )
+def _generate_freelancer_frame(index: int, seed: int, num_entries: int) -> pd.DataFrame:
+    """
+    Generate one freelancer's timesheet as a DataFrame.
 
-        datasets.append((freelancer_name, timesheet_data))
+    Draws from ``seed`` exactly like _generate_freelancer_timesheet, so both
+    produce the same entries for the same seed.
 
-    return datasets
+    Args:
+        index: Zero-based freelancer index
+        seed: Seed for this freelancer's random stream
+        num_entries: Number of timesheet entries to generate
+
+    Returns:
+        pd.DataFrame: Timesheet entries with a leading Freelancer column
+    """
+    rng = np.random.default_rng(seed)
+    freelancer_name, project = _draw_freelancer(index, rng)
+
+    columns = _sample_timesheet_columns(
+        rng,
+        date.today().replace(day=1),
+        num_entries,
+        include_overnight=True,
+        include_weekends=False,
+        include_trips=True,
+    )
+
+    frame = pd.DataFrame(columns)
+    frame.insert(0, "Project", project)
+    frame.insert(0, "Freelancer", freelancer_name)
+    return frame
+
+
+def generate_large_timesheet_dataframe(
+    num_freelancers: int = 30,
+    entries_per_freelancer: int = 300,
+    seed: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Generate the large performance dataset as a single columnar DataFrame.
+
+    Same entries as generate_large_timesheet_data() for the same seed, but
+    built straight from the sampled column arrays instead of per-row Python
+    lists. Dates are ``datetime64[ns]``; the low-cardinality Freelancer,
+    Project and Location columns are categoricals.
+
+    Args:
+        num_freelancers: Number of freelancers to generate data for
+        entries_per_freelancer: Number of entries per freelancer
+        seed: Optional random seed for reproducible data
+
+    Returns:
+        pd.DataFrame: One row per entry, Freelancer column followed by the
+        timesheet headers
+    """
+    seeds = _freelancer_seeds(seed, num_freelancers)
+
+    frame = pd.concat(
+        [
+            _generate_freelancer_frame(index, freelancer_seed, entries_per_freelancer)
+            for index, freelancer_seed in enumerate(seeds)
+        ],
+        ignore_index=True,
+    )
+    frame["Date"] = frame["Date"].astype("datetime64[ns]")
+    for column in ("Freelancer", "Project", "Location"):
+        frame[column] = frame[column].astype("category")
+
+    return frame[["Freelancer", *_TIMESHEET_HEADERS]]
+
+
+def write_large_timesheet_csv(
+    path: Union[str, Path],
+    num_freelancers: int = 30,
+    entries_per_freelancer: int = 300,
+    seed: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> int:
+    """
+    Stream the large performance dataset straight into a CSV file.
+
+    Rows are generated per freelancer and written ``chunk_size`` at a time
+    through a 1 MiB write buffer, so memory stays bounded by one freelancer's
+    columns however large the dataset. Uses the same seeding as
+    generate_large_timesheet_data(), so the entries match for a given seed.
+
+    Args:
+        path: Destination CSV file (overwritten)
+        num_freelancers: Number of freelancers to generate data for
+        entries_per_freelancer: Number of entries per freelancer
+        seed: Optional random seed for reproducible data
+        chunk_size: Number of rows passed to each writerows() call
+
+    Returns:
+        int: Number of data rows written (excluding the header)
+    """
+    seeds = _freelancer_seeds(seed, num_freelancers)
+    rows_written = 0
+
+    with open(path, "w", newline="", buffering=1 << 20) as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["Freelancer", *_TIMESHEET_HEADERS])
+
+        for index, freelancer_seed in enumerate(seeds):
+            rng = np.random.default_rng(freelancer_seed)
+            freelancer_name, project = _draw_freelancer(index, rng)
+            rows = generate_test_timesheet_iter(
+                freelancer_name=freelancer_name,
+                project_code=project,
+                num_entries=entries_per_freelancer,
+                include_overnight=True,
+                include_trips=True,
+                seed=rng,
+            )
+            next(rows)  # Skip the per-timesheet header row
+
+            while chunk := list(islice(rows, chunk_size)):
+                writer.writerows([freelancer_name, *row] for row in chunk)
+                rows_written += len(chunk)
+
+    return rows_written
+
+
+def generate_value_grid(
+    headers: List[str],
+    num_rows: int,
+    prefix: str = "Val",
+    first_column: int = 1,
+    row_label_prefix: Optional[str] = None,
+) -> List[List[str]]:
+    """
+    Generate a header row plus a grid of ``{prefix}{row}_{column}`` strings.
+
+    Cells are formatted column-wise with NumPy string operations instead of
+    one f-string per cell, which keeps multi-thousand-row grids cheap.
+
+    Args:
+        headers: Header row (one entry per column, including the label column)
+        num_rows: Number of data rows to generate
+        prefix: Prefix of each generated cell value
+        first_column: Column number used in the first generated cell
+        row_label_prefix: If set, the first column holds ``{label}{row}``
+
+    Returns:
+        List[List[str]]: Header row followed by ``num_rows`` data rows
+
+    Example:
+        >>> generate_value_grid(["A", "B"], 2)
+        [['A', 'B'], ['Val0_1', 'Val0_2'], ['Val1_1', 'Val1_2']]
+    """
+    row_ids = np.arange(num_rows).astype(str)
+    stem = np.char.add(np.char.add(prefix, row_ids), "_")
+
+    columns = []
+    if row_label_prefix is not None:
+        columns.append(np.char.add(row_label_prefix, row_ids))
+
+    num_value_columns = len(headers) - len(columns)
+    for column in range(first_column, first_column + num_value_columns):
+        columns.append(np.char.add(stem, str(column)))
+
+    return [list(headers)] + np.stack(columns, axis=1).tolist()
 
 
 def generate_edge_case_timesheet() -> List[List[Any]]:
@@ -174,22 +622,20 @@ def generate_edge_case_timesheet() -> List[List[Any]]:
     - Zero break scenarios
     - High travel time scenarios
 
+    The rows are fixed and built once; every call returns a fresh copy, so
+    callers may modify it freely.
+
     Returns:
         List[List[Any]]: Timesheet data with edge cases
     """
-    headers = [
-        "Date",
-        "Project",
-        "Location",
-        "Start Time",
-        "End Time",
-        "Topics worked on",
-        "Break",
-        "Travel time",
-    ]
+    return [list(row) for row in _edge_case_rows()]
+
 
+@lru_cache(maxsize=None)
+def _edge_case_rows() -> Tuple[Tuple[Any, ...], ...]:
+    """Build the immutable edge case rows shared by all callers."""
     data = [
-        headers,
+        list(_TIMESHEET_HEADERS),
         # Overnight shift
         [
             "2024-12-31",
@@ -268,58 +714,48 @@ def generate_edge_case_timesheet() -> List[List[Any]]:
         ],
     ]
 
-    return data
+    return tuple(map(tuple, data))
 
 
-def generate_project_terms_data(num_projects: int = 5) -> List[List[Any]]:
+def generate_project_terms_data(
+    num_projects: int = 5, seed: Optional[Union[int, np.random.Generator]] = None
+) -> List[List[Any]]:
     """
     Generate realistic project terms data for testing.
 
+    Each column is drawn in one call on a local NumPy generator, so
+    concurrent callers do not interfere and seeded runs are reproducible.
+
     Args:
         num_projects: Number of project-freelancer combinations
+        seed: Optional random seed or NumPy generator for reproducible data
 
     Returns:
         List[List[Any]]: Project terms data with headers
     """
-    headers = [
-        "Project",
-        "Consultant_ID",
-        "Name",
-        "Rate",
-        "Cost",
-        "Share of travel as work",
-        "surcharge for travel",
-    ]
-
-    data = [headers]
-
-    project_codes = [
-        "P&C_NEWRETAIL",
-        "PROJECT_ALPHA",
-        "PROJECT_BETA",
-        "CONSULTING_GAMMA",
-    ]
-    freelancer_names = [f"Freelancer_{i + 1:03d}" for i in range(10)]
-
-    for i in range(num_projects):
-        project = random.choice(project_codes)
-        freelancer = random.choice(freelancer_names)
-        rate = random.randint(75, 120)
-        cost = int(rate * random.uniform(0.6, 0.8))
-        travel_share = random.choice([0.5, 0.75, 1.0])
-        travel_surcharge = random.choice([0.10, 0.15, 0.20])
-
-        data.append(
-            [
-                project,
-                f"C{i + 1:03d}",
-                freelancer,
-                rate,
-                cost,
-                travel_share,
-                travel_surcharge,
-            ]
+    rng = _resolve_rng(seed)
+    n = num_projects
+
+    projects = rng.choice(_PROJECT_CODES, size=n)
+    freelancers = rng.choice(_TERMS_FREELANCER_NAMES, size=n)
+    rates = rng.integers(75, 121, size=n)
+    costs = (rates * rng.uniform(0.6, 0.8, size=n)).astype(int)
+    travel_shares = rng.choice(_TRAVEL_SHARES, size=n)
+    travel_surcharges = rng.choice(_TRAVEL_SURCHARGES, size=n)
+
+    data = [list(_PROJECT_TERMS_HEADERS)]
+    data.extend(
+        [project, consultant_id, freelancer, rate, cost, share, surcharge]
+        for project, consultant_id, freelancer, rate, cost, share, surcharge in zip(
+            projects.tolist(),
+            _numbered_labels(_CONSULTANT_IDS, "C", n),
+            freelancers.tolist(),
+            rates.tolist(),
+            costs.tolist(),
+            travel_shares.tolist(),
+            travel_surcharges.tolist(),
         )
+    )
 
     return data
 
@@ -328,17 +764,9 @@ def generate_trip_terms_data() -> List[List[Any]]:
     """
     Generate trip reimbursement terms data for testing.
 
+    Every call returns a fresh copy of the constant table.
+
     Returns:
         List[List[Any]]: Trip terms data with headers
     """
-    return [
-        ["Location", "Trip Duration", "Trip Reimbursement"],
-        ["Paris On-site", "1", "450"],
-        ["Paris On-site", "2", "650"],
-        ["Paris On-site", "3", "850"],
-        ["Paris On-site", "4", "1000"],
-        ["Berlin On-site", "1", "400"],
-        ["Berlin On-site", "2", "600"],
-        ["London On-site", "1", "500"],
-        ["London On-site", "2", "700"],
-    ]
+    return [list(row) for row in _TRIP_TERMS_ROWS]
@@ -2,89 +2,167 @@
 Tests for Google API authentication module.
 """
 
-import os
-from unittest.mock import Mock, patch
-
 import pytest
 
+import src.google_auth as google_auth
 from src.google_auth import (
+    clear_credentials_cache,
     get_credentials,
     get_drive_service,
     get_sheets_service,
     load_credentials,
 )
 
+CREDENTIAL_ENV = {
+    "GOOGLE_PROJECT_ID": "test-project",
+    "GOOGLE_PRIVATE_KEY_ID": "test-key-id",
+    "GOOGLE_PRIVATE_KEY": "test-key",
+    "GOOGLE_CLIENT_EMAIL": "test@test.com",
+    "GOOGLE_CLIENT_ID": "test-client-id",
+    "GOOGLE_AUTH_URI": "https://test-auth.com",
+    "GOOGLE_TOKEN_URI": "https://test-token.com",
+    "GOOGLE_AUTH_PROVIDER_X509_CERT_URL": "https://test-cert.com",
+    "GOOGLE_CLIENT_X509_CERT_URL": "https://test-client-cert.com",
+}
+
+
+class FakeCredentials:
+    """Plain stand-in for service_account.Credentials."""
+
+    def __init__(self, info, scopes=None, subject=None):
+        self.info = info
+        self.scopes = scopes
+        self.subject = subject
+
+
+class FakeBuild:
+    """Records calls to googleapiclient's build() and returns a fixed service."""
+
+    def __init__(self):
+        self.service = object()
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.service
+
+
+@pytest.fixture(autouse=True)
+def fresh_credentials_cache():
+    """Start and end every test with no cached credentials."""
+    clear_credentials_cache()
+    yield
+    clear_credentials_cache()
+
+
+@pytest.fixture
+def no_dotenv(monkeypatch):
+    """Keep load_dotenv from reading a developer's local .env file."""
+    monkeypatch.setattr(google_auth, "load_dotenv", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def credential_env(monkeypatch, no_dotenv):
+    """Set every required credential variable."""
+    for name, value in CREDENTIAL_ENV.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.fixture
+def fake_credentials(monkeypatch):
+    """Replace credential loading with a FakeCredentials instance."""
+    credentials = FakeCredentials({"test": "credentials"})
+    monkeypatch.setattr(google_auth, "get_credentials", lambda: credentials)
+    return credentials
+
+
+@pytest.fixture
+def fake_build(monkeypatch):
+    """Replace googleapiclient's build() with a recording fake."""
+    build = FakeBuild()
+    monkeypatch.setattr(google_auth, "build", build)
+    return build
+
 
 class TestGoogleAuth:
     """Test cases for Google authentication."""
 
-    @patch("src.google_auth.load_dotenv")
-    def test_load_credentials_missing_env_var(self, mock_load_dotenv):
+    @pytest.mark.parametrize("missing", sorted(CREDENTIAL_ENV))
+    def test_load_credentials_missing_env_var(
+        self, monkeypatch, credential_env, missing
+    ):
         """Test that missing environment variables raise ValueError."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(
-                ValueError, match="Missing required environment variable"
-            ):
-                load_credentials()
-
-    @patch("src.google_auth.load_dotenv")
-    def test_load_credentials_success(self, mock_load_dotenv):
-        """Test successful credentials loading."""
-        test_env = {
-            "GOOGLE_PROJECT_ID": "test-project",
-            "GOOGLE_PRIVATE_KEY_ID": "test-key-id",
-            "GOOGLE_PRIVATE_KEY": "test-key",
-            "GOOGLE_CLIENT_EMAIL": "test@test.com",
-            "GOOGLE_CLIENT_ID": "test-client-id",
-            "GOOGLE_AUTH_URI": "https://test-auth.com",
-            "GOOGLE_TOKEN_URI": "https://test-token.com",
-            "GOOGLE_AUTH_PROVIDER_X509_CERT_URL": "https://test-cert.com",
-            "GOOGLE_CLIENT_X509_CERT_URL": "https://test-client-cert.com",
-        }
-
-        with patch.dict(os.environ, test_env):
-            credentials = load_credentials()
-            assert credentials["project_id"] == "test-project"
-            assert credentials["type"] == "service_account"
-
-    @patch("src.google_auth.service_account.Credentials.from_service_account_info")
-    @patch("src.google_auth.load_credentials")
-    def test_get_credentials(self, mock_load_credentials, mock_from_service_account):
-        """Test get_credentials function."""
-        mock_load_credentials.return_value = {"test": "credentials"}
-        mock_credentials = Mock()
-        mock_from_service_account.return_value = mock_credentials
+        monkeypatch.delenv(missing)
 
-        with patch.dict(os.environ, {"GOOGLE_SUBJECT_EMAIL": "test@test.com"}):
-            result = get_credentials()
+        with pytest.raises(
+            ValueError, match=f"Missing required environment variable: {missing}"
+        ):
+            load_credentials()
 
-        assert result == mock_credentials
-        mock_from_service_account.assert_called_once()
+    def test_load_credentials_success(self, credential_env):
+        """Test successful credentials loading."""
+        credentials = load_credentials()
 
-    @patch("src.google_auth.build")
-    @patch("src.google_auth.get_credentials")
-    def test_get_sheets_service(self, mock_get_credentials, mock_build):
-        """Test get_sheets_service function."""
-        mock_credentials = Mock()
-        mock_get_credentials.return_value = mock_credentials
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        assert credentials["project_id"] == "test-project"
+        assert credentials["type"] == "service_account"
 
+    def test_get_credentials(self, monkeypatch, credential_env):
+        """Test get_credentials function."""
+        monkeypatch.setenv("GOOGLE_SUBJECT_EMAIL", "test@test.com")
+        monkeypatch.setattr(
+            google_auth.service_account.Credentials,
+            "from_service_account_info",
+            FakeCredentials,
+        )
+
+        result = get_credentials()
+
+        assert isinstance(result, FakeCredentials)
+        assert result.info["client_email"] == "test@test.com"
+        assert result.subject == "test@test.com"
+        assert result.scopes == list(google_auth.DEFAULT_SCOPES)
+
+    def test_get_credentials_is_cached(self, monkeypatch, credential_env):
+        """Test that repeated calls build the credentials only once."""
+        built = []
+
+        def from_service_account_info(info, scopes=None, subject=None):
+            built.append(scopes)
+            return FakeCredentials(info, scopes=scopes, subject=subject)
+
+        monkeypatch.setattr(
+            google_auth.service_account.Credentials,
+            "from_service_account_info",
+            from_service_account_info,
+        )
+
+        first = get_credentials()
+        second = get_credentials()
+        drive_only = get_credentials(("https://www.googleapis.com/auth/drive",))
+        drive_only_list = get_credentials(["https://www.googleapis.com/auth/drive"])
+
+        assert first is second
+        assert drive_only is not first
+        assert drive_only_list is drive_only
+        assert built == [
+            list(google_auth.DEFAULT_SCOPES),
+            ["https://www.googleapis.com/auth/drive"],
+        ]
+
+    def test_get_sheets_service(self, fake_credentials, fake_build):
+        """Test get_sheets_service function."""
         result = get_sheets_service()
 
-        mock_build.assert_called_once_with("sheets", "v4", credentials=mock_credentials)
-        assert result == mock_service
+        assert fake_build.calls == [
+            (("sheets", "v4"), {"credentials": fake_credentials})
+        ]
+        assert result is fake_build.service
 
-    @patch("src.google_auth.build")
-    @patch("src.google_auth.get_credentials")
-    def test_get_drive_service(self, mock_get_credentials, mock_build):
+    def test_get_drive_service(self, fake_credentials, fake_build):
         """Test get_drive_service function."""
-        mock_credentials = Mock()
-        mock_get_credentials.return_value = mock_credentials
-        mock_service = Mock()
-        mock_build.return_value = mock_service
-
         result = get_drive_service()
 
-        mock_build.assert_called_once_with("drive", "v3", credentials=mock_credentials)
-        assert result == mock_service
+        assert fake_build.calls == [
+            (("drive", "v3"), {"credentials": fake_credentials})
+        ]
+        assert result is fake_build.service
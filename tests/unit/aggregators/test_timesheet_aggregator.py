@@ -13,6 +13,7 @@ import pytest
 
 from src.aggregators.timesheet_aggregator import (
     AggregatedTimesheetData,
+    EntryColumns,
     TimesheetAggregator,
 )
 from src.models.project import ProjectTerms
@@ -20,6 +21,22 @@ from src.models.timesheet import TimesheetEntry
 from src.models.trip import Trip
 
 
+def read_by_file_id(results):
+    """Build a read_timesheet side effect that answers by file ID.
+
+    Files are read concurrently, so results must not depend on call order.
+    Exceptions in ``results`` are raised instead of returned.
+    """
+
+    def read_timesheet(file_id):
+        result = results[file_id]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return read_timesheet
+
+
 @pytest.fixture
 def mock_timesheet_reader():
     """Create mock timesheet reader."""
@@ -38,11 +55,12 @@ def mock_drive_service():
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_timesheet_entries() -> List[TimesheetEntry]:
     """Create sample timesheet entries for testing.
 
     Uses dates from 2024 (previous year) to work with default filter.
+    Module-scoped: entries are immutable and tests must not modify the list.
     """
     return [
         TimesheetEntry(
@@ -78,9 +96,9 @@ def sample_timesheet_entries() -> List[TimesheetEntry]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_project_terms() -> List[ProjectTerms]:
-    """Create sample project terms for testing."""
+    """Create sample project terms for testing (module-scoped, read-only)."""
     return [
         ProjectTerms(
             freelancer_name="John Doe",
@@ -152,10 +170,12 @@ class TestAggregateTimesheets:
         ]
 
         # Mock timesheet reader to return entries
-        mock_timesheet_reader.read_timesheet.side_effect = [
-            [sample_timesheet_entries[0], sample_timesheet_entries[1]],  # John Doe
-            [sample_timesheet_entries[2]],  # Jane Smith
-        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {
+                "file1": [sample_timesheet_entries[0], sample_timesheet_entries[1]],
+                "file2": [sample_timesheet_entries[2]],  # Jane Smith
+            }
+        )
 
         # Mock project terms reader
         terms_map = {
@@ -174,6 +194,7 @@ class TestAggregateTimesheets:
         assert len(result.trips) >= 0  # Trips calculated from entries
         mock_drive_service.list_files_in_folder.assert_called_once_with(folder_id)
         assert mock_timesheet_reader.read_timesheet.call_count == 2
+        mock_project_terms_reader.get_all_project_terms.assert_called_once_with()
 
     def test_aggregate_empty_folder(self, aggregator, mock_drive_service):
         """Test aggregation from empty folder."""
@@ -231,10 +252,12 @@ class TestAggregateTimesheets:
         ]
 
         # First file succeeds, second raises exception
-        mock_timesheet_reader.read_timesheet.side_effect = [
-            [sample_timesheet_entries[0]],
-            Exception("Invalid timesheet format"),
-        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {
+                "file1": [sample_timesheet_entries[0]],
+                "file2": Exception("Invalid timesheet format"),
+            }
+        )
 
         terms_map = {("John Doe", "PROJ-001"): sample_project_terms[0]}
         mock_project_terms_reader.get_all_project_terms.return_value = terms_map
@@ -244,6 +267,49 @@ class TestAggregateTimesheets:
 
         assert len(result.entries) == 1
         assert result.entries[0].freelancer_name == "John Doe"
+        assert result.files_failed == 1
+        assert [error.file_id for error in result.errors] == ["file2"]
+
+    def test_aggregate_reads_files_concurrently_in_folder_order(
+        self,
+        aggregator,
+        mock_drive_service,
+        mock_timesheet_reader,
+        mock_project_terms_reader,
+        sample_timesheet_entries,
+        sample_project_terms,
+    ):
+        """Test that every file is read once and entries keep folder order."""
+        import threading
+
+        mock_drive_service.list_files_in_folder.return_value = [
+            {"id": "file1", "name": "John_Doe_Timesheet"},
+            {"id": "file2", "name": "Jane_Smith_Timesheet"},
+        ]
+
+        # The first read only finishes once the second has started
+        second_started = threading.Event()
+
+        def read_timesheet(file_id):
+            if file_id == "file1":
+                assert second_started.wait(timeout=5)
+                return sample_timesheet_entries[:2]
+            second_started.set()
+            return [sample_timesheet_entries[2]]
+
+        mock_timesheet_reader.read_timesheet.side_effect = read_timesheet
+        mock_project_terms_reader.get_all_project_terms.return_value = {
+            ("John Doe", "PROJ-001"): sample_project_terms[0],
+            ("Jane Smith", "PROJ-002"): sample_project_terms[1],
+        }
+
+        result = aggregator.aggregate_timesheets("test-folder")
+
+        read_ids = {
+            call.args[0] for call in mock_timesheet_reader.read_timesheet.call_args_list
+        }
+        assert read_ids == {"file1", "file2"}
+        assert result.entries == sample_timesheet_entries
 
 
 class TestFilterByDateRange:
@@ -325,10 +391,12 @@ class TestFilterByProject:
             {"id": "file1", "name": "John_Doe_Timesheet"},
             {"id": "file2", "name": "Jane_Smith_Timesheet"},
         ]
-        mock_timesheet_reader.read_timesheet.side_effect = [
-            sample_timesheet_entries[:2],  # John - PROJ-001
-            [sample_timesheet_entries[2]],  # Jane - PROJ-002
-        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {
+                "file1": sample_timesheet_entries[:2],  # John - PROJ-001
+                "file2": [sample_timesheet_entries[2]],  # Jane - PROJ-002
+            }
+        )
         terms_map = {
             ("John Doe", "PROJ-001"): sample_project_terms[0],
             ("Jane Smith", "PROJ-002"): sample_project_terms[1],
@@ -362,10 +430,12 @@ class TestFilterByFreelancer:
             {"id": "file1", "name": "John_Doe_Timesheet"},
             {"id": "file2", "name": "Jane_Smith_Timesheet"},
         ]
-        mock_timesheet_reader.read_timesheet.side_effect = [
-            sample_timesheet_entries[:2],
-            [sample_timesheet_entries[2]],
-        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {
+                "file1": sample_timesheet_entries[:2],
+                "file2": [sample_timesheet_entries[2]],
+            }
+        )
         terms_map = {
             ("John Doe", "PROJ-001"): sample_project_terms[0],
             ("Jane Smith", "PROJ-002"): sample_project_terms[1],
@@ -671,6 +741,144 @@ class TestAggregateWithDateRangeFiltering:
         assert result.entries[0].freelancer_name == "John Doe"
         assert len(result.billing_results) == 1
 
+    def test_aggregate_with_freelancer_filter_skips_unrelated_files(
+        self,
+        aggregator,
+        mock_drive_service,
+        mock_timesheet_reader,
+        mock_project_terms_reader,
+        sample_timesheet_entries,
+        sample_project_terms,
+    ):
+        """Test that only files named after the freelancer are read."""
+        mock_drive_service.list_files_in_folder.return_value = [
+            {"id": "file1", "name": "John_Doe_Timesheet"},
+            {"id": "file2", "name": "Jane_Smith_Timesheet"},
+            {"id": "file3", "name": "Max_Mustermann_Timesheet"},
+        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {"file1": sample_timesheet_entries[:2]}
+        )
+        mock_project_terms_reader.get_all_project_terms.return_value = {
+            ("John Doe", "PROJ-001"): sample_project_terms[0],
+        }
+
+        result = aggregator.aggregate_timesheets(
+            "test-folder",
+            start_date=dt.date(2024, 1, 1),
+            end_date=dt.date(2024, 12, 31),
+            freelancer_name="John Doe",
+        )
+
+        mock_timesheet_reader.read_timesheet.assert_called_once_with("file1")
+        assert result.entries == sample_timesheet_entries[:2]
+        assert result.files_processed == 1
+
+    def test_freelancer_file_match_uses_whole_words(self, caplog):
+        """Test that a name only matches whole words of a file name."""
+        files = [
+            {"id": "anna", "name": "Anna_Smith_Timesheet"},
+            {"id": "ann", "name": "Ann-Smith Timesheet 2024_06"},
+        ]
+
+        selected = TimesheetAggregator._files_for_freelancer(files, "ann smith")
+
+        assert [f["id"] for f in selected] == ["ann"]
+
+        with caplog.at_level("WARNING"):
+            fallback = TimesheetAggregator._files_for_freelancer(files, "Bob")
+
+        assert fallback == files
+        assert "falling back to reading all 2 files" in caplog.text
+
+    def test_aggregate_with_date_range_skips_files_named_for_other_months(
+        self,
+        aggregator,
+        mock_drive_service,
+        mock_timesheet_reader,
+        mock_project_terms_reader,
+        sample_timesheet_entries,
+        sample_project_terms,
+    ):
+        """Test that files named for months outside the range are not read."""
+        mock_drive_service.list_files_in_folder.return_value = [
+            {"id": "may", "name": "John_Doe_Timesheet_2024_05"},
+            {"id": "june", "name": "John_Doe_Timesheet_2024_06"},
+            {"id": "july", "name": "John_Doe_Timesheet_2024_07"},
+            {"id": "undated", "name": "Jane_Smith_Timesheet"},
+        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {
+                "june": sample_timesheet_entries[:2],
+                "undated": [sample_timesheet_entries[2]],
+            }
+        )
+        mock_project_terms_reader.get_all_project_terms.return_value = {
+            ("John Doe", "PROJ-001"): sample_project_terms[0],
+            ("Jane Smith", "PROJ-002"): sample_project_terms[1],
+        }
+
+        result = aggregator.aggregate_timesheets(
+            "test-folder",
+            start_date=dt.date(2024, 6, 1),
+            end_date=dt.date(2024, 6, 30),
+        )
+
+        read_ids = {
+            call.args[0] for call in mock_timesheet_reader.read_timesheet.call_args_list
+        }
+        assert read_ids == {"june", "undated"}
+        assert result.entries == sample_timesheet_entries
+
+    def test_aggregate_without_dates_reads_every_file(
+        self,
+        aggregator,
+        mock_drive_service,
+        mock_timesheet_reader,
+        mock_project_terms_reader,
+    ):
+        """Test that the default date window never skips files by name."""
+        mock_drive_service.list_files_in_folder.return_value = [
+            {"id": "old", "name": "John_Doe_Timesheet_2019_05"},
+            {"id": "future", "name": "John_Doe_Timesheet_2099_01"},
+        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {"old": [], "future": []}
+        )
+        mock_project_terms_reader.get_all_project_terms.return_value = {}
+
+        result = aggregator.aggregate_timesheets("test-folder")
+
+        read_ids = {
+            call.args[0] for call in mock_timesheet_reader.read_timesheet.call_args_list
+        }
+        assert read_ids == {"old", "future"}
+        assert result.files_processed == 2
+
+    def test_aggregate_with_start_date_only_keeps_later_files(
+        self,
+        aggregator,
+        mock_drive_service,
+        mock_timesheet_reader,
+        mock_project_terms_reader,
+    ):
+        """Test that an open end bound does not skip files for later months."""
+        mock_drive_service.list_files_in_folder.return_value = [
+            {"id": "may", "name": "John_Doe_Timesheet_2024_05"},
+            {"id": "later", "name": "John_Doe_Timesheet_2099_01"},
+        ]
+        mock_timesheet_reader.read_timesheet.side_effect = read_by_file_id(
+            {"later": []}
+        )
+        mock_project_terms_reader.get_all_project_terms.return_value = {}
+
+        aggregator.aggregate_timesheets("test-folder", start_date=dt.date(2024, 6, 1))
+
+        read_ids = {
+            call.args[0] for call in mock_timesheet_reader.read_timesheet.call_args_list
+        }
+        assert read_ids == {"later"}
+
     def test_aggregate_with_combined_filters(
         self,
         aggregator,
@@ -803,7 +1011,7 @@ class TestPerformanceOptimization:
         mock_drive_service.list_files_in_folder.return_value = files
 
         # Each timesheet returns 10 entries (using 2024 date for default filter)
-        mock_entries = [
+        mock_entries = tuple(
             TimesheetEntry(
                 freelancer_name=f"Freelancer {i}",
                 date=dt.date(2024, 6, 15),
@@ -815,8 +1023,11 @@ class TestPerformanceOptimization:
                 location="remote",
             )
             for i in range(10)
+        )
+        # Every read returns its own entries, like separate spreadsheets would
+        mock_timesheet_reader.read_timesheet.side_effect = lambda file_id: [
+            entry.model_copy() for entry in mock_entries
         ]
-        mock_timesheet_reader.read_timesheet.return_value = mock_entries
 
         # Setup project terms for all freelancers
         terms_map = {
@@ -828,6 +1039,11 @@ class TestPerformanceOptimization:
         result = aggregator.aggregate_timesheets(folder_id)
 
         assert len(result.entries) == 35 * 10  # 350 entries
+        # Entries from different files are distinct objects, none of them
+        # the fixture's own
+        result_ids = {id(entry) for entry in result.entries}
+        assert len(result_ids) == 35 * 10
+        assert result_ids.isdisjoint(id(entry) for entry in mock_entries)
         assert mock_timesheet_reader.read_timesheet.call_count == 35
 
 
@@ -884,3 +1100,87 @@ class TestAggregatedTimesheetData:
         assert len(data.entries) == 3
         assert len(data.billing_results) == 1
         assert len(data.trips) == 1
+
+    def test_summary_sums_minutes_per_freelancer_and_project(
+        self, sample_timesheet_entries
+    ):
+        """Test that summary totals match a per-entry sum for each group."""
+        data = AggregatedTimesheetData(
+            entries=sample_timesheet_entries, billing_results=[], trips=[]
+        )
+
+        summary = data.summary()
+
+        assert summary.to_dict("records") == [
+            {
+                "freelancer_name": "Jane Smith",
+                "project_code": "PROJ-002",
+                "work_minutes": 480,
+                "break_minutes": 60,
+                "travel_minutes": 120,
+            },
+            {
+                "freelancer_name": "John Doe",
+                "project_code": "PROJ-001",
+                "work_minutes": 960,
+                "break_minutes": 60,
+                "travel_minutes": 60,
+            },
+        ]
+        assert summary["break_minutes"].sum() == sum(
+            e.break_minutes for e in sample_timesheet_entries
+        )
+
+
+class TestEntryColumns:
+    """Test the column-wise entry view used for filtering."""
+
+    def test_from_entries_builds_parallel_arrays(self, sample_timesheet_entries):
+        """Test that each column has one element per entry, in order."""
+        columns = EntryColumns.from_entries(sample_timesheet_entries)
+
+        assert columns.dates.dtype == "datetime64[D]"
+        assert columns.dates.tolist() == [e.date for e in sample_timesheet_entries]
+        assert columns.project_codes.tolist() == [
+            e.project_code for e in sample_timesheet_entries
+        ]
+        assert columns.freelancer_names.tolist() == [
+            e.freelancer_name for e in sample_timesheet_entries
+        ]
+
+    def test_mask_combines_filters(self, sample_timesheet_entries):
+        """Test that every given filter must match."""
+        columns = EntryColumns.from_entries(sample_timesheet_entries)
+
+        mask = columns.mask(
+            start_date=dt.date(2024, 6, 15),
+            end_date=dt.date(2024, 6, 15),
+            freelancer_name="John Doe",
+        )
+
+        assert mask.tolist() == [True, False, False]
+        assert columns.mask().all()
+
+    def test_mask_unknown_category_matches_nothing(self, sample_timesheet_entries):
+        """Test that names and codes absent from the data select no entries."""
+        columns = EntryColumns.from_entries(sample_timesheet_entries)
+
+        assert list(columns.project_codes.categories) == ["PROJ-001", "PROJ-002"]
+        assert not columns.mask(project_code="PROJ-999").any()
+        assert not columns.mask(freelancer_name="Nobody").any()
+
+    def test_filters_reuse_cached_columns(self, aggregator, sample_timesheet_entries):
+        """Test that filtered data carries its columns instead of rebuilding them."""
+        data = AggregatedTimesheetData(
+            entries=sample_timesheet_entries,
+            billing_results=["r0", "r1", "r2"],
+            trips=[],
+        )
+
+        assert data.entry_columns is data.entry_columns
+
+        filtered = aggregator.filter_by_project(data, project_code="PROJ-002")
+
+        assert filtered.entries == [sample_timesheet_entries[2]]
+        assert filtered.billing_results == ["r2"]
+        assert filtered.entry_columns.project_codes.tolist() == ["PROJ-002"]
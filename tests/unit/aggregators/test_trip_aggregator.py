@@ -1,6 +1,6 @@
 """Unit tests for TripAggregator."""
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
@@ -180,6 +180,27 @@ class TestTripAggregator:
         assert len(result.reimbursements) == 1
         assert result.trips[0].start_date.month == 7
 
+    def test_filter_by_month_includes_trips_spanning_month_end(self, trip_terms):
+        """Test that a trip crossing months is found under both months."""
+        aggregator = TripAggregator()
+        spanning = Trip(
+            freelancer_name="John Doe",
+            project_code="PROJ-001",
+            location="Berlin",
+            start_date=date(2023, 6, 29),
+            end_date=date(2023, 7, 2),
+        )
+        data = aggregator.aggregate_trips([spanning], trip_terms)
+
+        june = aggregator.filter_by_month(data, year=2023, month=6)
+        july = aggregator.filter_by_month(data, year=2023, month=7)
+        august = aggregator.filter_by_month(data, year=2023, month=8)
+
+        assert june.trips == [spanning]
+        assert july.trips == [spanning]
+        assert august.trips == []
+        assert data.month_index == {(2023, 6): [0], (2023, 7): [0]}
+
     def test_filter_by_freelancer(self, sample_trips, trip_terms):
         """Test filtering aggregated data by freelancer."""
         aggregator = TripAggregator()
@@ -259,6 +280,47 @@ class TestTripAggregator:
         assert len(result.reimbursements) == 1
         assert result.reimbursements[0].reimbursement_amount == Decimal("315.00")
 
+    def test_overlapping_tiers_first_listed_wins(self):
+        """Test that the first matching tier applies, however wide the tiers."""
+        aggregator = TripAggregator()
+
+        trips = [
+            Trip(
+                freelancer_name="John",
+                project_code="PROJ",
+                location="Berlin",
+                start_date=date(2023, 6, 1),
+                end_date=date(2023, 6, 1) + timedelta(days=n),
+            )
+            for n in (0, 2, 9)
+        ]
+
+        trip_terms = [
+            {
+                "min_days": 3,
+                "max_days": 5,
+                "reimbursement_type": "Short",
+                "amount_per_day": Decimal("45.00"),
+            },
+            {
+                "min_days": 1,
+                "max_days": 1_000_000,
+                "reimbursement_type": "Default",
+                "amount_per_day": Decimal("30.00"),
+            },
+        ]
+
+        result = aggregator.aggregate_trips(trips, trip_terms)
+
+        assert [
+            (r.trip.duration_days, r.reimbursement_type, r.reimbursement_amount)
+            for r in result.reimbursements
+        ] == [
+            (1, "Default", Decimal("30.00")),
+            (3, "Short", Decimal("135.00")),
+            (10, "Default", Decimal("300.00")),
+        ]
+
     def test_multiple_freelancers_same_project(self, trip_terms):
         """Test handling multiple freelancers on same project."""
         aggregator = TripAggregator()
@@ -301,6 +363,20 @@ class TestTripAggregator:
             assert filtered.reimbursements[i].trip == trip
             assert filtered.reimbursements[i].trip.freelancer_name == "Jane Smith"
 
+    def test_filters_use_cached_indices(self, sample_trips, trip_terms):
+        """Test that repeated filters reuse one index and miss cleanly."""
+        aggregator = TripAggregator()
+        data = aggregator.aggregate_trips(sample_trips, trip_terms)
+
+        first = aggregator.filter_by_project(data, "PROJ-001")
+        index = data.project_index
+        second = aggregator.filter_by_project(data, "PROJ-001")
+
+        assert data.project_index is index
+        assert first == second
+        assert aggregator.filter_by_freelancer(data, "Nobody").trips == []
+        assert aggregator.filter_by_project(data, "PROJ-999").reimbursements == []
+
     def test_group_by_month_returns_dict(self, sample_trips, trip_terms):
         """Test grouping trips by month returns dictionary."""
         aggregator = TripAggregator()
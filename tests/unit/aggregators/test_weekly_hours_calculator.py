@@ -5,6 +5,7 @@ which generates weekly capacity and utilization reports from timesheet data.
 """
 
 import datetime as dt
+from dataclasses import replace
 from decimal import Decimal
 from typing import List
 
@@ -162,6 +163,25 @@ class TestWeeklyHoursCalculatorInit:
         assert calculator is not None
 
 
+class TestWeeklyHoursData:
+    """Test the weekly hours record."""
+
+    def test_is_slotted(self):
+        """Test that records have no __dict__ and reject unknown attributes."""
+        record = WeeklyHoursData(
+            freelancer_name="John Doe",
+            year=2023,
+            week_number=24,
+            billable_hours=Decimal("40.0"),
+            work_hours=Decimal("45.0"),
+            entries_count=5,
+        )
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.billable_hour = Decimal("0")
+
+
 class TestCalculateWeeklyHours:
     """Test calculating weekly hours from aggregated data."""
 
@@ -315,6 +335,25 @@ class TestCalculateWeeklyHours:
         assert len(result) == 1
         assert result[0].billable_hours == Decimal("7.5")
 
+    def test_sums_keep_full_decimal_precision(
+        self, calculator, sample_entries_single_week, sample_billing_results
+    ):
+        """Test that weekly totals are exact for hours finer than 0.0001."""
+        billing_results = [
+            replace(result, billable_hours=Decimal("7.123456"))
+            for result in sample_billing_results
+        ]
+        data = AggregatedTimesheetData(
+            entries=sample_entries_single_week,
+            billing_results=billing_results,
+            trips=[],
+        )
+
+        result = calculator.calculate_weekly_hours(data)
+
+        assert result[0].billable_hours == Decimal("14.246912")
+        assert result[0].entries_count == 2
+
 
 class TestGenerateWeeklyMatrix:
     """Test generating weekly matrix format."""
@@ -393,6 +432,49 @@ class TestGenerateWeeklyMatrix:
         assert matrix.loc["John Doe", "2023-W52"] == Decimal("40.0")
         assert matrix.loc["John Doe", "2024-W01"] == Decimal("32.0")
 
+    def test_generate_matrix_orders_weeks_chronologically(self, calculator):
+        """Test that week columns follow (year, week) order, not input order."""
+        weekly_data = [
+            WeeklyHoursData(
+                freelancer_name=name,
+                year=year,
+                week_number=week,
+                billable_hours=Decimal("8.0"),
+                work_hours=Decimal("8.0"),
+                entries_count=1,
+            )
+            for name, year, week in [
+                ("John Doe", 2024, 1),
+                ("Jane Smith", 2023, 52),
+                ("John Doe", 2023, 9),
+                ("Jane Smith", 2023, 10),
+            ]
+        ]
+
+        matrix = calculator.generate_weekly_matrix(weekly_data)
+
+        assert list(matrix.columns) == ["2023-W09", "2023-W10", "2023-W52", "2024-W01"]
+        assert list(matrix.index) == ["John Doe", "Jane Smith"]
+        assert pd.isna(matrix.loc["John Doe", "2023-W52"])
+
+    def test_generate_matrix_keeps_first_appearance_row_order(self, calculator):
+        """Test that rows are not sorted alphabetically."""
+        weekly_data = [
+            WeeklyHoursData(
+                freelancer_name=name,
+                year=2023,
+                week_number=week,
+                billable_hours=Decimal("8.0"),
+                work_hours=Decimal("8.0"),
+                entries_count=1,
+            )
+            for name, week in [("Zed", 24), ("Amy", 24), ("Zed", 25)]
+        ]
+
+        matrix = calculator.generate_weekly_matrix(weekly_data)
+
+        assert list(matrix.index) == ["Zed", "Amy"]
+
     def test_generate_matrix_empty_data(self, calculator):
         """Test matrix generation with empty data."""
         matrix = calculator.generate_weekly_matrix([])
@@ -455,6 +537,25 @@ class TestFilterByProject:
         assert filtered.entries[0].project_code == "PROJ-001"
         assert filtered.entries[0].freelancer_name == "John Doe"
 
+    def test_filter_by_project_keeps_billing_results_aligned(
+        self, calculator, sample_entries_multiple_weeks, sample_billing_results
+    ):
+        """Test that billing results are selected at the same positions."""
+        billing_results = sample_billing_results + [
+            replace(sample_billing_results[0], billable_hours=Decimal("7.0"))
+        ]
+        data = AggregatedTimesheetData(
+            entries=sample_entries_multiple_weeks,
+            billing_results=billing_results,
+            trips=[],
+        )
+
+        filtered = calculator.filter_by_project(data, "PROJ-002")
+
+        assert [e.freelancer_name for e in filtered.entries] == ["Jane Smith"]
+        assert filtered.billing_results == [billing_results[2]]
+        assert list(filtered.entry_columns.project_codes) == ["PROJ-002"]
+
 
 class TestFilterByDateRange:
     """Test filtering aggregated data by date range."""
@@ -521,6 +622,33 @@ class TestFilterByDateRange:
         assert len(filtered.entries) == 1
         assert filtered.entries[0].date == dt.date(2023, 6, 15)
 
+    def test_filter_by_date_range_unsorted_entries(
+        self, calculator, sample_entries_multiple_weeks, sample_billing_results
+    ):
+        """Test that entries out of date order keep their original order."""
+        entries = list(reversed(sample_entries_multiple_weeks))
+        billing_results = sample_billing_results + [sample_billing_results[0]]
+        data = AggregatedTimesheetData(
+            entries=entries, billing_results=billing_results, trips=[]
+        )
+
+        first = calculator.filter_by_date_range(
+            data, start_date=dt.date(2023, 6, 19), end_date=dt.date(2023, 6, 30)
+        )
+        second = calculator.filter_by_date_range(
+            data, start_date=dt.date(2023, 6, 1), end_date=dt.date(2023, 6, 19)
+        )
+
+        assert [e.date for e in first.entries] == [
+            dt.date(2023, 6, 26),
+            dt.date(2023, 6, 19),
+        ]
+        assert [e.date for e in second.entries] == [
+            dt.date(2023, 6, 19),
+            dt.date(2023, 6, 12),
+        ]
+        assert second.billing_results == billing_results[1:]
+
 
 class TestGetWeekRange:
     """Test getting weekly data for specific week range."""
@@ -568,6 +696,24 @@ class TestGetWeekRange:
         assert all(r.week_number >= 21 and r.week_number <= 22 for r in result)
         assert all(r.year == 2023 for r in result)
 
+    def test_get_week_range_stays_within_year(self, calculator):
+        """Test that an end week past 53 never reaches into the next year."""
+        weekly_data = [
+            WeeklyHoursData(
+                freelancer_name="John Doe",
+                year=year,
+                week_number=week,
+                billable_hours=Decimal("40.0"),
+                work_hours=Decimal("45.0"),
+                entries_count=5,
+            )
+            for year, week in [(2023, 1), (2023, 52), (2024, 1)]
+        ]
+
+        result = calculator.get_week_range(weekly_data, 2023, 1, 101)
+
+        assert [(r.year, r.week_number) for r in result] == [(2023, 1), (2023, 52)]
+
     def test_get_week_range_year_boundary(self, calculator):
         """Test week range extraction across year boundary."""
         weekly_data = [
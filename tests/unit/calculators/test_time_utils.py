@@ -10,6 +10,7 @@ from decimal import Decimal
 from src.calculators.time_utils import (
     calculate_duration_minutes,
     convert_time_to_minutes,
+    minutes_to_decimal_hours,
     minutes_to_timedelta,
     timedelta_to_decimal_hours,
 )
@@ -137,3 +138,19 @@ class TestTimedeltaToDecimalHours:
         result = timedelta_to_decimal_hours(td)
         # 10/60 = 0.166666... should round to 0.17
         assert result == Decimal("0.17")
+
+
+class TestMinutesToDecimalHours:
+    """Test converting whole minutes to decimal hours."""
+
+    def test_ten_minute_precision(self):
+        """Test that 10 minutes converts to 0.17 (rounded)."""
+        assert minutes_to_decimal_hours(10) == Decimal("0.17")
+
+    def test_matches_timedelta_conversion(self):
+        """Test that every minute count matches the timedelta conversion."""
+        for minutes in range(-24 * 60, 2 * 24 * 60 + 1):
+            expected = timedelta_to_decimal_hours(dt.timedelta(minutes=minutes))
+            result = minutes_to_decimal_hours(minutes)
+            assert result == expected
+            assert str(result) == str(expected)
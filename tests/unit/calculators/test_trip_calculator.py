@@ -495,3 +495,31 @@ class TestCalculateTrips:
         assert jane_trip.duration_days == 2
         assert jane_trip.location == "onsite"
         assert jane_trip.project_code == "PROJ-002"
+
+    def test_many_entries_grouped_in_one_pass(self):
+        """Test trip count for a long run of shuffled weekly on-site blocks."""
+        entries = []
+        for freelancer in ("John Doe", "Jane Smith"):
+            for week in range(100):
+                monday = date(2023, 1, 2) + dt.timedelta(weeks=week)
+                # Five on-site weekdays per week; the weekend gap splits trips
+                for offset in range(5):
+                    entries.append(
+                        TimesheetEntry(
+                            freelancer_name=freelancer,
+                            date=monday + dt.timedelta(days=offset),
+                            project_code="PROJ-001",
+                            start_time=dt.time(9, 0),
+                            end_time=dt.time(17, 0),
+                            break_minutes=30,
+                            travel_time_minutes=0,
+                            location="onsite",
+                        )
+                    )
+        entries.reverse()
+
+        result = calculate_trips(entries)
+
+        assert len(entries) == 1000
+        assert len(result) == 200
+        assert all(trip.duration_days == 5 for trip in result)
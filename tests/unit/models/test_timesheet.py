@@ -1,5 +1,6 @@
 """Unit tests for Timesheet model."""
 
+import sys
 from datetime import date, time
 
 import pytest
@@ -70,6 +71,46 @@ class TestTimesheetModel:
         assert entry.location == "onsite"
         assert entry.travel_time_minutes == 120
 
+    def test_timesheet_is_immutable_and_hashable(self):
+        """Test that entries cannot be changed in place and can be hashed."""
+        from src.models.timesheet import TimesheetEntry
+
+        entry = TimesheetEntry(
+            freelancer_name="John Doe",
+            date=date(2023, 6, 15),
+            project_code="PROJ-001",
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            break_minutes=30,
+            travel_time_minutes=0,
+            location="remote",
+        )
+
+        with pytest.raises(ValidationError):
+            entry.location = "onsite"
+
+        moved = entry.model_copy(update={"date": date(2023, 6, 16)})
+        assert moved.date == date(2023, 6, 16)
+        assert len({entry, moved, entry.model_copy()}) == 2
+
+    def test_lookup_key_strings_are_interned(self):
+        """Test that name and project code are interned after stripping."""
+        from src.models.timesheet import TimesheetEntry
+
+        entry = TimesheetEntry(
+            freelancer_name=" ".join(["John", "Doe "]),
+            date=date(2023, 6, 15),
+            project_code="".join(["PROJ-", "001"]),
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            break_minutes=0,
+            travel_time_minutes=0,
+            location="remote",
+        )
+
+        assert entry.freelancer_name is sys.intern("John Doe")
+        assert entry.project_code is sys.intern("PROJ-001")
+
     def test_invalid_location_raises_error(self):
         """Test that invalid location values raise validation error."""
         from src.models.timesheet import TimesheetEntry
@@ -1,5 +1,6 @@
 """Unit tests for Trip and TripReimbursement models."""
 
+import sys
 from datetime import date
 from decimal import Decimal
 
@@ -29,6 +30,21 @@ class TestTripModel:
         assert trip.end_date == date(2023, 6, 5)
         assert trip.duration_days == 5
 
+    def test_name_and_project_are_interned(self):
+        """Test that string fields are interned after stripping."""
+        from src.models.trip import Trip
+
+        trip = Trip(
+            freelancer_name=" ".join(["John", "Doe "]),
+            project_code="".join(["PROJ-", "001"]),
+            location="Berlin",
+            start_date=date(2023, 6, 1),
+            end_date=date(2023, 6, 5),
+        )
+
+        assert trip.freelancer_name is sys.intern("John Doe")
+        assert trip.project_code is sys.intern("PROJ-001")
+
     def test_single_day_trip(self):
         """Test that single-day trip has duration of 1."""
         from src.models.trip import Trip
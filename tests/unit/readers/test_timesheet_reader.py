@@ -226,6 +226,31 @@ class TestTimesheetReader:
         assert entry is not None
         assert entry.notes is None
 
+    def test_parse_row_fast_path_matches_validated_entry(
+        self, timesheet_reader, mock_sheets_service
+    ):
+        """Test fast path builds the same entry without running validation."""
+        row = {
+            "Date": "2023-06-15",
+            "Project": "PROJ-001",
+            "Location": "On-site",
+            "Start Time": "09:00",
+            "End Time": "17:00",
+            "Topics worked on": "Development work",
+            "Break": "00:30",
+            "Travel time": "01:00",
+        }
+        fast_reader = TimesheetReader(mock_sheets_service, fast_path=True)
+
+        fast_entry = fast_reader._parse_row(row, "John Doe")
+        assert fast_entry == timesheet_reader._parse_row(row, "John Doe")
+
+        # Model rules are not enforced: a break longer than the work time
+        # is rejected by the validated path but kept by the fast path
+        row["Break"] = "09:00"
+        assert timesheet_reader._parse_row(row, "John Doe") is None
+        assert fast_reader._parse_row(row, "John Doe").break_minutes == 540
+
     def test_parse_row_empty_row_returns_none(self, timesheet_reader):
         """Test parsing empty row returns None."""
         row = {
@@ -2,10 +2,13 @@
 Unit tests for Google Drive service.
 """
 
+import threading
 from unittest.mock import Mock, patch
 
+import httplib2
 import pytest
 from googleapiclient.errors import HttpError
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
 
 from src.services.google_drive_service import GoogleDriveService
 from src.services.retry_handler import RetryHandler
@@ -67,9 +70,26 @@ class TestGoogleDriveService:
                     scopes=["https://www.googleapis.com/auth/drive"]
                 )
                 mock_build.assert_called_once_with(
-                    "drive", "v3", credentials=mock_credentials
+                    "drive", "v3", credentials=mock_credentials, static_discovery=True
                 )
 
+    def test_service_initialization_with_shared_http(self, mock_retry_handler):
+        """Test a shared HTTP transport is wrapped and passed to build."""
+        shared_http = Mock()
+
+        with patch("src.services.google_drive_service.build") as mock_build:
+            with patch("google.auth.default") as mock_auth:
+                mock_credentials = Mock()
+                mock_auth.return_value = (mock_credentials, "test-project")
+
+                GoogleDriveService(retry_handler=mock_retry_handler, http=shared_http)
+
+                _, kwargs = mock_build.call_args
+                assert kwargs["cache_discovery"] is False
+                assert kwargs["static_discovery"] is True
+                assert kwargs["http"].http is shared_http
+                assert kwargs["http"].credentials is mock_credentials
+
     def test_list_files_in_folder_success(self, drive_service, mock_drive_client):
         """Test successful listing of files in a folder."""
         mock_response = {
@@ -143,6 +163,28 @@ class TestGoogleDriveService:
         query = call_args[1]["q"]
         assert "mimeType=" in query
 
+    def test_list_files_with_query_filter_and_fields(
+        self, drive_service, mock_drive_client
+    ):
+        """Test that extra query clauses and field masks are sent to the API."""
+        mock_drive_client.files().list().execute.return_value = {
+            "files": [{"id": "file1", "name": "Old Test File"}]
+        }
+
+        result = drive_service.list_files_in_folder(
+            "test-folder-id",
+            query_filter="modifiedTime < '2024-01-01T00:00:00Z'",
+            fields="nextPageToken, files(id, name)",
+        )
+
+        assert result == [{"id": "file1", "name": "Old Test File"}]
+        call_args = mock_drive_client.files().list.call_args
+        assert call_args[1]["q"] == (
+            "'test-folder-id' in parents and trashed=false "
+            "and (modifiedTime < '2024-01-01T00:00:00Z')"
+        )
+        assert call_args[1]["fields"] == "nextPageToken, files(id, name)"
+
     def test_get_file_metadata_success(self, drive_service, mock_drive_client):
         """Test successful retrieval of file metadata."""
         mock_response = {
@@ -281,6 +323,96 @@ class TestGoogleDriveService:
         query = call_args[1]["q"]
         assert "modifiedTime >" in query
 
+    def test_batch_trash_files(self, drive_service, mock_drive_client):
+        """Test trashing files in batches of at most BATCH_SIZE calls."""
+        file_ids = [f"file{i}" for i in range(150)]
+        batches = []
+
+        def new_batch(callback):
+            batch = Mock()
+            batch.requests = []
+            batch.add.side_effect = lambda request, request_id: batch.requests.append(
+                request_id
+            )
+
+            def execute():
+                for request_id in batch.requests:
+                    if request_id == "file7":
+                        callback(request_id, None, HttpError(Mock(status=404), b""))
+                    else:
+                        callback(request_id, {"id": request_id}, None)
+
+            batch.execute.side_effect = execute
+            batches.append(batch)
+            return batch
+
+        mock_drive_client.new_batch_http_request.side_effect = new_batch
+
+        trashed = drive_service.batch_trash_files(file_ids)
+
+        assert trashed == 149
+        assert [len(batch.requests) for batch in batches] == [100, 50]
+        mock_drive_client.files().update.assert_called_with(
+            fileId="file149", body={"trashed": True}, fields="id, trashed"
+        )
+
+    def test_trash_file_uses_per_thread_http(self, drive_service, mock_drive_client):
+        """Test that trash requests from different threads use separate transports."""
+        drive_service.trash_file("file1")
+        drive_service.trash_file("file2")
+
+        worker = threading.Thread(target=drive_service.trash_file, args=("file3",))
+        worker.start()
+        worker.join()
+
+        update = mock_drive_client.files().update
+        update.assert_called_with(
+            fileId="file3", body={"trashed": True}, fields="id, trashed"
+        )
+
+        transports = [call.kwargs["http"] for call in update().execute.call_args_list]
+        assert len(transports) == 3
+        assert transports[0] is transports[1]
+        assert transports[2] is not transports[0]
+
+    def test_trash_file_default_transport_has_timeout(
+        self, drive_service, mock_drive_client
+    ):
+        """Test that concurrent trashes without an injected Http time out."""
+        worker = threading.Thread(target=drive_service.trash_file, args=("file1",))
+        worker.start()
+        worker.join()
+
+        transport = mock_drive_client.files().update().execute.call_args.kwargs["http"]
+        assert transport.http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+        assert 308 not in transport.http.redirect_codes
+
+    def test_trash_file_transport_copies_shared_http_settings(
+        self, mock_drive_client, mock_retry_handler
+    ):
+        """Test that trash requests keep the injected Http's timeout."""
+        shared_http = httplib2.Http(timeout=60)
+
+        with patch("src.services.google_drive_service.build") as mock_build:
+            with patch("google.auth.default") as mock_auth:
+                mock_auth.return_value = (Mock(), "test-project")
+                mock_build.return_value = mock_drive_client
+
+                service = GoogleDriveService(
+                    retry_handler=mock_retry_handler, http=shared_http
+                )
+
+        service.trash_file("file1")
+
+        transport = mock_drive_client.files().update().execute.call_args.kwargs["http"]
+        assert transport.http is not shared_http
+        assert transport.http.timeout == 60
+
+    def test_batch_trash_files_empty(self, drive_service, mock_drive_client):
+        """Test that no batch request is sent for an empty list."""
+        assert drive_service.batch_trash_files([]) == 0
+        mock_drive_client.new_batch_http_request.assert_not_called()
+
 
 class TestGoogleDriveServiceIntegration:
     """Integration tests for GoogleDriveService."""
@@ -460,6 +592,20 @@ class TestGoogleDriveServiceCaching:
         # API should only be called once due to caching
         assert mock_drive_client.files().get().execute.call_count == 1
 
+    def test_partial_metadata_bypasses_cache(self, drive_service, mock_drive_client):
+        """Test that field-masked metadata is always fetched and never cached."""
+        get = mock_drive_client.files().get
+        get().execute.return_value = {"trashed": True}
+
+        assert drive_service.get_file_metadata("file123", fields="trashed") == {
+            "trashed": True
+        }
+        drive_service.get_file_metadata("file123", fields="trashed")
+
+        get.assert_called_with(fileId="file123", fields="trashed")
+        assert get().execute.call_count == 2
+        assert "file123" not in drive_service._metadata_cache
+
     def test_folder_listing_caching(self, drive_service, mock_drive_client):
         """Test that folder listings are cached for performance."""
         mock_response = {"files": [{"id": "file1", "name": "File1.xlsx"}]}
@@ -4,9 +4,11 @@ Unit tests for Google Sheets service.
 
 from unittest.mock import Mock, patch
 
+import httplib2
 import pandas as pd
 import pytest
 from googleapiclient.errors import HttpError
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
 
 from src.services.google_sheets_service import GoogleSheetsService
 from src.services.retry_handler import RetryHandler
@@ -73,9 +75,26 @@ class TestGoogleSheetsService:
                     ]
                 )
                 mock_build.assert_called_once_with(
-                    "sheets", "v4", credentials=mock_credentials
+                    "sheets", "v4", credentials=mock_credentials, static_discovery=True
                 )
 
+    def test_service_initialization_with_shared_http(self, mock_retry_handler):
+        """Test a shared HTTP transport is wrapped and passed to build."""
+        shared_http = Mock()
+
+        with patch("src.services.google_sheets_service.build") as mock_build:
+            with patch("google.auth.default") as mock_auth:
+                mock_credentials = Mock()
+                mock_auth.return_value = (mock_credentials, "test-project")
+
+                GoogleSheetsService(retry_handler=mock_retry_handler, http=shared_http)
+
+                _, kwargs = mock_build.call_args
+                assert kwargs["cache_discovery"] is False
+                assert kwargs["static_discovery"] is True
+                assert kwargs["http"].http is shared_http
+                assert kwargs["http"].credentials is mock_credentials
+
     def test_read_sheet_success(self, sheets_service, mock_sheets_client):
         """Test successful sheet reading."""
         # Setup mock response
@@ -202,6 +221,26 @@ class TestGoogleSheetsService:
         assert len(results) == 2
         assert all(isinstance(df, pd.DataFrame) for df in results)
 
+    def test_batch_read_sheet_data(self, sheets_service, mock_sheets_client):
+        """Test batch reading raw values keyed by requested range."""
+        mock_response = {
+            "valueRanges": [
+                {"range": "Sheet1!A1:B2", "values": [["A1", "B1"], ["A2", "B2"]]},
+                {"range": "Sheet1!D1:E2"},
+            ]
+        }
+        mock_sheets_client.spreadsheets().values().batchGet().execute.return_value = (
+            mock_response
+        )
+
+        ranges = ["Sheet1!A1:B2", "Sheet1!D1:E2"]
+        results = sheets_service.batch_read_sheet_data("test-sheet-id", ranges)
+
+        assert results == {
+            "Sheet1!A1:B2": [["A1", "B1"], ["A2", "B2"]],
+            "Sheet1!D1:E2": [],
+        }
+
     def test_get_sheet_metadata(self, sheets_service, mock_sheets_client):
         """Test retrieving sheet metadata."""
         mock_response = {
@@ -217,6 +256,63 @@ class TestGoogleSheetsService:
         assert len(metadata["sheets"]) == 2
         assert metadata["sheets"][0]["properties"]["title"] == "Sheet1"
 
+    def test_reads_use_per_thread_http(self, sheets_service, mock_sheets_client):
+        """Test that reads from different threads use separate transports."""
+        import threading
+
+        get = mock_sheets_client.spreadsheets().values().get
+        get().execute.return_value = {"values": []}
+
+        sheets_service.read_sheet("test-sheet-id", "Sheet1!A1:C10")
+        sheets_service.read_sheet("test-sheet-id", "Sheet2!A1:C10")
+
+        worker = threading.Thread(
+            target=sheets_service.read_sheet, args=("test-sheet-id", "Sheet3!A1:C10")
+        )
+        worker.start()
+        worker.join()
+
+        transports = [call.kwargs["http"] for call in get().execute.call_args_list]
+        assert len(transports) == 3
+        assert transports[0] is transports[1]
+        assert transports[2] is not transports[0]
+
+    def test_default_read_transport_has_timeout(
+        self, sheets_service, mock_sheets_client
+    ):
+        """Test that reads without an injected Http still time out."""
+        get = mock_sheets_client.spreadsheets().values().get
+        get().execute.return_value = {"values": []}
+
+        sheets_service.read_sheet("test-sheet-id", "Sheet1!A1:C10")
+
+        transport = get().execute.call_args.kwargs["http"]
+        assert transport.http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+
+    def test_per_thread_http_copies_shared_http_settings(
+        self, mock_sheets_client, mock_retry_handler
+    ):
+        """Test that read transports keep the injected Http's timeout."""
+        shared_http = httplib2.Http(timeout=60)
+
+        with patch("src.services.google_sheets_service.build") as mock_build:
+            with patch("google.auth.default") as mock_auth:
+                mock_auth.return_value = (Mock(), "test-project")
+                mock_build.return_value = mock_sheets_client
+
+                service = GoogleSheetsService(
+                    retry_handler=mock_retry_handler, http=shared_http
+                )
+
+        get = mock_sheets_client.spreadsheets().values().get
+        get().execute.return_value = {"values": []}
+
+        service.read_sheet("test-sheet-id", "Sheet1!A1:C10")
+
+        transport = get().execute.call_args.kwargs["http"]
+        assert transport.http is not shared_http
+        assert transport.http.timeout == 60
+
     def test_clear_sheet_range(self, sheets_service, mock_sheets_client):
         """Test clearing a sheet range."""
         mock_response = {"clearedRange": "Sheet1!A1:C10"}
@@ -243,6 +339,80 @@ class TestGoogleSheetsService:
 
         assert result["replies"][0]["addSheet"]["properties"]["title"] == "NewSheet"
 
+    def test_create_sheets_single_batch_update(
+        self, sheets_service, mock_sheets_client
+    ):
+        """Test creating several sheets sends one batchUpdate request."""
+        mock_sheets_client.spreadsheets().batchUpdate().execute.return_value = {
+            "replies": [{}, {}]
+        }
+
+        result = sheets_service.create_sheets("test-sheet-id", ["Tab1", "Tab2"])
+
+        assert len(result["replies"]) == 2
+        _, kwargs = mock_sheets_client.spreadsheets().batchUpdate.call_args
+        titles = [
+            request["addSheet"]["properties"]["title"]
+            for request in kwargs["body"]["requests"]
+        ]
+        assert titles == ["Tab1", "Tab2"]
+
+    def test_requests_are_rate_limited(self, sheets_service, mock_sheets_client):
+        """Test reads and writes draw from their own rate limiters."""
+        sheets_service.read_limiter = Mock()
+        sheets_service.write_limiter = Mock()
+        mock_sheets_client.spreadsheets().values().get().execute.return_value = {}
+
+        sheets_service.read_sheet("test-sheet-id", "Sheet1!A1:C10")
+        sheets_service.append_sheet_row("test-sheet-id", "Sheet1!A1", [["x"]])
+
+        sheets_service.read_limiter.acquire.assert_called_once_with()
+        sheets_service.write_limiter.acquire.assert_called_once_with()
+
+    def test_update_sheet_data_chunked(self, sheets_service, mock_sheets_client):
+        """Test large writes are split into ordered append requests."""
+        mock_append = mock_sheets_client.spreadsheets().values().append
+        mock_append.return_value.execute.return_value = {"updates": {}}
+        mock_append.reset_mock()
+        rows = [[f"Val{i}"] for i in range(5)]
+
+        results = sheets_service.update_sheet_data_chunked(
+            "test-sheet-id", "Sheet1!A1", rows, chunk_size=2
+        )
+
+        assert len(results) == 3
+        bodies = [call.kwargs["body"]["values"] for call in mock_append.call_args_list]
+        assert bodies == [rows[0:2], rows[2:4], rows[4:5]]
+        assert all(
+            call.kwargs["valueInputOption"] == "RAW"
+            for call in mock_append.call_args_list
+        )
+
+    def test_update_sheet_data_chunked_invalid_chunk_size(self, sheets_service):
+        """Test a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError):
+            sheets_service.update_sheet_data_chunked(
+                "test-sheet-id", "Sheet1!A1", [["x"]], chunk_size=0
+            )
+
+    def test_append_sheet_row(self, sheets_service, mock_sheets_client):
+        """Test appending only the new rows."""
+        mock_response = {"updates": {"updatedRows": 1}}
+        mock_sheets_client.spreadsheets().values().append().execute.return_value = (
+            mock_response
+        )
+
+        row = ["2024-10-08", "NEW_PROJECT", "Off-site", "09:00", "17:00"]
+        result = sheets_service.append_sheet_row("test-sheet-id", "Sheet1!A1", [row])
+
+        assert result["updates"]["updatedRows"] == 1
+        mock_sheets_client.spreadsheets().values().append.assert_called_with(
+            spreadsheetId="test-sheet-id",
+            range="Sheet1!A1",
+            valueInputOption="USER_ENTERED",
+            body={"values": [row]},
+        )
+
 
 class TestGoogleSheetsServiceIntegration:
     """Integration tests for GoogleSheetsService."""
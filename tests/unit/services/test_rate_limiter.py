@@ -0,0 +1,76 @@
+"""
+Unit tests for the token-bucket rate limiter.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.services.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    def test_invalid_rate_raises(self):
+        """Test that non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+    def test_acquire_more_than_capacity_raises(self):
+        """Test that a request larger than the bucket fails instead of hanging."""
+        limiter = RateLimiter(rate=5, period=60.0, capacity=3)
+
+        with patch("src.services.rate_limiter.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError, match="capacity 3"):
+                limiter.acquire(4)
+
+        mock_sleep.assert_not_called()
+
+    def test_acquire_under_quota_does_not_sleep(self):
+        """Test that acquiring within capacity returns immediately."""
+        limiter = RateLimiter(rate=5, period=60.0)
+
+        with patch("src.services.rate_limiter.time.sleep") as mock_sleep:
+            waited = [limiter.acquire() for _ in range(5)]
+
+        mock_sleep.assert_not_called()
+        assert waited == [0.0] * 5
+
+    def test_acquire_waits_when_bucket_empty(self):
+        """Test that an empty bucket sleeps until a token is refilled."""
+        clock = [100.0]
+        with patch(
+            "src.services.rate_limiter.time.monotonic", side_effect=lambda: clock[0]
+        ):
+            limiter = RateLimiter(rate=2, period=60.0)
+            limiter.acquire()
+            limiter.acquire()
+
+            def fake_sleep(seconds):
+                clock[0] += seconds
+
+            with patch(
+                "src.services.rate_limiter.time.sleep", side_effect=fake_sleep
+            ) as mock_sleep:
+                waited = limiter.acquire()
+
+        # One token refills every 30 seconds at 2 requests per minute
+        mock_sleep.assert_called_once_with(pytest.approx(30.0))
+        assert waited == pytest.approx(30.0)
+
+    def test_tokens_refill_up_to_capacity(self):
+        """Test that idle time never accumulates more than capacity tokens."""
+        clock = [0.0]
+        with patch(
+            "src.services.rate_limiter.time.monotonic", side_effect=lambda: clock[0]
+        ):
+            limiter = RateLimiter(rate=3, period=1.0)
+            clock[0] += 1000.0
+
+            with patch("src.services.rate_limiter.time.sleep") as mock_sleep:
+                for _ in range(3):
+                    limiter.acquire()
+                mock_sleep.assert_not_called()
+
+            assert limiter._tokens == pytest.approx(0.0)
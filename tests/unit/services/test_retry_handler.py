@@ -122,35 +122,31 @@ class TestRetryHandler:
             with pytest.raises(RetryExhaustedException):
                 retry_handler.execute_with_retry(mock_func)
 
-        # Check that delays follow exponential backoff pattern
+        # Full jitter: each delay lies below an exponentially growing ceiling
         assert len(delays) == 3  # max_retries attempts
-        # Allow for jitter which can reduce delay by up to 10%
-        assert delays[0] >= 0.09  # base_delay (0.1) with jitter
-        assert delays[1] >= 0.18  # exponential increase (0.2) with jitter
-        assert delays[2] >= 0.36  # exponential increase (0.4) with jitter
-        # Check increasing pattern (allowing for jitter)
-        assert delays[1] > delays[0] * 1.5  # Should roughly double
-        assert delays[2] > delays[1] * 1.5  # Should roughly double
+        for attempt, delay in enumerate(delays):
+            assert 0 <= delay <= 0.1 * 2**attempt
 
     def test_jitter_applied_to_delays(self, retry_handler):
         """Test that jitter is applied to backoff delays."""
         delays = []
 
+        rng = Mock()
+        rng.uniform.return_value = 0.05  # Fixed jitter for testing
+        handler = RetryHandler(max_retries=3, base_delay=0.1, rng=rng)
+
         with patch("time.sleep") as mock_sleep:
             mock_sleep.side_effect = lambda delay: delays.append(delay)
-            with patch("secrets.SystemRandom") as mock_system_random:
-                mock_uniform = Mock(return_value=0.05)  # Fixed jitter for testing
-                mock_system_random.return_value.uniform = mock_uniform
 
-                mock_func = Mock()
-                server_error = HttpError(resp=Mock(status=500), content=b"Server Error")
-                mock_func.side_effect = [server_error, "success"]
+            mock_func = Mock()
+            server_error = HttpError(resp=Mock(status=500), content=b"Server Error")
+            mock_func.side_effect = [server_error, "success"]
 
-                retry_handler.execute_with_retry(mock_func)
+            handler.execute_with_retry(mock_func)
 
-        # Jitter should be applied
-        mock_uniform.assert_called()
-        assert len(delays) == 1
+        # Jitter should be drawn between zero and the backoff ceiling
+        rng.uniform.assert_called_once_with(0, 0.1)
+        assert delays == [0.05]
 
     def test_max_delay_cap(self):
         """Test that delays are capped at max_delay."""
@@ -172,8 +168,8 @@ class TestRetryHandler:
             with pytest.raises(RetryExhaustedException):
                 handler.execute_with_retry(mock_func)
 
-        # All delays should be capped at max_delay plus jitter (10%)
-        assert all(delay <= 2.2 for delay in delays)  # max_delay (2.0) + 10% jitter
+        # All delays should be capped at max_delay
+        assert all(0 <= delay <= 2.0 for delay in delays)
 
     def test_retry_exhausted_exception(self, retry_handler):
         """Test RetryExhaustedException after max retries."""
@@ -223,7 +219,7 @@ class TestRetryHandler:
         assert retry_handler._circuit_breaker_open is True
 
         # Simulate timeout passage
-        with patch("time.time") as mock_time:
+        with patch("time.monotonic") as mock_time:
             mock_time.return_value = retry_handler._circuit_breaker_opened_at + 3.0
 
             # Should allow one test call (half-open state)
@@ -248,7 +244,7 @@ class TestRetryHandler:
                 pass
 
         # Simulate timeout and successful recovery
-        with patch("time.time") as mock_time:
+        with patch("time.monotonic") as mock_time:
             mock_time.return_value = retry_handler._circuit_breaker_opened_at + 3.0
             mock_func.side_effect = None
             mock_func.return_value = "success"
@@ -259,6 +255,29 @@ class TestRetryHandler:
             assert retry_handler._circuit_breaker_open is False
             assert retry_handler._failure_count == 0
 
+    def test_circuit_breaker_half_open_allows_single_trial(self):
+        """Test that only one trial call passes while half-open."""
+        handler = RetryHandler(
+            max_retries=0, circuit_breaker_threshold=2, circuit_breaker_timeout=30.0
+        )
+        server_error = HttpError(resp=Mock(status=503), content=b"Unavailable")
+
+        with patch("time.monotonic", return_value=100.0):
+            for _ in range(2):
+                with pytest.raises(RetryExhaustedException):
+                    handler.execute_with_retry(Mock(side_effect=server_error))
+
+        with patch("time.monotonic", return_value=131.0):
+
+            def trial():
+                # A second caller arriving during the trial is rejected
+                with pytest.raises(CircuitBreakerError):
+                    handler.execute_with_retry(Mock())
+                return "success"
+
+            assert handler.execute_with_retry(trial) == "success"
+            assert handler.get_circuit_breaker_state() == "closed"
+
     def test_custom_retry_conditions(self):
         """Test custom retry condition function."""
 
@@ -586,4 +605,37 @@ class TestRetryHandlerErrorScenarios:
         assert mock_func.call_count == 2
         # Should use exponential backoff (base_delay = 0.1)
         assert len(delays) == 1
-        assert 0.09 <= delays[0] <= 0.11  # base_delay with jitter
+        assert 0 <= delays[0] <= 0.1  # full jitter below base_delay
+
+    def test_retry_after_header_lowercase(self, retry_handler):
+        """Test Retry-After is honored regardless of header name case."""
+        mock_func = Mock()
+        rate_limit_error = HttpError(
+            resp=Mock(status=429, headers={"retry-after": "0.5"}),
+            content=b'{"error": {"code": 429, "message": "Rate limit exceeded"}}',
+        )
+        mock_func.side_effect = [rate_limit_error, "success"]
+
+        with patch("time.sleep") as mock_sleep:
+            result = retry_handler.execute_with_retry(mock_func)
+
+        assert result == "success"
+        # Never earlier than the server asked, at most jitter_factor later
+        (delay,), _ = mock_sleep.call_args
+        assert 0.5 <= delay <= 0.55
+
+    def test_retry_after_from_httplib2_response(self):
+        """Test Retry-After is read from a real httplib2 response."""
+        import httplib2
+
+        handler = RetryHandler(max_retries=3, base_delay=0.1, max_delay=10.0)
+        resp = httplib2.Response({"status": 429, "retry-after": "2"})
+        rate_limit_error = HttpError(resp=resp, content=b"Rate limit exceeded")
+
+        mock_func = Mock(side_effect=[rate_limit_error, "success"])
+
+        with patch("time.sleep") as mock_sleep:
+            handler.execute_with_retry(mock_func)
+
+        (delay,), _ = mock_sleep.call_args
+        assert delay >= 2
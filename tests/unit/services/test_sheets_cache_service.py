@@ -338,8 +338,11 @@ class TestCacheInvalidation:
 class TestBatchOperations:
     """Test batch read operations."""
 
-    def test_batch_read_sheets_cached(self, cache_service):
+    def test_batch_read_sheets_cached(self, cache_service, mock_sheets_service):
         """Test batch reading with caching."""
+        mock_sheets_service.batch_read_sheets.side_effect = lambda sid, ranges: [
+            pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]}) for _ in ranges
+        ]
         requests = [
             ("sheet1", "Sheet1!A1:D10"),
             ("sheet2", "Sheet1!A1:D10"),
@@ -355,6 +358,34 @@ class TestBatchOperations:
         # Verify cache populated
         assert len(cache_service._memory_cache) == 3
 
+    def test_batch_read_groups_misses_per_spreadsheet(
+        self, cache_service, mock_sheets_service
+    ):
+        """Test misses of one spreadsheet are fetched in a single call."""
+        mock_sheets_service.batch_read_sheets.side_effect = lambda sid, ranges: [
+            pd.DataFrame({"range": [range_name]}) for range_name in ranges
+        ]
+        cache_service.read_sheet_cached("sheet1", "Sheet1!A1:B2")
+
+        results = cache_service.batch_read_sheets_cached(
+            [
+                ("sheet1", "Sheet1!A1:B2"),
+                ("sheet1", "Sheet1!D1:E2"),
+                ("sheet1", "Sheet2!A1:B2"),
+            ]
+        )
+
+        # Cached range is served from memory, the rest in one batchGet
+        mock_sheets_service.batch_read_sheets.assert_called_once_with(
+            "sheet1", ["Sheet1!D1:E2", "Sheet2!A1:B2"]
+        )
+        assert results[1]["range"].tolist() == ["Sheet1!D1:E2"]
+        assert results[2]["range"].tolist() == ["Sheet2!A1:B2"]
+
+        # Each batched range is cached under its own key
+        cache_service.read_sheet_cached("sheet1", "Sheet1!D1:E2")
+        assert mock_sheets_service.read_sheet.call_count == 1
+
 
 class TestCacheStatistics:
     """Test cache statistics tracking."""
@@ -448,6 +479,100 @@ class TestThreadSafety:
         # Verify results
         assert len(results) == 10
 
+    def test_different_ranges_fetch_in_parallel(
+        self, cache_service, mock_sheets_service
+    ):
+        """Test that API reads of different ranges are not serialized."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def read_sheet(spreadsheet_id, range_name):
+            # Both reads must be inside the API call at the same time
+            barrier.wait()
+            return pd.DataFrame({"A": [1]})
+
+        mock_sheets_service.read_sheet.side_effect = read_sheet
+        errors = []
+
+        def read_cache(spreadsheet_id):
+            try:
+                cache_service.read_sheet_cached(spreadsheet_id, "Sheet1!A1:D10")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=read_cache, args=(spreadsheet_id,))
+            for spreadsheet_id in ("sheet1", "sheet2")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert mock_sheets_service.read_sheet.call_count == 2
+
+    def test_batch_fetch_does_not_block_single_reads(
+        self, cache_service, mock_sheets_service
+    ):
+        """Test that a batch fetch runs without holding the cache lock."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def batch_read_sheets(spreadsheet_id, range_names):
+            # A single-range read must get through while the batch is fetching
+            barrier.wait()
+            return [pd.DataFrame({"A": [1]}) for _ in range_names]
+
+        def read_sheet(spreadsheet_id, range_name):
+            barrier.wait()
+            return pd.DataFrame({"A": [2]})
+
+        mock_sheets_service.batch_read_sheets.side_effect = batch_read_sheets
+        mock_sheets_service.read_sheet.side_effect = read_sheet
+        errors = []
+
+        def run(func, *args):
+            try:
+                func(*args)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(
+                target=run,
+                args=(
+                    cache_service.batch_read_sheets_cached,
+                    [("sheet1", "Sheet1!A1:B2")],
+                ),
+            ),
+            threading.Thread(
+                target=run,
+                args=(cache_service.read_sheet_cached, "sheet2", "Sheet1!A1:B2"),
+            ),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert cache_service._stats["api_calls"] == 2
+
+    def test_same_range_fetched_once(self, cache_service, mock_sheets_service):
+        """Test that concurrent reads of one range share a single API call."""
+        threads = [
+            threading.Thread(
+                target=cache_service.read_sheet_cached,
+                args=("sheet1", "Sheet1!A1:D10"),
+            )
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mock_sheets_service.read_sheet.call_count == 1
+
 
 class TestErrorHandling:
     """Test error handling in cache operations."""
@@ -0,0 +1,71 @@
+"""
+Unit tests for per-thread HTTP transports.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import httplib2
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
+
+from src.services.thread_local_http import ThreadLocalHttp, clone_http
+
+
+class TestCloneHttp:
+    """Test cases for clone_http."""
+
+    def test_clone_without_template(self):
+        """Test that a missing template gives googleapiclient's default Http."""
+        http = clone_http(None)
+
+        assert isinstance(http, httplib2.Http)
+        assert http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+        assert 308 not in http.redirect_codes
+
+    def test_clone_copies_connection_settings(self):
+        """Test that timeout, proxy, CA bundle and certificates are copied."""
+        # 3 is socks.PROXY_TYPE_HTTP; PySocks is an optional dependency
+        proxy_info = httplib2.ProxyInfo(3, "proxy.local", 3128)
+        template = httplib2.Http(
+            timeout=60, proxy_info=proxy_info, ca_certs="/tmp/ca.pem"
+        )
+        template.add_certificate("key.pem", "cert.pem", "example.com")
+        template.redirect_codes = template.redirect_codes - {308}
+
+        http = clone_http(template)
+
+        assert http is not template
+        assert http.timeout == 60
+        assert http.proxy_info is proxy_info
+        assert http.ca_certs == "/tmp/ca.pem"
+        assert http.certificates is template.certificates
+        assert http.redirect_codes == template.redirect_codes
+        assert http.connections == {}
+
+
+class TestThreadLocalHttp:
+    """Test cases for ThreadLocalHttp."""
+
+    def test_same_thread_reuses_transport(self):
+        """Test that one thread always gets the same transport."""
+        transports = ThreadLocalHttp(Mock())
+
+        assert transports.get() is transports.get()
+
+    def test_threads_get_separate_transports_with_template_settings(self):
+        """Test that each thread gets its own transport copied from the template."""
+        credentials = Mock()
+        template = httplib2.Http(timeout=60)
+        transports = ThreadLocalHttp(credentials, template)
+        seen = []
+
+        worker = threading.Thread(target=lambda: seen.append(transports.get()))
+        worker.start()
+        worker.join()
+        main = transports.get()
+
+        assert seen[0] is not main
+        for authed_http in (main, seen[0]):
+            assert authed_http.credentials is credentials
+            assert authed_http.http is not template
+            assert authed_http.http.timeout == 60